@@ -0,0 +1,248 @@
+"""
+Benchmark de la API
+===================
+
+Recorre todas las rutas registradas en api/urls.py (listados, detalles y
+acciones de cada ViewSet, la raíz del router y los endpoints JWT), mide la
+latencia de cada una y cuenta sus consultas SQL.
+
+Cada ruta declara en QUERY_BUDGETS la cantidad máxima de consultas que
+puede ejecutar. Los presupuestos no dependen del tamaño de los datos: si un
+serializer vuelve a consultar por cada fila (N+1), la ruta los excede con
+cualquier dataset de tamaño realista y el benchmark falla.
+
+Uso: python manage.py benchmark_api (ver api/management/commands).
+"""
+
+import statistics
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from events.models import MatchEvent
+from matches.models import Match
+from teams.models import Player, Team
+from tournaments.models import Phase, Tournament
+
+# Consultas máximas por ruta (nombre de la URL)
+QUERY_BUDGETS = {
+    "api-root": 0,
+    "token_obtain_pair": 2,
+    "token_refresh": 1,
+    # Torneos
+    "tournament-list": 1,
+    "tournament-detail": 1,
+    "tournament-categories": 2,
+    "tournament-current": 2,
+    "tournamentcategory-list": 1,
+    "tournamentcategory-detail": 1,
+    "tournamentcategory-teams": 2,
+    "phase-list": 1,
+    "phase-detail": 1,
+    "phase-bracket": 4,
+    "round-list": 1,
+    "round-detail": 1,
+    # Equipos
+    "team-list": 1,
+    "team-detail": 1,
+    "team-players": 2,
+    "team-with-players": 2,
+    "team-by-tournament": 1,
+    "player-list": 1,
+    "player-detail": 1,
+    "player-by-team": 1,
+    "player-by-position": 1,
+    # Partidos
+    "match-list": 3,
+    "match-detail": 3,
+    "match-details": 3,
+    "match-by-date": 3,
+    "match-by-status": 3,
+    "matchteam-list": 1,
+    "matchteam-detail": 1,
+    "matchteam-by-team": 1,
+    # Eventos
+    "matchevent-list": 1,
+    "matchevent-detail": 1,
+    "matchevent-by-player": 1,
+    "matchevent-by-match": 1,
+    # Usuarios
+    "user-list": 2,
+    "user-detail": 2,
+}
+
+# Parámetros obligatorios de las acciones (se completan con datos de muestra)
+ACTION_PARAMS = {
+    "team-by-tournament": ["tournament_id"],
+    "player-by-team": ["team_id"],
+    "player-by-position": ["position"],
+    "match-by-date": ["date"],
+    "match-by-status": ["status"],
+    "matchteam-by-team": ["team_id"],
+    "matchevent-by-player": ["player_id"],
+    "matchevent-by-match": ["match_id"],
+}
+
+
+def sample_values(user):
+    """IDs y valores de muestra para detalles y parámetros de acciones"""
+    match = (
+        Match.objects.filter(status="finished").order_by("id").first()
+        or Match.objects.order_by("id").first()
+    )
+    event = MatchEvent.objects.order_by("id").first()
+    tournament = Tournament.objects.order_by("id").last()
+    return {
+        "tournament_id": tournament and tournament.id,
+        "team_id": Team.objects.order_by("id").values_list("id", flat=True).first(),
+        "player_id": event.player_id if event else None,
+        "match_id": match and match.id,
+        "date": match and match.date.isoformat(),
+        "status": match and match.status,
+        "position": "DEF",
+        "user_id": user.id,
+    }
+
+
+def detail_pk(viewset, samples):
+    """Objeto usado para las rutas de detalle de un ViewSet"""
+    model = viewset.queryset.model
+    if model is Phase:
+        # Las eliminatorias permiten medir también el cuadro
+        phase = Phase.objects.filter(phase_type="knockout").order_by("id").first()
+        if phase is not None:
+            return phase.pk
+    if model is Match and samples["match_id"]:
+        return samples["match_id"]
+    if model is Player and samples["player_id"]:
+        return samples["player_id"]
+    if model.__name__ == "User":
+        return samples["user_id"]
+    return model.objects.order_by("pk").values_list("pk", flat=True).first()
+
+
+def api_routes(router, samples):
+    """
+    Rutas GET del router: (nombre, url, parámetros)
+
+    Incluye listado y detalle de cada ViewSet y todas sus acciones extra.
+    """
+    routes = [("api-root", reverse("api-root"), {})]
+    for _, viewset, basename in router.registry:
+        pk = detail_pk(viewset, samples)
+
+        routes.append((f"{basename}-list", reverse(f"{basename}-list"), {}))
+        if pk is not None:
+            routes.append(
+                (f"{basename}-detail", reverse(f"{basename}-detail", args=[pk]), {})
+            )
+
+        for extra_action in viewset.get_extra_actions():
+            if "get" not in extra_action.mapping:
+                continue
+            name = f"{basename}-{extra_action.url_name}"
+            if extra_action.detail:
+                if pk is None:
+                    continue
+                url = reverse(name, args=[pk])
+            else:
+                url = reverse(name)
+            params = {key: samples[key] for key in ACTION_PARAMS.get(name, [])}
+            routes.append((name, url, params))
+    return routes
+
+
+def measure(request, iterations):
+    """
+    Ejecuta `request` varias veces
+
+    Returns:
+        Tupla (status, latencias en ms, máximo de consultas)
+    """
+    timings = []
+    max_queries = 0
+    status_code = None
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = request()
+            timings.append((time.perf_counter() - started) * 1000)
+        status_code = response.status_code
+        max_queries = max(max_queries, len(queries.captured_queries))
+    return status_code, timings, max_queries
+
+
+def percentile(timings, value):
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[value - 1]
+
+
+def benchmark_host():
+    """Host aceptado por ALLOWED_HOSTS para las peticiones del cliente de prueba"""
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+    return "testserver"
+
+
+def run_benchmark(router, user, password, iterations=10, warmup=1):
+    """
+    Mide todas las rutas de la API autenticado como `user`
+
+    Returns:
+        Lista de dicts por ruta: name, url, status, queries, budget,
+        p50, p95, max (ms) y ok
+    """
+    host = benchmark_host()
+    client = APIClient(HTTP_HOST=host)
+    client.force_authenticate(user=user)
+    samples = sample_values(user)
+
+    requests = [
+        (name, url, lambda url=url, params=params: client.get(url, params))
+        for name, url, params in api_routes(router, samples)
+    ]
+
+    # Endpoints JWT (sin force_authenticate: validan credenciales)
+    token_client = APIClient(HTTP_HOST=host)
+    token_url = reverse("token_obtain_pair")
+    credentials = {"username": user.get_username(), "password": password}
+    refresh = token_client.post(token_url, credentials).data.get("refresh")
+    requests += [
+        (
+            "token_obtain_pair",
+            token_url,
+            lambda: token_client.post(token_url, credentials),
+        ),
+        (
+            "token_refresh",
+            reverse("token_refresh"),
+            lambda: token_client.post(reverse("token_refresh"), {"refresh": refresh}),
+        ),
+    ]
+
+    results = []
+    for name, url, request in requests:
+        for _ in range(warmup):
+            request()
+        status_code, timings, queries = measure(request, iterations)
+        budget = QUERY_BUDGETS.get(name)
+        results.append(
+            {
+                "name": name,
+                "url": url,
+                "status": status_code,
+                "queries": queries,
+                "budget": budget,
+                "p50": percentile(timings, 50),
+                "p95": percentile(timings, 95),
+                "max": max(timings),
+                "ok": status_code < 400 and budget is not None and queries <= budget,
+            }
+        )
+    return results
@@ -0,0 +1 @@
+# Filters module
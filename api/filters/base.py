@@ -0,0 +1,15 @@
+from rest_framework import filters
+
+from project.search import full_text_filter
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """SearchFilter que usa el índice FTS5 cuando el modelo lo tiene"""
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if terms:
+            filtered = full_text_filter(queryset, " ".join(terms))
+            if filtered is not None:
+                return filtered
+        return super().filter_queryset(request, queryset, view)
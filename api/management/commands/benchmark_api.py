@@ -0,0 +1,108 @@
+"""
+Comando para medir la API
+=========================
+
+Genera un torneo sintético, recorre todas las rutas de la API y reporta
+latencias (p50/p95/máx) y consultas SQL por ruta. Falla si alguna ruta
+excede su presupuesto de consultas (api/benchmarks.py), responde con error
+o no tiene presupuesto declarado.
+
+Todo se ejecuta dentro de una transacción que se revierte al final: la base
+de datos queda como estaba.
+
+Uso:
+    python manage.py benchmark_api
+    python manage.py benchmark_api --scale 10 --iterations 20
+    python manage.py benchmark_api --existing-data --json resultados.json
+"""
+
+import json
+import secrets
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.benchmarks import run_benchmark
+from api.urls import router
+
+
+class Command(BaseCommand):
+    help = "Mide latencia y consultas SQL de cada ruta de la API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Escala del torneo sintético (default: 1)",
+        )
+        parser.add_argument(
+            "--existing-data",
+            action="store_true",
+            help="Usa los datos existentes en lugar de generar un torneo",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Ejecuciones medidas por ruta (default: 10)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            help="Guarda los resultados en un archivo JSON",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if not options["existing_data"]:
+                call_command(
+                    "generate_sample_tournament",
+                    scale=options["scale"],
+                    stdout=self.stdout,
+                )
+
+            password = secrets.token_urlsafe(16)
+            user = User.objects.create_superuser(
+                username=f"benchmark-{secrets.token_hex(4)}", password=password
+            )
+            results = run_benchmark(
+                router, user, password, iterations=max(options["iterations"], 1)
+            )
+
+            # No deja datos generados ni el usuario del benchmark
+            transaction.set_rollback(True)
+
+        self.print_results(results)
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as output:
+                json.dump(results, output, indent=2)
+
+        failed = [result for result in results if not result["ok"]]
+        if failed:
+            raise CommandError(
+                f"{len(failed)} rutas fuera de presupuesto o con error: "
+                + ", ".join(result["name"] for result in failed)
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(results)} rutas dentro del presupuesto")
+        )
+
+    def print_results(self, results):
+        self.stdout.write(
+            f"{'ruta':<28} {'status':>6} {'consultas':>10} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'máx ms':>8}"
+        )
+        for result in results:
+            budget = "-" if result["budget"] is None else result["budget"]
+            line = (
+                f"{result['name']:<28} {result['status']:>6} "
+                f"{result['queries']:>5}/{budget:<4} "
+                f"{result['p50']:>8.1f} {result['p95']:>8.1f} {result['max']:>8.1f}"
+            )
+            style = self.style.SUCCESS if result["ok"] else self.style.ERROR
+            self.stdout.write(style(line))
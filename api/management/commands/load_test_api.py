@@ -0,0 +1,191 @@
+"""
+Comando de prueba de carga
+==========================
+
+Compara servidores ya levantados (por ejemplo gunicorn con workers sync
+sobre project/wsgi.py y gunicorn con uvicorn sobre project/asgi.py, ver
+project/gunicorn_asgi.py) con la misma carga: N clientes concurrentes
+pidiendo las rutas indicadas durante un tiempo fijo, con keep-alive.
+
+Reporta por servidor: requests por segundo, errores y latencias p50/p95/p99.
+Obtiene un token JWT de cada servidor con el usuario indicado.
+
+Uso:
+    python manage.py load_test_api --username admin --password secreto \\
+        --target wsgi=http://127.0.0.1:8000 --target asgi=http://127.0.0.1:8001
+    python manage.py load_test_api ... --concurrency 50 --duration 30 \\
+        --path "/api/events/by_match/?match_id=12"
+"""
+
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.benchmarks import percentile
+
+
+class Command(BaseCommand):
+    help = "Prueba de carga de las lecturas de la API contra uno o más servidores"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            action="append",
+            required=True,
+            help="Servidor a medir como nombre=url, repetible",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            help="Ruta a pedir, repetible (default: partidos de hoy y finalizados)",
+        )
+        parser.add_argument("--username", required=True, help="Usuario de la API")
+        parser.add_argument("--password", required=True, help="Contraseña")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="Clientes concurrentes (default: 20)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=10,
+            help="Segundos de carga por servidor (default: 10)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            help="Guarda los resultados en un archivo JSON",
+        )
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options["target"]:
+            name, separator, url = target.partition("=")
+            if not separator or not url.startswith(("http://", "https://")):
+                raise CommandError(f"--target inválido: {target!r} (nombre=url)")
+            targets.append((name, url.rstrip("/")))
+
+        paths = options["path"] or [
+            f"/api/matches/by_date/?date={timezone.localdate().isoformat()}",
+            "/api/matches/by_status/?status=finished",
+        ]
+
+        results = []
+        for name, url in targets:
+            token = self.obtain_token(url, options["username"], options["password"])
+            self.stdout.write(f"{name}: {options['duration']:.0f}s de carga...")
+            results.append(
+                {
+                    "target": name,
+                    "url": url,
+                    **self.run_load(
+                        url,
+                        paths,
+                        token,
+                        options["concurrency"],
+                        options["duration"],
+                    ),
+                }
+            )
+
+        self.print_results(results)
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as output:
+                json.dump(results, output, indent=2)
+
+    def connect(self, url):
+        parts = urlsplit(url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return connection_class(parts.netloc, timeout=30)
+
+    def obtain_token(self, url, username, password):
+        connection = self.connect(url)
+        try:
+            connection.request(
+                "POST",
+                "/api/auth/token/",
+                body=json.dumps({"username": username, "password": password}),
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except OSError as e:
+            raise CommandError(f"No se pudo conectar a {url}: {e}")
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise CommandError(f"{url}: no se obtuvo el token ({response.status})")
+        return json.loads(body)["access"]
+
+    def run_load(self, url, paths, token, concurrency, duration):
+        headers = {"Authorization": f"Bearer {token}"}
+        deadline = time.perf_counter() + duration
+        timings = []
+        errors = []
+        lock = threading.Lock()
+
+        def client(index):
+            connection = self.connect(url)
+            local_timings, local_errors = [], 0
+            request = index
+            while time.perf_counter() < deadline:
+                path = paths[request % len(paths)]
+                request += 1
+                started = time.perf_counter()
+                try:
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status >= 400:
+                        local_errors += 1
+                except (OSError, http.client.HTTPException):
+                    local_errors += 1
+                    connection.close()
+                    connection = self.connect(url)
+                    continue
+                local_timings.append((time.perf_counter() - started) * 1000)
+            connection.close()
+            with lock:
+                timings.extend(local_timings)
+                errors.append(local_errors)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(client, range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        if not timings:
+            raise CommandError(f"{url}: ningún request respondió")
+        return {
+            "requests": len(timings),
+            "errors": sum(errors),
+            "rps": len(timings) / elapsed,
+            "p50": percentile(timings, 50),
+            "p95": percentile(timings, 95),
+            "p99": percentile(timings, 99),
+        }
+
+    def print_results(self, results):
+        self.stdout.write(
+            f"\n{'servidor':<12} {'requests':>9} {'errores':>8} {'req/s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['target']:<12} {result['requests']:>9} "
+                f"{result['errors']:>8} {result['rps']:>8.1f} "
+                f"{result['p50']:>8.1f} {result['p95']:>8.1f} {result['p99']:>8.1f}"
+            )
@@ -55,19 +55,9 @@ class TournamentCategorySerializer(serializers.ModelSerializer):
             "tournament_name",
             "category_name",
             "description",
-            "start_date",
-            "end_date",
         ]
         read_only_fields = ["id"]
 
-    def validate(self, data):
-        """Validar fechas y unicidad"""
-        if data["start_date"] > data["end_date"]:
-            raise serializers.ValidationError(
-                "La fecha de inicio debe ser anterior a la fecha de fin"
-            )
-        return data
-
 
 class PhaseSerializer(serializers.ModelSerializer):
     """Serializer para el modelo Phase"""
@@ -140,7 +130,14 @@ class TeamSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "player_count"]
 
     def get_player_count(self, obj):
-        """Obtener el número de jugadores del equipo"""
+        """
+        Obtener el número de jugadores del equipo
+
+        Usa la anotación player_count del queryset si existe (sin consulta
+        extra por equipo)
+        """
+        if hasattr(obj, "player_count"):
+            return obj.player_count
         return obj.players.count()
 
 
@@ -165,9 +162,9 @@ class PlayerSerializer(serializers.ModelSerializer):
             "position",
             "jersey_number",
             "dni",
-            "telefono",
+            "phone_number",
             "promo",
-            "oficio",
+            "profession",
         ]
         read_only_fields = ["id", "team_name", "full_name", "age"]
 
@@ -239,6 +236,7 @@ class MatchSerializer(serializers.ModelSerializer):
             "round_name",
             "date",
             "time",
+            "field",
             "status",
             "tournament_category_name",
             "match_display",
@@ -251,13 +249,16 @@ class MatchSerializer(serializers.ModelSerializer):
         ]
 
     def get_match_display(self, obj):
-        """Obtener la representación del partido"""
-        teams = obj.match_teams.all()
-        if teams.count() == 2:
-            home_team = teams.first()
-            away_team = teams.last()
-            if home_team and away_team:
-                return f"{home_team.team.name} vs {away_team.team.name}"
+        """
+        Obtener la representación del partido
+
+        Ordena en memoria para aprovechar el prefetch de match_teams (el
+        local es el MatchTeam de menor id)
+        """
+        teams = sorted(obj.match_teams.all(), key=lambda match_team: match_team.id)
+        if len(teams) == 2:
+            home_team, away_team = teams
+            return f"{home_team.team.name} vs {away_team.team.name}"
         return f"Match {obj.id}"
 
 
@@ -20,8 +20,12 @@ Endpoints disponibles:
 Autenticación:
 - JWT Token requerido para todos los endpoints
 - Permisos por grupo de usuario (CRUD_Users, ReadOnly_Users)
+
+Con ASGI_SERVER=True las acciones matches/by_date, matches/by_status y
+events/by_match se atienden con vistas async (api/viewsets/asynchronous.py).
 """
 
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import (
@@ -29,6 +33,11 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from api.viewsets.asynchronous import (
+    event_by_match,
+    match_by_date,
+    match_by_status,
+)
 from api.viewsets.base import (
     MatchEventViewSet,
     MatchTeamViewSet,
@@ -58,7 +67,17 @@ router.register(r"events", MatchEventViewSet, basename="matchevent")
 router.register(r"users", UserViewSet, basename="user")
 
 # URLs de la API
-urlpatterns = [
+urlpatterns = []
+
+if settings.ASGI_SERVER:
+    # Antes del router: reemplazan a las acciones síncronas con el mismo nombre
+    urlpatterns += [
+        path("matches/by_date/", match_by_date, name="match-by-date"),
+        path("matches/by_status/", match_by_status, name="match-by-status"),
+        path("events/by_match/", event_by_match, name="matchevent-by-match"),
+    ]
+
+urlpatterns += [
     # URLs del router (todos los endpoints CRUD)
     path("", include(router.urls)),
     # URLs de autenticación JWT
@@ -0,0 +1,91 @@
+"""
+Acciones Asíncronas de la API
+=============================
+
+Versiones async de las lecturas más consultadas durante una jornada:
+
+- /api/matches/by_date/?date=
+- /api/matches/by_status/?status=
+- /api/events/by_match/?match_id=
+
+Con ASGI_SERVER=True (perfil ASGI, ver project/gunicorn_asgi.py) api/urls.py
+las registra antes que el router y reemplazan a las acciones de
+MatchViewSet y MatchEventViewSet en las mismas URLs y con los mismos nombres.
+Las consultas usan el ORM async de Django: mientras esperan a la base de
+datos el worker sigue atendiendo otros requests en lugar de bloquearse.
+
+Autenticación, permisos, serializers y respuestas son los del ViewSet: la
+autenticación JWT y los permisos (que consultan la base) corren con
+sync_to_async; la serialización no consulta porque el queryset del ViewSet
+ya trae todo con select_related/prefetch_related. El render también corre
+con sync_to_async: el de la API navegable sí consulta.
+"""
+
+from asgiref.sync import sync_to_async
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.response import Response
+
+from .base import MatchEventViewSet, MatchViewSet
+
+
+async def run_read_action(viewset_class, action, request, param, lookup):
+    """
+    Ejecuta una acción de lectura del ViewSet filtrando por un parámetro
+
+    Args:
+        viewset_class: ViewSet cuya configuración se usa
+        action: Nombre de la acción (para permisos y logs)
+        request: HttpRequest de Django
+        param: Parámetro obligatorio de la query string
+        lookup: Campo del queryset a filtrar con el valor del parámetro
+    """
+    view = viewset_class(action=action, action_map={"get": action})
+    view.args, view.kwargs = (), {}
+    view.format_kwarg = None
+    drf_request = view.initialize_request(request)
+    view.request = drf_request
+    view.headers = view.default_response_headers
+
+    try:
+        if request.method != "GET":
+            raise MethodNotAllowed(request.method)
+        await sync_to_async(view.initial)(drf_request)
+
+        value = drf_request.query_params.get(param)
+        if value:
+            queryset = view.get_queryset().filter(**{lookup: value})
+            objects = [obj async for obj in queryset]
+            response = Response(view.get_serializer(objects, many=True).data)
+        else:
+            response = Response(
+                {"error": f"{param} es requerido"}, status=status.HTTP_400_BAD_REQUEST
+            )
+    except Exception as exc:
+        response = view.handle_exception(exc)
+
+    response = view.finalize_response(drf_request, response)
+    # La API navegable (text/html) consulta la base al renderizar (formularios,
+    # filtros): se renderiza fuera del event loop
+    return await sync_to_async(response.render)()
+
+
+@csrf_exempt
+async def match_by_date(request):
+    """Partidos de una fecha (MatchViewSet.by_date)"""
+    return await run_read_action(MatchViewSet, "by_date", request, "date", "date")
+
+
+@csrf_exempt
+async def match_by_status(request):
+    """Partidos por estado (MatchViewSet.by_status)"""
+    return await run_read_action(MatchViewSet, "by_status", request, "status", "status")
+
+
+@csrf_exempt
+async def event_by_match(request):
+    """Eventos de un partido (MatchEventViewSet.by_match)"""
+    return await run_read_action(
+        MatchEventViewSet, "by_match", request, "match_id", "match_team__match_id"
+    )
@@ -14,12 +14,14 @@ Funcionalidades:
 """
 
 from django.contrib.auth.models import User
+from django.db.models import Count
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from api.filters.base import FullTextSearchFilter
 from api.permissions.base import IsAdminOrCRUDUser, IsCRUDOrReadOnlyUser
 from api.serializers.base import (
     MatchEventSerializer,
@@ -38,6 +40,7 @@ from api.serializers.base import (
 from events.models import MatchEvent
 from matches.models import Match, MatchTeam
 from teams.models import Player, Team
+from tournaments.brackets import get_bracket
 from tournaments.models import Phase, Round, Tournament, TournamentCategory
 
 # =============================================================================
@@ -65,7 +68,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
     def categories(self, request, pk=None):
         """Obtener todas las categorías de un torneo"""
         tournament = self.get_object()
-        categories = tournament.categories.all()
+        categories = tournament.categories.select_related("tournament")
         serializer = TournamentCategorySerializer(categories, many=True)
         return Response(serializer.data)
 
@@ -90,7 +93,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
 class TournamentCategoryViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo TournamentCategory"""
 
-    queryset = TournamentCategory.objects.all()
+    queryset = TournamentCategory.objects.select_related("tournament")
     serializer_class = TournamentCategorySerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -98,16 +101,18 @@ class TournamentCategoryViewSet(viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["tournament", "start_date", "end_date"]
+    filterset_fields = ["tournament"]
     search_fields = ["category_name", "description", "tournament__name"]
-    ordering_fields = ["category_name", "start_date", "end_date"]
+    ordering_fields = ["category_name"]
     ordering = ["tournament", "category_name"]
 
     @action(detail=True, methods=["get"])
     def teams(self, request, pk=None):
         """Obtener todos los equipos de una categoría"""
         category = self.get_object()
-        teams = category.teams.all()
+        teams = category.teams.select_related(
+            "tournament_category__tournament"
+        ).annotate(player_count=Count("players"))
         serializer = TeamSerializer(teams, many=True)
         return Response(serializer.data)
 
@@ -115,7 +120,7 @@ class TournamentCategoryViewSet(viewsets.ModelViewSet):
 class PhaseViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo Phase"""
 
-    queryset = Phase.objects.all()
+    queryset = Phase.objects.select_related("tournament_category")
     serializer_class = PhaseSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -128,11 +133,22 @@ class PhaseViewSet(viewsets.ModelViewSet):
     ordering_fields = ["phase_name", "id"]
     ordering = ["tournament_category", "id"]
 
+    @action(detail=True, methods=["get"])
+    def bracket(self, request, pk=None):
+        """Obtener el cuadro eliminatorio de una fase"""
+        phase = self.get_object()
+        if phase.phase_type != "knockout":
+            return Response(
+                {"message": "La fase no es eliminatoria"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(get_bracket(phase))
+
 
 class RoundViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo Round"""
 
-    queryset = Round.objects.all()
+    queryset = Round.objects.select_related("phase__tournament_category")
     serializer_class = RoundSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -154,7 +170,9 @@ class RoundViewSet(viewsets.ModelViewSet):
 class TeamViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo Team"""
 
-    queryset = Team.objects.all()
+    queryset = Team.objects.select_related("tournament_category__tournament").annotate(
+        player_count=Count("players")
+    )
     serializer_class = TeamSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -171,7 +189,7 @@ class TeamViewSet(viewsets.ModelViewSet):
     def players(self, request, pk=None):
         """Obtener todos los jugadores de un equipo"""
         team = self.get_object()
-        players = team.players.all()
+        players = team.players.select_related("team")
         serializer = PlayerSerializer(players, many=True)
         return Response(serializer.data)
 
@@ -187,7 +205,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         """Obtener equipos filtrados por torneo"""
         tournament_id = request.query_params.get("tournament_id")
         if tournament_id:
-            teams = Team.objects.filter(
+            teams = self.get_queryset().filter(
                 tournament_category__tournament_id=tournament_id
             )
             serializer = self.get_serializer(teams, many=True)
@@ -200,19 +218,19 @@ class TeamViewSet(viewsets.ModelViewSet):
 class PlayerViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo Player"""
 
-    queryset = Player.objects.all()
+    queryset = Player.objects.select_related("team")
     serializer_class = PlayerSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        FullTextSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_fields = [
         "team",
         "position",
         "promo",
-        "oficio",
+        "profession",
         "team__tournament_category",
     ]
     search_fields = [
@@ -220,8 +238,8 @@ class PlayerViewSet(viewsets.ModelViewSet):
         "last_name",
         "dni",
         "jersey_number",
-        "telefono",
-        "oficio",
+        "phone_number",
+        "profession",
     ]
     ordering_fields = ["first_name", "last_name", "jersey_number", "birth_date"]
     ordering = ["team", "jersey_number"]
@@ -231,7 +249,7 @@ class PlayerViewSet(viewsets.ModelViewSet):
         """Obtener jugadores filtrados por equipo"""
         team_id = request.query_params.get("team_id")
         if team_id:
-            players = Player.objects.filter(team_id=team_id)
+            players = self.get_queryset().filter(team_id=team_id)
             serializer = self.get_serializer(players, many=True)
             return Response(serializer.data)
         return Response(
@@ -243,7 +261,7 @@ class PlayerViewSet(viewsets.ModelViewSet):
         """Obtener jugadores filtrados por posición"""
         position = request.query_params.get("position")
         if position:
-            players = Player.objects.filter(position=position)
+            players = self.get_queryset().filter(position=position)
             serializer = self.get_serializer(players, many=True)
             return Response(serializer.data)
         return Response(
@@ -259,7 +277,9 @@ class PlayerViewSet(viewsets.ModelViewSet):
 class MatchViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo Match"""
 
-    queryset = Match.objects.all()
+    queryset = Match.objects.select_related(
+        "round__phase__tournament_category"
+    ).prefetch_related("match_teams__team")
     serializer_class = MatchSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -267,7 +287,13 @@ class MatchViewSet(viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["round", "status", "date", "round__phase__tournament_category"]
+    filterset_fields = [
+        "round",
+        "status",
+        "date",
+        "field",
+        "round__phase__tournament_category",
+    ]
     search_fields = ["round__round_name", "match_teams__team__name"]
     ordering_fields = ["date", "time", "status"]
     ordering = ["date", "time"]
@@ -284,7 +310,7 @@ class MatchViewSet(viewsets.ModelViewSet):
         """Obtener partidos filtrados por fecha"""
         date = request.query_params.get("date")
         if date:
-            matches = Match.objects.filter(date=date)
+            matches = self.get_queryset().filter(date=date)
             serializer = self.get_serializer(matches, many=True)
             return Response(serializer.data)
         return Response(
@@ -294,9 +320,9 @@ class MatchViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def by_status(self, request):
         """Obtener partidos filtrados por estado"""
-        status = request.query_params.get("status")
-        if status:
-            matches = Match.objects.filter(status=status)
+        match_status = request.query_params.get("status")
+        if match_status:
+            matches = self.get_queryset().filter(status=match_status)
             serializer = self.get_serializer(matches, many=True)
             return Response(serializer.data)
         return Response(
@@ -307,7 +333,7 @@ class MatchViewSet(viewsets.ModelViewSet):
 class MatchTeamViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo MatchTeam"""
 
-    queryset = MatchTeam.objects.all()
+    queryset = MatchTeam.objects.select_related("team", "match__round")
     serializer_class = MatchTeamSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -325,7 +351,7 @@ class MatchTeamViewSet(viewsets.ModelViewSet):
         """Obtener partidos de un equipo específico"""
         team_id = request.query_params.get("team_id")
         if team_id:
-            match_teams = MatchTeam.objects.filter(team_id=team_id)
+            match_teams = self.get_queryset().filter(team_id=team_id)
             serializer = self.get_serializer(match_teams, many=True)
             return Response(serializer.data)
         return Response(
@@ -341,7 +367,9 @@ class MatchTeamViewSet(viewsets.ModelViewSet):
 class MatchEventViewSet(viewsets.ModelViewSet):
     """ViewSet para el modelo MatchEvent"""
 
-    queryset = MatchEvent.objects.all()
+    queryset = MatchEvent.objects.select_related(
+        "player", "match_team__team", "match_team__match__round"
+    )
     serializer_class = MatchEventSerializer
     permission_classes = [IsCRUDOrReadOnlyUser]
     filter_backends = [
@@ -359,7 +387,7 @@ class MatchEventViewSet(viewsets.ModelViewSet):
         """Obtener eventos de un jugador específico"""
         player_id = request.query_params.get("player_id")
         if player_id:
-            events = MatchEvent.objects.filter(player_id=player_id)
+            events = self.get_queryset().filter(player_id=player_id)
             serializer = self.get_serializer(events, many=True)
             return Response(serializer.data)
         return Response(
@@ -371,7 +399,7 @@ class MatchEventViewSet(viewsets.ModelViewSet):
         """Obtener eventos de un partido específico"""
         match_id = request.query_params.get("match_id")
         if match_id:
-            events = MatchEvent.objects.filter(match_team__match_id=match_id)
+            events = self.get_queryset().filter(match_team__match_id=match_id)
             serializer = self.get_serializer(events, many=True)
             return Response(serializer.data)
         return Response(
@@ -387,7 +415,7 @@ class MatchEventViewSet(viewsets.ModelViewSet):
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet de solo lectura para el modelo User"""
 
-    queryset = User.objects.all()
+    queryset = User.objects.prefetch_related("groups")
     serializer_class = UserSerializer
     permission_classes = [IsAdminOrCRUDUser]
     filter_backends = [
@@ -25,6 +25,10 @@ Notas:
 from django.contrib import admin
 from django.utils.html import format_html
 
+from matches.models import MatchTeam
+from project.admin import scope_autocomplete, select_related_filter
+from teams.models import Player
+
 from .models import MatchEvent
 
 
@@ -56,12 +60,17 @@ class MatchEventAdmin(admin.ModelAdmin):
     """
 
     list_display = ["event_display", "player", "event_type", "match_info"]
-    list_filter = ["event_type", "match_team__match__date", "match_team__team"]
+    list_filter = [
+        "event_type",
+        "match_team__match__date",
+        ("match_team__team", select_related_filter("tournament_category")),
+    ]
     search_fields = [
         "player__first_name",
         "player__last_name",
         "match_team__team__name",
     ]
+    autocomplete_fields = ["match_team", "player"]
 
     fieldsets = (
         ("Información del Evento", {"fields": ("match_team", "player", "event_type")}),
@@ -91,5 +100,20 @@ class MatchEventAdmin(admin.ModelAdmin):
         return (
             super()
             .get_queryset(request)
-            .select_related("player", "match_team__team", "match_team__match")
+            .select_related("player__team", "match_team__team", "match_team__match")
         )
+
+    def get_form(self, request, obj=None, **kwargs):
+        """Limita el autocompletado de jugadores al equipo del evento"""
+        form = super().get_form(request, obj, **kwargs)
+        if obj is not None:
+            scope_autocomplete(form, "player", team=obj.match_team.team_id)
+        return form
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Los __str__ de MatchTeam y Player muestran el nombre del equipo
+        if db_field.name == "match_team":
+            kwargs["queryset"] = MatchTeam.objects.select_related("team")
+        elif db_field.name == "player":
+            kwargs["queryset"] = Player.objects.select_related("team")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
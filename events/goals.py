@@ -0,0 +1,104 @@
+"""
+Goles desde Eventos
+===================
+
+Mantiene MatchTeam.goals al día con los eventos de gol (MatchEvent):
+
+- alta de un gol: goals + 1
+- baja de un gol (o cambio de tipo/equipo): goals - 1 en el equipo anterior
+
+Cada cambio es un UPDATE con F() (goals = goals + n) que resuelve la base
+de datos, así dos planilleros cargando goles del mismo partido a la vez no
+se pisan como con leer, sumar y guardar.
+
+Las señales de events/signals.py cubren save() y delete(); quien crea
+eventos con bulk_create aplica los goles con apply_goal_deltas().
+
+Los desajustes que queden (marcadores escritos a mano, datos viejos) los
+encuentra y repara el comando check_goal_counts.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from matches.models import MatchTeam
+from matches.signals import goals_changed
+
+from .models import MatchEvent
+
+
+def goal_deltas(events):
+    """Goles a sumar por MatchTeam de una lista de eventos: {match_team_id: n}"""
+    return Counter(
+        event.match_team_id for event in events if event.event_type == "goal"
+    )
+
+
+def apply_goal_deltas(deltas):
+    """
+    Suma (o resta) goles a los MatchTeam con UPDATE atómicos
+
+    Un UPDATE por cada valor distinto de delta. Los goles nunca quedan
+    negativos y un marcador vacío cuenta como 0.
+
+    Args:
+        deltas: {match_team_id: goles a sumar}
+    """
+    by_delta = defaultdict(list)
+    for match_team_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(match_team_id)
+    if not by_delta:
+        return
+
+    for delta, match_team_ids in by_delta.items():
+        MatchTeam.objects.filter(pk__in=match_team_ids).update(
+            goals=Greatest(Coalesce(F("goals"), Value(0)) + Value(delta), Value(0))
+        )
+    goals_changed(
+        MatchTeam.objects.filter(pk__in=list(deltas))
+        .values_list("match_id", flat=True)
+        .distinct()
+    )
+
+
+def goal_events_count():
+    """Subconsulta con los eventos de gol de cada MatchTeam (OuterRef pk)"""
+    goals = (
+        MatchEvent.objects.filter(match_team=OuterRef("pk"), event_type="goal")
+        .values("match_team")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(goals), Value(0))
+
+
+def goal_mismatches(match_teams, include_untracked=False):
+    """
+    MatchTeam cuyo marcador no coincide con sus eventos de gol
+
+    Args:
+        match_teams: Queryset de MatchTeam a revisar
+        include_untracked: También los partidos sin ningún evento cargado
+            (por defecto se respeta el marcador escrito a mano)
+    """
+    match_teams = match_teams.annotate(goal_events=goal_events_count()).exclude(
+        goals=F("goal_events")
+    )
+    # Sin goles ni eventos: partido sin jugar
+    match_teams = match_teams.exclude(Q(goals__isnull=True) & Q(goal_events=0))
+    if not include_untracked:
+        match_teams = match_teams.filter(
+            Exists(MatchEvent.objects.filter(match_team__match=OuterRef("match_id")))
+        )
+    return match_teams
+
+
+def repair_goal_counts(match_team_ids):
+    """Iguala goals a la cantidad de eventos de gol, en un UPDATE"""
+    match_teams = MatchTeam.objects.filter(pk__in=match_team_ids)
+    updated = match_teams.update(goals=goal_events_count())
+    goals_changed(match_teams.values_list("match_id", flat=True).distinct())
+    return updated
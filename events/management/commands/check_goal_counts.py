@@ -0,0 +1,114 @@
+"""
+Comando para revisar los goles
+==============================
+
+Compara MatchTeam.goals con la cantidad de eventos de gol de cada equipo en
+el partido y repara los desajustes (ver events/goals.py).
+
+Recorre los torneos de a uno y sus MatchTeam en bloques por id: cada bloque
+es una consulta de revisión y, si hay desajustes, un UPDATE en su propia
+transacción, así no se bloquea la base mientras se cargan resultados.
+
+Por defecto solo revisa partidos con algún evento cargado: un marcador
+escrito a mano sin eventos no es un error.
+
+Uso:
+    python manage.py check_goal_counts --dry-run
+    python manage.py check_goal_counts --tournament-id 3
+    python manage.py check_goal_counts --chunk-size 1000 --include-untracked
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from events.goals import goal_mismatches, repair_goal_counts
+from matches.models import MatchTeam
+from tournaments.models import Tournament
+
+
+class Command(BaseCommand):
+    help = "Revisa y repara los goles de cada equipo según sus eventos de gol"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tournament-id", type=int, help="ID del torneo (default: todos)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="MatchTeam revisados por consulta (default: 500)",
+        )
+        parser.add_argument(
+            "--include-untracked",
+            action="store_true",
+            help="Revisa también los partidos sin eventos cargados",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo informa los desajustes, sin repararlos",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size debe ser mayor a 0")
+
+        tournaments = Tournament.objects.order_by("id")
+        if options["tournament_id"]:
+            tournaments = tournaments.filter(id=options["tournament_id"])
+            if not tournaments.exists():
+                raise CommandError("Torneo no encontrado")
+
+        checked = mismatched = 0
+        for tournament in tournaments:
+            for chunk in self.chunks(tournament, options["chunk_size"]):
+                checked += len(chunk)
+                found = mismatched
+                mismatched += self.check_chunk(chunk, options)
+                if mismatched > found:
+                    self.stdout.write(
+                        f"{tournament}: {mismatched - found} desajustes "
+                        f"(ids {chunk[0]}-{chunk[-1]})"
+                    )
+
+        action = "encontrados" if options["dry_run"] else "reparados"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{checked} equipos en partido revisados, {mismatched} {action}"
+            )
+        )
+
+    def chunks(self, tournament, size):
+        """Ids de los MatchTeam del torneo, de a `size` (paginado por id)"""
+        match_teams = MatchTeam.objects.filter(
+            match__round__phase__tournament_category__tournament=tournament
+        ).order_by("id")
+        last_id = 0
+        while True:
+            chunk = list(
+                match_teams.filter(id__gt=last_id).values_list("id", flat=True)[:size]
+            )
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1]
+
+    def check_chunk(self, chunk, options):
+        mismatches = goal_mismatches(
+            MatchTeam.objects.filter(id__in=chunk),
+            include_untracked=options["include_untracked"],
+        )
+        if options["dry_run"]:
+            for match_team in mismatches.select_related("team"):
+                self.stdout.write(
+                    f"  {match_team.team.name} (partido {match_team.match_id}): "
+                    f"{match_team.goals} goles, {match_team.goal_events} eventos"
+                )
+            return len(mismatches)
+
+        with transaction.atomic():
+            ids = list(mismatches.values_list("id", flat=True))
+            if ids:
+                repair_goal_counts(ids)
+        return len(ids)
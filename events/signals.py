@@ -0,0 +1,47 @@
+"""
+Señales de eventos
+==================
+
+Suman y restan los goles del MatchTeam al guardar o borrar eventos de gol
+(ver events/goals.py). Antes de guardar un evento existente se lee su tipo
+y equipo anteriores para descontar el gol si cambiaron.
+"""
+
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .goals import apply_goal_deltas
+from .models import MatchEvent
+
+
+@receiver(pre_save, sender=MatchEvent)
+def remember_previous_goal(sender, instance, raw=False, **kwargs):
+    instance._previous_goal_team = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_goal_team = (
+        MatchEvent.objects.filter(pk=instance.pk, event_type="goal")
+        .values_list("match_team_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=MatchEvent)
+def goal_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    deltas = Counter()
+    previous = getattr(instance, "_previous_goal_team", None)
+    if previous is not None:
+        deltas[previous] -= 1
+    if instance.event_type == "goal":
+        deltas[instance.match_team_id] += 1
+    apply_goal_deltas(deltas)
+
+
+@receiver(post_delete, sender=MatchEvent)
+def goal_deleted(sender, instance, **kwargs):
+    if instance.event_type == "goal":
+        apply_goal_deltas({instance.match_team_id: -1})
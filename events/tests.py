@@ -1,3 +1,126 @@
 from django.test import TestCase
 
-# Create your tests here.
+from events.goals import (
+    apply_goal_deltas,
+    goal_deltas,
+    goal_mismatches,
+    repair_goal_counts,
+)
+from matches.models import MatchTeam
+from tournaments.tests.factories import (
+    create_category,
+    create_match,
+    create_phase,
+    create_player,
+    create_teams,
+)
+
+from .models import MatchEvent
+
+
+class GoalCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = create_category()
+        home, away = create_teams(category, 2)
+        cls.match = create_match(create_phase(category), home, away, "finished")
+        cls.home, cls.away = cls.match.match_teams.order_by("id")
+        cls.home_player = create_player(home)
+        cls.away_player = create_player(away, dni="30333444")
+
+    def add_event(self, match_team, player, event_type="goal"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return MatchEvent.objects.create(
+                match_team=match_team, player=player, event_type=event_type
+            )
+
+    def scores(self):
+        return [
+            (match_team.goals, match_team.result)
+            for match_team in MatchTeam.objects.filter(match=self.match).order_by("id")
+        ]
+
+    def test_added_goal_updates_score_and_result(self):
+        self.add_event(self.home, self.home_player)
+        self.add_event(self.home, self.home_player)
+        self.add_event(self.away, self.away_player)
+
+        self.assertEqual(self.scores(), [(2, "win"), (1, "loss")])
+
+    def test_other_events_do_not_count(self):
+        self.add_event(self.home, self.home_player, "yellow_card")
+        self.assertEqual([goals for goals, _ in self.scores()], [0, 0])
+
+    def test_removed_goal_is_subtracted(self):
+        goal = self.add_event(self.away, self.away_player)
+        with self.captureOnCommitCallbacks(execute=True):
+            goal.delete()
+
+        self.assertEqual(self.scores(), [(0, "draw"), (0, "draw")])
+
+    def test_changed_event_type(self):
+        event = self.add_event(self.home, self.home_player)
+        with self.captureOnCommitCallbacks(execute=True):
+            event.event_type = "red_card"
+            event.save()
+        self.assertEqual(self.scores(), [(0, "draw"), (0, "draw")])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event.event_type = "goal"
+            event.save()
+        self.assertEqual(self.scores(), [(1, "win"), (0, "loss")])
+
+    def test_goal_moved_to_the_other_team(self):
+        goal = self.add_event(self.home, self.home_player)
+        with self.captureOnCommitCallbacks(execute=True):
+            goal.match_team = self.away
+            goal.save()
+
+        self.assertEqual(self.scores(), [(0, "loss"), (1, "win")])
+
+    def test_saving_an_unchanged_goal_keeps_the_score(self):
+        goal = self.add_event(self.home, self.home_player)
+        with self.captureOnCommitCallbacks(execute=True):
+            goal.details = "De cabeza"
+            goal.save()
+
+        self.assertEqual(self.scores(), [(1, "win"), (0, "loss")])
+
+    def test_goals_never_go_negative_and_empty_counts_as_zero(self):
+        apply_goal_deltas({self.home.id: -1})
+        MatchTeam.objects.filter(pk=self.away.id).update(goals=None)
+        apply_goal_deltas({self.away.id: 2})
+
+        self.assertEqual(
+            list(
+                MatchTeam.objects.filter(match=self.match)
+                .order_by("id")
+                .values_list("goals", flat=True)
+            ),
+            [0, 2],
+        )
+
+    def test_bulk_created_events(self):
+        events = MatchEvent.objects.bulk_create(
+            [
+                MatchEvent(match_team=self.home, player=self.home_player, event_type=t)
+                for t in ("goal", "goal", "yellow_card")
+            ]
+        )
+        deltas = goal_deltas(events)
+        self.assertEqual(deltas, {self.home.id: 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_goal_deltas(deltas)
+        self.assertEqual(self.scores(), [(2, "win"), (0, "loss")])
+
+    def test_mismatches_are_found_and_repaired(self):
+        self.add_event(self.home, self.home_player)
+        MatchTeam.objects.filter(pk=self.home.id).update(goals=3)
+        match_teams = MatchTeam.objects.filter(match=self.match)
+
+        self.assertEqual(list(goal_mismatches(match_teams)), [self.home])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(repair_goal_counts([self.home.id]), 1)
+        self.assertEqual(list(goal_mismatches(match_teams)), [])
+        self.assertEqual(self.scores(), [(1, "win"), (0, "loss")])
@@ -25,36 +25,100 @@ Notas:
 
 from django import forms
 from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+from django.forms.models import BaseInlineFormSet
+from django.urls import path
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 
 from events.models import MatchEvent
-from teams.models import Player
+from project.admin import scope_autocomplete, select_related_filter
+from teams.models import Player, Team
+from tournaments.models import Round
 
 from .models import Match, MatchTeam
+from .views import match_day_view
+
+
+def match_teams_prefetch():
+    """Prefetch de los equipos del partido que usan Match.__str__ y match_display"""
+    return Prefetch("match_teams", queryset=MatchTeam.objects.select_related("team"))
+
 
 # admin.py for events app
 
 
+class RosterChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField que valida contra un plantel ya cargado
+
+    El formset le asigna el plantel (dict pk -> Player) y las opciones, así
+    que ni el renderizado ni la validación consultan la base por formulario.
+    """
+
+    roster = None
+
+    def to_python(self, value):
+        if self.roster is None:
+            return super().to_python(value)
+        if value in self.empty_values:
+            return None
+        try:
+            return self.roster[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+
 class MatchEventInlineForm(forms.ModelForm):
     """
     Formulario personalizado para el inline de MatchEvent
-    Filtra los jugadores según el equipo del MatchTeam padre.
-    El campo 'player' solo muestra jugadores del equipo correspondiente.
+    El campo 'player' solo muestra jugadores del equipo del MatchTeam padre,
+    con el plantel que carga una sola vez MatchEventInlineFormSet.
     """
 
     class Meta:
         model = MatchEvent
         fields = "__all__"
+        field_classes = {"player": RosterChoiceField}
 
-    def __init__(self, *args, **kwargs):
-        parent_obj = kwargs.pop("parent_obj", None)  # 🔑 viene del inline
+    def __init__(self, *args, roster=None, player_choices=(), **kwargs):
         super().__init__(*args, **kwargs)
+        if "player" in self.fields:
+            self.fields["player"].roster = roster or {}
+            self.fields["player"].choices = player_choices
 
-        if parent_obj:  # siempre usamos el team del MatchTeam padre
-            team = parent_obj.team
-            self.fields["player"].queryset = Player.objects.filter(team=team)
-        else:
-            self.fields["player"].queryset = Player.objects.none()
+
+class MatchEventInlineFormSet(BaseInlineFormSet):
+    """
+    Formset de eventos que comparte el plantel del equipo entre formularios
+
+    Una consulta para el plantel y una lista de opciones para todas las filas
+    (incluidas las vacías y el formulario modelo para agregar filas).
+    """
+
+    @cached_property
+    def roster(self):
+        if self.instance.team_id is None:
+            return {}
+        players = Player.objects.filter(team_id=self.instance.team_id)
+        return {player.pk: player for player in players.select_related("team")}
+
+    @cached_property
+    def player_choices(self):
+        return [("", "---------")] + [
+            (pk, str(player)) for pk, player in self.roster.items()
+        ]
+
+    def get_form_kwargs(self, index):
+        kwargs = super().get_form_kwargs(index)
+        kwargs["roster"] = self.roster
+        kwargs["player_choices"] = self.player_choices
+        return kwargs
 
 
 class MatchEventInline(admin.TabularInline):
@@ -66,21 +130,13 @@ class MatchEventInline(admin.TabularInline):
 
     model = MatchEvent
     form = MatchEventInlineForm
+    formset = MatchEventInlineFormSet
     extra = 1
     fields = ["player", "event_type", "details"]
 
-    def get_formset(self, request, obj=None, **kwargs):
-        """
-        Pasamos el objeto padre (MatchTeam) a todos los formularios del inline.
-        """
-        FormSet = super().get_formset(request, obj, **kwargs)
-
-        class CustomFormSet(FormSet):
-            def _construct_form(self, i, **kwargs):
-                kwargs["parent_obj"] = obj  # 🔑 siempre el MatchTeam padre
-                return super()._construct_form(i, **kwargs)
-
-        return CustomFormSet
+    def get_queryset(self, request):
+        """MatchEvent.__str__ (encabezado de cada fila) muestra el jugador"""
+        return super().get_queryset(request).select_related("player")
 
 
 class MatchTeamInline(admin.TabularInline):
@@ -95,6 +151,25 @@ class MatchTeamInline(admin.TabularInline):
     extra = 2
     max_num = 2
     fields = ["team", "goals", "penalty_goals", "result", "points"]
+    # Los calcula tournaments/results.py al guardar
+    readonly_fields = ["result", "points"]
+    autocomplete_fields = ["team"]
+
+    def get_formset(self, request, obj=None, **kwargs):
+        """Limita el autocompletado de equipos a la categoría del partido"""
+        FormSet = super().get_formset(request, obj, **kwargs)
+        if obj is not None:
+            scope_autocomplete(
+                FormSet.form,
+                "team",
+                category=obj.round.phase.tournament_category_id,
+            )
+        return FormSet
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "team":
+            kwargs["queryset"] = Team.objects.select_related("tournament_category")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(Match)
@@ -107,6 +182,7 @@ class MatchAdmin(admin.ModelAdmin):
     Campos principales:
     - round: Ronda a la que pertenece
     - date/time: Fecha y hora del partido
+    - field: Cancha asignada (la completa el comando schedule_matches)
     - status: Estado del partido (scheduled, finished, cancelled)
     - match_teams: Equipos participantes y resultados
 
@@ -123,32 +199,55 @@ class MatchAdmin(admin.ModelAdmin):
     - cancelled: Cancelado
     """
 
-    list_display = ["match_display", "date", "time", "status", "round_info"]
+    list_display = ["match_display", "date", "time", "field", "status", "round_info"]
     list_filter = ["status", "date", "round__phase__tournament_category__tournament"]
     search_fields = ["round__round_name", "match_teams__team__name"]
     ordering = ["date", "time"]
     date_hierarchy = "date"
+    autocomplete_fields = ["round"]
     inlines = [MatchTeamInline]
 
     fieldsets = (
         ("Información del Partido", {"fields": ("round", "status")}),
-        ("Horario", {"fields": ("date", "time")}),
+        ("Horario", {"fields": ("date", "time", "field")}),
     )
 
+    def get_urls(self):
+        urls = super().get_urls()
+        custom_urls = [
+            path("match-day/", match_day_view, name="match_day"),
+        ]
+        return custom_urls + urls
+
+    def get_queryset(self, request):
+        """Trae ronda, categoría y equipos en una cantidad fija de consultas"""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("round__phase__tournament_category")
+            .prefetch_related(match_teams_prefetch())
+        )
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "round":
+            kwargs["queryset"] = Round.objects.select_related(
+                "phase__tournament_category__tournament"
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
     def match_display(self, obj):
         """Muestra el partido en formato 'Equipo A 2 - 1 Equipo B'"""
-        teams = obj.match_teams.all()
-        if teams.count() == 2:
-            home_team = teams.first()
-            away_team = teams.last()
-            if home_team and away_team:
-                return format_html(
-                    "<strong>{}</strong> {} - {} <strong>{}</strong>",
-                    home_team.team.name,
-                    home_team.goals,
-                    away_team.goals,
-                    away_team.team.name,
-                )
+        # Ordena en memoria para aprovechar el prefetch (local = menor id)
+        teams = sorted(obj.match_teams.all(), key=lambda match_team: match_team.id)
+        if len(teams) == 2:
+            home_team, away_team = teams
+            return format_html(
+                "<strong>{}</strong> {} - {} <strong>{}</strong>",
+                home_team.team.name,
+                home_team.goals,
+                away_team.goals,
+                away_team.team.name,
+            )
         return f"Match {obj.id}"
 
     match_display.short_description = "Partido"
@@ -180,26 +279,65 @@ class MatchTeamAdmin(admin.ModelAdmin):
     - Búsqueda por nombre de equipo y ronda
     - Seguimiento de estadísticas por equipo
 
-    Resultados:
-    - win: Victoria (3 puntos)
-    - loss: Derrota (0 puntos)
-    - draw: Empate (1 punto)
+    Resultados (calculados al finalizar el partido, con las reglas de su fase;
+    ver tournaments/results.py):
+    - win: Victoria (3 puntos por defecto)
+    - loss: Derrota (0 puntos por defecto)
+    - draw: Empate (1 punto por defecto)
 
     Gestión de eventos del partido (goles, tarjetas) mediante inline
     - Inline para gestionar eventos del partido (goles, tarjetas)
+    - Cada gol cargado o borrado suma o resta en goals (events/goals.py);
+      si en el mismo envío se escribe goals, ese valor es el total
 
     """
 
     list_display = ["team", "match_info", "goals", "penalty_goals", "result", "points"]
-    list_filter = ["result", "match__status", "team__tournament_category"]
+    list_filter = [
+        "result",
+        "match__status",
+        ("team__tournament_category", select_related_filter("tournament")),
+    ]
     search_fields = ["team__name", "match__round__round_name"]
     ordering = ["match__date", "match__time"]
+    autocomplete_fields = ["match", "team"]
     inlines = [MatchEventInline]
 
     fieldsets = (
         ("Información del Partido", {"fields": ("match", "team")}),
         ("Resultados", {"fields": ("goals", "penalty_goals", "result", "points")}),
     )
+    readonly_fields = ["result", "points"]
+
+    def get_queryset(self, request):
+        """Optimiza las consultas para mejor rendimiento"""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("team__tournament_category", "match__round")
+        )
+
+    def get_form(self, request, obj=None, **kwargs):
+        """Limita el autocompletado de equipos a la categoría del equipo actual"""
+        form = super().get_form(request, obj, **kwargs)
+        if obj is not None:
+            scope_autocomplete(form, "team", category=obj.team.tournament_category_id)
+        return form
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        if "goals" in form.changed_data:
+            # Los goles del inline ya se sumaron: vuelve al marcador escrito
+            MatchTeam.objects.filter(pk=form.instance.pk).update(
+                goals=form.instance.goals
+            )
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "match":
+            kwargs["queryset"] = Match.objects.prefetch_related(match_teams_prefetch())
+        elif db_field.name == "team":
+            kwargs["queryset"] = Team.objects.select_related("tournament_category")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
     def match_info(self, obj):
         """Muestra información del partido (fecha y ronda)"""
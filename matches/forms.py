@@ -0,0 +1,98 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+from events.models import MatchEvent
+
+from .models import Match
+
+
+class MatchDayFilterForm(forms.Form):
+    date = forms.DateField(
+        required=False,
+        label="Fecha",
+        widget=forms.DateInput(attrs={"type": "date"}),
+    )
+    round = forms.IntegerField(required=False, widget=forms.HiddenInput)
+
+
+class MatchResultForm(forms.Form):
+    """
+    Resultado de un partido en la jornada (local y visitante)
+
+    Cada campo se envía también oculto con el valor con el que se mostró la
+    página (show_hidden_initial): has_changed() compara contra ese valor y
+    rendered_values() permite detectar cambios hechos por otros mientras
+    tanto.
+    """
+
+    status = forms.ChoiceField(
+        choices=Match.STATUS_CHOICES, label="Estado", show_hidden_initial=True
+    )
+    home_goals = forms.IntegerField(
+        required=False, min_value=0, label="Goles local", show_hidden_initial=True
+    )
+    away_goals = forms.IntegerField(
+        required=False,
+        min_value=0,
+        label="Goles visitante",
+        show_hidden_initial=True,
+    )
+    home_penalties = forms.IntegerField(
+        required=False, min_value=0, label="Penales local", show_hidden_initial=True
+    )
+    away_penalties = forms.IntegerField(
+        required=False,
+        min_value=0,
+        label="Penales visitante",
+        show_hidden_initial=True,
+    )
+
+    def rendered_values(self):
+        """Valores con los que se mostró el formulario (campos ocultos)"""
+        values = {}
+        for name, field in self.fields.items():
+            value = field.hidden_widget().value_from_datadict(
+                self.data, self.files, self.add_initial_prefix(name)
+            )
+            try:
+                values[name] = field.to_python(value)
+            except ValidationError:
+                values[name] = None
+        return values
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("status") == "finished" and (
+            cleaned_data.get("home_goals") is None
+            or cleaned_data.get("away_goals") is None
+        ):
+            raise ValidationError("Un partido finalizado necesita los goles de ambos.")
+        return cleaned_data
+
+
+class MatchEventEntryForm(forms.Form):
+    """
+    Fila para cargar un evento nuevo del partido
+
+    Las opciones de jugador (planteles de ambos equipos, agrupados) las arma
+    la vista una sola vez por partido; validar no consulta la base.
+    """
+
+    player = forms.TypedChoiceField(
+        coerce=int, required=False, empty_value=None, label="Jugador"
+    )
+    event_type = forms.ChoiceField(
+        choices=[("", "---------")] + MatchEvent.EVENT_TYPE_CHOICES,
+        required=False,
+        label="Evento",
+    )
+
+    def __init__(self, *args, player_choices=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["player"].choices = player_choices
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if bool(cleaned_data.get("player")) != bool(cleaned_data.get("event_type")):
+            raise ValidationError("Elige el jugador y el tipo de evento.")
+        return cleaned_data
@@ -0,0 +1,214 @@
+"""
+Centro de Control de la Jornada
+===============================
+
+Carga y guarda en bloque los resultados de todos los partidos de una fecha
+(o de una ronda) para la página "Jornada" del admin.
+
+Lectura en una cantidad fija de consultas: partidos con ronda y categoría,
+equipos del partido, eventos ya cargados y los planteles de todos los
+equipos involucrados (una sola consulta de jugadores).
+
+El guardado es un único POST: en una transacción se actualizan solo los
+partidos y equipos que cambiaron (con save(), para que corran las señales
+del cuadro eliminatorio y del dashboard) y los eventos nuevos se insertan
+con un solo bulk_create. Los goles nuevos se suman al marcador con UPDATE
+atómicos (events/goals.py), salvo en los equipos cuyo marcador se escribió
+en el mismo envío: ese marcador ya es el total.
+
+El formulario envía los valores con los que se mostró la página: si el
+partido cambió en la base desde entonces (otro usuario o un gol cargado en
+otra pantalla), la fila no se guarda y se informa para que se recargue.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from events.goals import apply_goal_deltas, goal_deltas
+from events.models import MatchEvent
+from teams.models import Player
+
+from .forms import MatchEventEntryForm, MatchResultForm
+from .models import Match, MatchTeam
+
+# Filas vacías para cargar eventos por partido
+EVENT_ROWS = 3
+
+# Partidos por página: cada uno suma 16 campos al POST y Django rechaza más
+# de DATA_UPLOAD_MAX_NUMBER_FIELDS (1000)
+MATCHES_PER_PAGE = 40
+
+
+def match_day_queryset(date=None, round_id=None):
+    """Partidos de una ronda o, si no se indica, de una fecha"""
+    matches = Match.objects.select_related(
+        "round__phase__tournament_category"
+    ).prefetch_related(
+        Prefetch(
+            "match_teams",
+            queryset=MatchTeam.objects.select_related("team").prefetch_related(
+                Prefetch(
+                    "events",
+                    queryset=MatchEvent.objects.select_related("player").order_by("id"),
+                )
+            ),
+        )
+    )
+    if round_id is not None:
+        return matches.filter(round_id=round_id).order_by("date", "time", "field", "id")
+    return matches.filter(date=date).order_by("time", "field", "id")
+
+
+class MatchDayRow:
+    """Un partido de la jornada con su formulario y filas de eventos"""
+
+    def __init__(self, match, rosters, data=None):
+        self.match = match
+        teams = sorted(match.match_teams.all(), key=lambda match_team: match_team.id)
+        self.home, self.away = teams if len(teams) == 2 else (None, None)
+        self.prefix = f"match-{match.id}"
+        self.events = [event for team in teams for event in team.events.all()]
+
+        if self.home is None:
+            # Partido sin equipos asignados: solo se muestra
+            self.form = None
+            self.event_forms = []
+            return
+
+        self.current_values = {
+            "status": match.status,
+            "home_goals": self.home.goals,
+            "away_goals": self.away.goals,
+            "home_penalties": self.home.penalty_goals,
+            "away_penalties": self.away.penalty_goals,
+        }
+        self.form = MatchResultForm(
+            data, prefix=self.prefix, initial=self.current_values
+        )
+
+        # Jugador -> MatchTeam del partido, para asignar los eventos nuevos
+        self.player_sides = {}
+        player_choices = [("", "---------")]
+        for side in (self.home, self.away):
+            players = rosters.get(side.team_id, [])
+            self.player_sides.update({player.id: side for player in players})
+            player_choices.append(
+                (
+                    side.team.name,
+                    [
+                        (
+                            player.id,
+                            f"#{player.jersey_number or '-'} {player.full_name}",
+                        )
+                        for player in players
+                    ],
+                )
+            )
+        self.event_forms = [
+            MatchEventEntryForm(
+                data,
+                prefix=f"{self.prefix}-event-{index}",
+                player_choices=player_choices,
+            )
+            for index in range(EVENT_ROWS)
+        ]
+
+    def is_valid(self):
+        if self.form is None:
+            return True
+        # Se validan todos para mostrar todos los errores
+        return all(
+            [self.form.is_valid()] + [form.is_valid() for form in self.event_forms]
+        )
+
+    def is_stale(self):
+        """El partido cambió en la base desde que se mostró la página"""
+        return self.form.rendered_values() != self.current_values
+
+    def new_events(self):
+        return [
+            MatchEvent(
+                match_team=self.player_sides[form.cleaned_data["player"]],
+                player_id=form.cleaned_data["player"],
+                event_type=form.cleaned_data["event_type"],
+            )
+            for form in self.event_forms
+            if form.cleaned_data.get("player")
+        ]
+
+
+def load_rosters(matches):
+    """Planteles de todos los equipos de los partidos: {team_id: [Player]}"""
+    team_ids = {
+        match_team.team_id
+        for match in matches
+        for match_team in match.match_teams.all()
+    }
+    rosters = defaultdict(list)
+    players = Player.objects.filter(team_id__in=team_ids).only(
+        "id", "team_id", "first_name", "last_name", "jersey_number"
+    )
+    for player in players.order_by("team_id", "jersey_number", "last_name"):
+        rosters[player.team_id].append(player)
+    return rosters
+
+
+def build_rows(matches, data=None):
+    matches = list(matches)
+    rosters = load_rosters(matches)
+    return [MatchDayRow(match, rosters, data) for match in matches]
+
+
+@transaction.atomic
+def save_rows(rows):
+    """
+    Guarda los cambios de la jornada (las filas ya validadas)
+
+    Las filas con cambios cuyo partido se modificó desde que se mostró la
+    página no se guardan (ni el resultado ni sus eventos nuevos).
+
+    Returns:
+        Tupla (partidos actualizados, eventos creados, partidos no guardados)
+    """
+    updated_matches = 0
+    new_events = []
+    typed_sides = set()
+    stale_matches = []
+    for row in rows:
+        if row.form is None:
+            continue
+        if row.form.has_changed() and row.is_stale():
+            stale_matches.append(row.match)
+            continue
+        new_events.extend(row.new_events())
+        if not row.form.has_changed():
+            continue
+
+        data = row.form.cleaned_data
+        updated_matches += 1
+        for side, goals, penalties in (
+            (row.home, data["home_goals"], data["home_penalties"]),
+            (row.away, data["away_goals"], data["away_penalties"]),
+        ):
+            if side.goals != goals:
+                typed_sides.add(side.id)
+            if (side.goals, side.penalty_goals) != (goals, penalties):
+                side.goals = goals
+                side.penalty_goals = penalties
+                side.save(update_fields=["goals", "penalty_goals"])
+        if row.match.status != data["status"]:
+            # Después de los equipos: las señales del partido leen sus goles
+            row.match.status = data["status"]
+            row.match.save(update_fields=["status"])
+
+    MatchEvent.objects.bulk_create(new_events)
+    apply_goal_deltas(
+        {
+            match_team_id: delta
+            for match_team_id, delta in goal_deltas(new_events).items()
+            if match_team_id not in typed_sides
+        }
+    )
+    return updated_matches, len(new_events), stale_matches
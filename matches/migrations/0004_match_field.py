@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-18 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matches", "0003_alter_matchteam_goals_alter_matchteam_penalty_goals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="field",
+            field=models.PositiveSmallIntegerField(
+                blank=True, help_text="Cancha asignada (1, 2, ...)", null=True
+            ),
+        ),
+    ]
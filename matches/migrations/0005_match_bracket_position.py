@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matches", "0004_match_field"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="bracket_position",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Posición en el cuadro eliminatorio (0 = primer cruce de la ronda)",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 23:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matches", "0005_match_bracket_position"),
+        ("tournaments", "0003_remove_tournamentcategory_end_date_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["status"], name="match_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["date", "time"], name="match_date_time_idx"),
+        ),
+    ]
@@ -17,22 +17,37 @@ class Match(models.Model):
     round = models.ForeignKey(Round, on_delete=models.CASCADE, related_name="matches")
     date = models.DateField()
     time = models.TimeField()
+    field = models.PositiveSmallIntegerField(
+        null=True, blank=True, help_text="Cancha asignada (1, 2, ...)"
+    )
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="scheduled"
     )
+    bracket_position = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Posición en el cuadro eliminatorio (0 = primer cruce de la ronda)",
+    )
 
     class Meta:
         verbose_name = "Partido"
         verbose_name_plural = "Partidos"
         ordering = ["date", "time"]
+        indexes = [
+            # Partidos en vivo y del día (dashboard del admin)
+            models.Index(fields=["status"], name="match_status_idx"),
+            models.Index(fields=["date", "time"], name="match_date_time_idx"),
+        ]
 
     def __str__(self):
-        match_teams = self.match_teams.all()
-        if match_teams.count() == 2:
-            home_team = match_teams.first()
-            away_team = match_teams.last()
-            if home_team and away_team:
-                return f"{home_team.team.name} vs {away_team.team.name}"
+        # Ordena en memoria para aprovechar el prefetch de match_teams (el
+        # local es el MatchTeam de menor id)
+        match_teams = sorted(
+            self.match_teams.all(), key=lambda match_team: match_team.id
+        )
+        if len(match_teams) == 2:
+            home_team, away_team = match_teams
+            return f"{home_team.team.name} vs {away_team.team.name}"
         return f"Match {self.id} - {self.date}"
 
 
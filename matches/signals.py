@@ -0,0 +1,112 @@
+"""
+Señales de partidos
+===================
+
+Mantiene el cuadro eliminatorio al día: cuando un partido del cuadro se
+guarda (o se editan sus equipos/goles) se pasa al ganador al cruce
+siguiente y se invalida el JSON precalculado del cuadro.
+
+Además recalcula result y points de los dos equipos del partido cuando
+cambian su estado o los goles (ver tournaments/results.py). El recálculo
+es un UPDATE por conjuntos, que no vuelve a disparar estas señales.
+
+Ambos se ejecutan en transaction.on_commit para que, al guardar desde
+el admin, los inlines de MatchTeam ya estén guardados.
+
+Los goles que se suman o restan con UPDATE (events/goals.py) no disparan
+post_save: quien los actualiza llama a goals_changed().
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Match, MatchTeam
+
+
+def _schedule_advance(match_id):
+    def advance():
+        from tournaments.brackets import advance_winner, invalidate_bracket
+
+        match = (
+            Match.objects.select_related("round")
+            .filter(id=match_id, bracket_position__isnull=False)
+            .first()
+        )
+        if match is None:
+            return
+        invalidate_bracket(match.round.phase_id)
+        advance_winner(match)
+
+    transaction.on_commit(advance)
+
+
+def _schedule_results(match_id):
+    def recompute():
+        from tournaments.results import recompute_match_results
+
+        recompute_match_results([match_id])
+
+    transaction.on_commit(recompute)
+
+
+def goals_changed(match_ids):
+    """Recalcula resultados y cuadro tras actualizar goles con update()"""
+    match_ids = list(match_ids)
+    if not match_ids:
+        return
+
+    def recompute():
+        from tournaments.results import recompute_match_results
+
+        recompute_match_results(match_ids)
+
+    transaction.on_commit(recompute)
+    bracket_matches = Match.objects.filter(
+        id__in=match_ids, bracket_position__isnull=False
+    ).values_list("id", flat=True)
+    for match_id in bracket_matches:
+        _schedule_advance(match_id)
+
+
+@receiver(post_save, sender=Match)
+def match_saved(sender, instance, raw=False, **kwargs):
+    if raw or instance.bracket_position is None:
+        return
+    _schedule_advance(instance.id)
+
+
+@receiver(post_save, sender=MatchTeam)
+@receiver(post_delete, sender=MatchTeam)
+def match_team_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    match = Match.objects.filter(id=instance.match_id).only("bracket_position").first()
+    if match is None or match.bracket_position is None:
+        return
+    _schedule_advance(instance.match_id)
+
+
+@receiver(post_save, sender=Match)
+def match_results_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and "status" not in update_fields):
+        return
+    _schedule_results(instance.id)
+
+
+@receiver(post_save, sender=MatchTeam)
+def match_team_results_changed(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    if raw or (
+        update_fields is not None
+        and not {"goals", "penalty_goals", "match"} & set(update_fields)
+    ):
+        return
+    _schedule_results(instance.match_id)
+
+
+@receiver(post_delete, sender=MatchTeam)
+def match_team_removed(sender, instance, **kwargs):
+    # El rival queda sin resultado
+    _schedule_results(instance.match_id)
@@ -1,3 +1,89 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from tournaments.tests.factories import (
+    create_category,
+    create_match,
+    create_phase,
+    create_teams,
+)
+
+from .match_day import EVENT_ROWS
+from .models import MatchTeam
+
+
+class MatchDayViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = create_category()
+        home, away = create_teams(category, 2)
+        cls.match = create_match(create_phase(category), home, away)
+        cls.user = User.objects.create_superuser("admin", password="x")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = reverse("admin:match_day") + "?date=2025-03-01"
+
+    def post_result(self, status, goals, rendered_goals=(0, 0)):
+        """POST de la jornada con la página mostrada con rendered_goals"""
+        prefix = f"match-{self.match.id}"
+        rendered = {
+            "status": "scheduled",
+            "home_goals": rendered_goals[0],
+            "away_goals": rendered_goals[1],
+            "home_penalties": 0,
+            "away_penalties": 0,
+        }
+        posted = {
+            **rendered,
+            "status": status,
+            "home_goals": goals[0],
+            "away_goals": goals[1],
+        }
+        data = {f"{prefix}-{name}": value for name, value in posted.items()}
+        data.update(
+            {f"initial-{prefix}-{name}": value for name, value in rendered.items()}
+        )
+        for index in range(EVENT_ROWS):
+            data[f"{prefix}-event-{index}-player"] = ""
+            data[f"{prefix}-event-{index}-event_type"] = ""
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.url, data, follow=True)
+
+    def goals(self):
+        return list(
+            MatchTeam.objects.filter(match=self.match)
+            .order_by("id")
+            .values_list("goals", flat=True)
+        )
+
+    def test_saves_the_typed_result(self):
+        self.post_result("finished", (2, 1))
+
+        self.match.refresh_from_db()
+        self.assertEqual(self.match.status, "finished")
+        self.assertEqual(self.goals(), [2, 1])
+
+    def test_skips_a_match_changed_since_the_page_was_rendered(self):
+        # Un gol cargado en otra pantalla después de mostrar la jornada
+        MatchTeam.objects.filter(match=self.match, team__name="Equipo 01").update(
+            goals=1
+        )
+
+        response = self.post_result("finished", (0, 0))
+
+        self.match.refresh_from_db()
+        self.assertEqual(self.match.status, "scheduled")
+        self.assertEqual(self.goals(), [1, 0])
+        self.assertContains(response, "No se guardaron porque cambiaron")
+
+    def test_untouched_match_keeps_the_current_database_values(self):
+        MatchTeam.objects.filter(match=self.match, team__name="Equipo 01").update(
+            goals=1
+        )
+
+        # Se reenvían los valores mostrados sin cambios
+        self.post_result("scheduled", (0, 0))
+
+        self.assertEqual(self.goals(), [1, 0])
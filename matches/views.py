@@ -1,3 +1,68 @@
-from django.shortcuts import render
+from datetime import timedelta
 
-# Create your views here.
+from django.contrib import admin, messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.auth.decorators import permission_required
+from django.core.paginator import Paginator
+from django.shortcuts import redirect, render
+from django.utils import timezone
+
+from .forms import MatchDayFilterForm
+from .match_day import MATCHES_PER_PAGE, build_rows, match_day_queryset, save_rows
+
+
+@staff_member_required
+@permission_required("matches.change_match", raise_exception=True)
+def match_day_view(request):
+    """
+    Centro de control de la jornada (admin)
+
+    Lista los partidos de una fecha (?date=, por defecto hoy) o de una ronda
+    (?round=), de a MATCHES_PER_PAGE, con marcador, penales, estado y filas para cargar eventos, y
+    guarda todo en un único POST (ver matches/match_day.py).
+    """
+    filter_form = MatchDayFilterForm(request.GET or None)
+    date = round_id = None
+    if filter_form.is_valid():
+        date = filter_form.cleaned_data["date"]
+        round_id = filter_form.cleaned_data["round"]
+    if date is None and round_id is None:
+        date = timezone.localdate()
+
+    page = Paginator(
+        match_day_queryset(date=date, round_id=round_id), MATCHES_PER_PAGE
+    ).get_page(request.GET.get("page"))
+    matches = page.object_list
+    if request.method == "POST":
+        rows = build_rows(matches, request.POST)
+        if all([row.is_valid() for row in rows]):
+            updated_matches, created_events, stale_matches = save_rows(rows)
+            messages.success(
+                request,
+                f"Jornada guardada: {updated_matches} partidos actualizados, "
+                f"{created_events} eventos cargados.",
+            )
+            if stale_matches:
+                messages.warning(
+                    request,
+                    "No se guardaron porque cambiaron mientras editabas: "
+                    f"{', '.join(str(match) for match in stale_matches)}. "
+                    "Revisa los valores actuales y vuelve a cargarlos.",
+                )
+            return redirect(request.get_full_path())
+        messages.error(request, "Revisa los errores marcados en los partidos.")
+    else:
+        rows = build_rows(matches)
+
+    context = {
+        **admin.site.each_context(request),
+        "title": "Jornada",
+        "filter_form": filter_form if filter_form.is_bound else MatchDayFilterForm(),
+        "rows": rows,
+        "page": page,
+        "date": date,
+        "round_id": round_id,
+        "previous_date": date - timedelta(days=1) if date else None,
+        "next_date": date + timedelta(days=1) if date else None,
+    }
+    return render(request, "admin/matches/match_day.html", context)
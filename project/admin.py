@@ -1,61 +1,92 @@
+from urllib.parse import urlencode
+
 from django.contrib import admin
 from django.contrib.admin import AdminSite
-from django.db.models import Count
-from django.shortcuts import render
-from django.urls import path
+from django.contrib.admin.widgets import AutocompleteSelect
+
+from .dashboard import dashboard_context
 
-from events.models import MatchEvent
-from matches.models import Match
-from teams.models import Player, Team
-from tournaments.models import Tournament, TournamentCategory
 
+def select_related_filter(*fields):
+    """
+    Filtro de list_filter por FK cuyas opciones se cargan con select_related
 
-def admin_dashboard_view(request):
+    RelatedFieldListFilter llama a __str__ de cada objeto relacionado; si ese
+    __str__ recorre otra FK (ej: Team muestra su categoría) se dispara una
+    consulta por opción. Uso: ("team", select_related_filter("tournament_category"))
     """
-    Dashboard personalizado para guiar al usuario
+
+    class SelectRelatedFieldListFilter(admin.RelatedFieldListFilter):
+        def field_choices(self, field, request, model_admin):
+            ordering = self.field_admin_ordering(field, request, model_admin)
+            queryset = field.related_model._default_manager.select_related(*fields)
+            if ordering:
+                queryset = queryset.order_by(*ordering)
+            return [(obj.pk, str(obj)) for obj in queryset]
+
+    return SelectRelatedFieldListFilter
+
+
+class ScopedAutocompleteSelect(AutocompleteSelect):
+    """AutocompleteSelect que agrega parámetros de alcance a la URL de búsqueda"""
+
+    def __init__(self, field, admin_site, params, **kwargs):
+        super().__init__(field, admin_site, **kwargs)
+        self.params = params
+
+    def get_url(self):
+        return f"{super().get_url()}?{urlencode(self.params)}"
+
+
+def scope_autocomplete(form_class, field_name, **params):
     """
-    # Estadísticas básicas
-    stats = {
-        "tournaments": Tournament.objects.count(),
-        "categories": TournamentCategory.objects.count(),
-        "teams": Team.objects.count(),
-        "players": Player.objects.count(),
-        "matches": Match.objects.count(),
-        "events": MatchEvent.objects.count(),
-    }
+    Limita el autocompletado de un campo del formulario (ej: team=3)
 
-    # Torneo más reciente
-    latest_tournament = Tournament.objects.order_by("-year").first()
+    El admin arma una clase de formulario nueva en cada get_form/get_formset,
+    así que se puede reemplazar su widget sin afectar otros requests. El admin
+    del modelo destino aplica los parámetros en get_search_results con
+    autocomplete_param.
+    """
+    field = form_class.base_fields.get(field_name)
+    if field is None:
+        # Campo de solo lectura o excluido
+        return
+    wrapper = field.widget  # RelatedFieldWidgetWrapper
+    autocomplete = wrapper.widget
+    wrapper.widget = ScopedAutocompleteSelect(
+        autocomplete.field,
+        autocomplete.admin_site,
+        params,
+        attrs=autocomplete.attrs,
+        choices=autocomplete.choices,
+        using=autocomplete.db,
+    )
 
-    context = {
-        "stats": stats,
-        "latest_tournament": latest_tournament,
-    }
 
-    return render(request, "admin/dashboard.html", context)
+def autocomplete_param(request, name):
+    """Parámetro de alcance (entero) de un request de autocompletado, o None"""
+    resolver_match = request.resolver_match
+    if resolver_match is None or resolver_match.url_name != "autocomplete":
+        return None
+    value = request.GET.get(name, "")
+    return int(value) if value.isdigit() else None
 
 
 class CopaDonBoscoAdminSite(AdminSite):
     """
     Admin personalizado con dashboard de bienvenida
+
+    Es el admin.site del proyecto (ver CopaDonBoscoAdminConfig en
+    project/apps.py). La portada agrega al listado de aplicaciones los
+    totales y widgets cacheados de project/dashboard.py.
     """
 
     site_header = "Copa Don Bosco 2024 - Administración"
     site_title = "Copa Don Bosco"
     index_title = "Panel de Administración"
+    index_template = "admin/dashboard.html"
 
-    def get_urls(self):
-        urls = super().get_urls()
-        custom_urls = [
-            path("", admin_dashboard_view, name="index"),
-        ]
-        return custom_urls + urls
-
-
-# Crear instancia personalizada
-admin_site = CopaDonBoscoAdminSite(name="copa_admin")
-
-# Configuración del Admin estándar en Español
-admin.site.site_header = "Copa Don Bosco 2024 - Administración"
-admin.site.site_title = "Copa Don Bosco"
-admin.site.index_title = "Panel de Administración"
+    def index(self, request, extra_context=None):
+        context = dashboard_context()
+        context.update(extra_context or {})
+        return super().index(request, context)
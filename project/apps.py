@@ -0,0 +1,24 @@
+from django.apps import AppConfig
+from django.contrib.admin import apps as admin_apps
+
+
+class ProjectConfig(AppConfig):
+    default = True
+    name = "project"
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
+
+
+class CopaDonBoscoAdminConfig(admin_apps.AdminConfig):
+    """
+    Usa el admin con dashboard (project.admin) como admin.site
+
+    AdminConfig se importa por su módulo: como clase del módulo contaría como
+    otro AppConfig por defecto de "project".
+    """
+
+    default = False
+    default_site = "project.admin.CopaDonBoscoAdminSite"
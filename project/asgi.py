@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
+
+En producción se sirve con gunicorn y workers de uvicorn; ver
+project/gunicorn_asgi.py (perfil ASGI).
 """
 
 import os
@@ -12,5 +15,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project.settings")
+os.environ.setdefault("ASGI_SERVER", "True")
 
 application = get_asgi_application()
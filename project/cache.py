@@ -0,0 +1,26 @@
+"""
+Caché Instrumentada
+===================
+
+FileBasedCache que cuenta aciertos y fallos de lectura en las métricas del
+request en curso (project/instrumentation.py). Fuera de un request medido
+se comporta igual que FileBasedCache.
+"""
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+from .instrumentation import current_metrics
+
+_MISSING = object()
+
+
+class InstrumentedFileBasedCache(FileBasedCache):
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        metrics = current_metrics()
+        if metrics is not None:
+            if value is _MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is _MISSING else value
@@ -0,0 +1,191 @@
+"""
+Dashboard del Admin
+===================
+
+Datos de la portada del admin, servidos desde la caché:
+
+- counts: totales de torneos, categorías, equipos, jugadores, partidos y
+  eventos. En PostgreSQL las tablas grandes usan la estimación de pg_class
+  (se muestran como aproximadas) en lugar de COUNT(*). Se invalidan al
+  crear o borrar registros (ver project/signals.py) y vencen a los
+  COUNTS_TIMEOUT segundos (cubre los bulk_create, que no emiten señales).
+- widgets: partidos en vivo, partidos del día y últimos eventos. Cada
+  consulta usa un índice (estado, fecha o id) y un LIMIT; se invalidan con
+  cualquier cambio de partidos o eventos y vencen a los WIDGETS_TIMEOUT
+  segundos.
+"""
+
+from django.core.cache import cache
+from django.db import connections, router
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from events.models import MatchEvent
+from matches.models import Match, MatchTeam
+from teams.models import Player, Team
+from tournaments.models import Tournament, TournamentCategory
+
+from .replicas import reading_from_replicas
+
+COUNTS_CACHE_KEY = "admin:dashboard:counts"
+WIDGETS_CACHE_KEY = "admin:dashboard:widgets:{date}"
+
+COUNTS_TIMEOUT = 600
+WIDGETS_TIMEOUT = 60
+
+# Filas a partir de las cuales se usa la estimación de PostgreSQL
+ESTIMATE_THRESHOLD = 10000
+
+# Filas por widget
+WIDGET_LIMIT = 20
+RECENT_EVENTS = 10
+
+COUNTED_MODELS = {
+    "tournaments": Tournament,
+    "categories": TournamentCategory,
+    "teams": Team,
+    "players": Player,
+    "matches": Match,
+    "events": MatchEvent,
+}
+
+EVENT_ICONS = {"goal": "⚽", "yellow_card": "🟨", "red_card": "🟥"}
+
+
+def estimated_rows(models):
+    """
+    Filas estimadas por PostgreSQL (pg_class.reltuples) para cada modelo
+
+    Devuelve un dict modelo -> estimación, vacío en otros motores. Las tablas
+    que nunca se analizaron tienen reltuples negativo y quedan afuera.
+    """
+    by_alias = {}
+    for model in models:
+        by_alias.setdefault(router.db_for_read(model), []).append(model)
+
+    estimates = {}
+    for alias, alias_models in by_alias.items():
+        connection = connections[alias]
+        if connection.vendor != "postgresql":
+            continue
+        tables = {model._meta.db_table: model for model in alias_models}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class "
+                "WHERE oid = ANY(%s::regclass[])",
+                [list(tables)],
+            )
+            for table, rows in cursor.fetchall():
+                if rows >= 0:
+                    estimates[tables[table]] = rows
+    return estimates
+
+
+def compute_counts():
+    """Totales por modelo: {"teams": {"value": 120, "approximate": False}, ...}"""
+    estimates = estimated_rows(COUNTED_MODELS.values())
+    counts = {}
+    for key, model in COUNTED_MODELS.items():
+        estimate = estimates.get(model)
+        if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+            counts[key] = {"value": estimate, "approximate": True}
+        else:
+            counts[key] = {
+                "value": model._default_manager.count(),
+                "approximate": False,
+            }
+    return counts
+
+
+def _match_rows(queryset):
+    """Partidos como dicts simples (se guardan en la caché sin modelos)"""
+    rows = []
+    for match in queryset:
+        teams = sorted(match.match_teams.all(), key=lambda match_team: match_team.id)
+        home, away = (teams + [None, None])[:2]
+        rows.append(
+            {
+                "id": match.id,
+                "time": match.time,
+                "field": match.field,
+                "status": match.get_status_display(),
+                "category": match.round.phase.tournament_category.category_name,
+                "round": match.round.round_name,
+                "home": home.team.name if home else "",
+                "away": away.team.name if away else "",
+                "home_goals": home.goals if home else None,
+                "away_goals": away.goals if away else None,
+            }
+        )
+    return rows
+
+
+def compute_widgets(today):
+    """Partidos en vivo, partidos del día, últimos eventos y último torneo"""
+    matches = Match.objects.select_related(
+        "round__phase__tournament_category"
+    ).prefetch_related(
+        Prefetch("match_teams", queryset=MatchTeam.objects.select_related("team"))
+    )
+    recent_events = MatchEvent.objects.select_related(
+        "player", "match_team__team", "match_team__match"
+    ).order_by("-id")[:RECENT_EVENTS]
+    latest_tournament = Tournament.objects.order_by("-year", "-id").first()
+
+    return {
+        "live_matches": _match_rows(
+            matches.filter(status="live").order_by("date", "time")[:WIDGET_LIMIT]
+        ),
+        "today_matches": _match_rows(
+            matches.filter(date=today).order_by("time", "field")[:WIDGET_LIMIT]
+        ),
+        "recent_events": [
+            {
+                "id": event.id,
+                "icon": EVENT_ICONS.get(event.event_type, "📝"),
+                "event_type": event.get_event_type_display(),
+                "player": event.player.full_name,
+                "team": event.match_team.team.name,
+                "date": event.match_team.match.date,
+            }
+            for event in recent_events
+        ],
+        "latest_tournament": (
+            {"id": latest_tournament.id, "name": str(latest_tournament)}
+            if latest_tournament
+            else None
+        ),
+    }
+
+
+def dashboard_context():
+    """
+    Contexto del dashboard, desde la caché cuando está disponible
+
+    Lo que se guarda en la caché se calcula en la base principal: leído de
+    una réplica atrasada, un valor viejo duraría hasta su vencimiento aunque
+    ya se haya invalidado.
+    """
+    counts = cache.get(COUNTS_CACHE_KEY)
+    if counts is None:
+        with reading_from_replicas(False):
+            counts = compute_counts()
+        cache.set(COUNTS_CACHE_KEY, counts, COUNTS_TIMEOUT)
+
+    today = timezone.localdate()
+    widgets_key = WIDGETS_CACHE_KEY.format(date=today.isoformat())
+    widgets = cache.get(widgets_key)
+    if widgets is None:
+        with reading_from_replicas(False):
+            widgets = compute_widgets(today)
+        cache.set(widgets_key, widgets, WIDGETS_TIMEOUT)
+
+    return {"stats": counts, "today": today, **widgets}
+
+
+def invalidate_counts():
+    cache.delete(COUNTS_CACHE_KEY)
+
+
+def invalidate_widgets():
+    cache.delete(WIDGETS_CACHE_KEY.format(date=timezone.localdate().isoformat()))
@@ -0,0 +1,120 @@
+"""
+Conexiones a la Base de Datos
+=============================
+
+Modos de conexión a PostgreSQL (DB_CONN_MODE en el .env):
+
+- none: una conexión nueva por request. Con sslmode=require cada una paga
+  el handshake TCP + TLS + autenticación.
+- persistent (default): cada worker reutiliza su conexión entre requests
+  hasta DB_CONN_MAX_AGE segundos. CONN_HEALTH_CHECKS la verifica al inicio
+  de cada request y reconecta si la base la cerró.
+- pool: pool de conexiones de psycopg 3 por proceso (requiere
+  psycopg[pool]; sin él los settings fallan al cargar), entre DB_POOL_MIN_SIZE y DB_POOL_MAX_SIZE conexiones.
+  Útil con workers de hilos o ASGI, donde varias requests del mismo proceso
+  necesitan conexión a la vez.
+
+Con DB_ENGINE=sqlite los settings usan sqlite_database() en lugar de
+PostgreSQL: una instalación de un solo servidor, sin servicio de base de
+datos aparte. Con SQLite solo valen los modos none y persistent.
+
+Este módulo no importa modelos: lo usan los settings y el comando
+benchmark_db_connections.
+"""
+
+import importlib.util
+
+from django.core.exceptions import ImproperlyConfigured
+
+CONNECTION_MODES = ("none", "persistent", "pool")
+
+
+def connection_settings(
+    mode, max_age=60, pool_min_size=2, pool_max_size=10, pool_timeout=10
+):
+    """
+    Claves a combinar con la entrada de DATABASES para un modo de conexión
+
+    Returns:
+        Dict con CONN_MAX_AGE, CONN_HEALTH_CHECKS y las OPTIONS del pool
+    """
+    if mode == "none":
+        return {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False, "OPTIONS": {}}
+    if mode == "persistent":
+        return {"CONN_MAX_AGE": max_age, "CONN_HEALTH_CHECKS": True, "OPTIONS": {}}
+    if mode == "pool":
+        # Con pool Django exige CONN_MAX_AGE = 0: la conexión vuelve al pool
+        # al terminar cada request y el pool solo entrega conexiones sanas
+        return {
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": False,
+            "OPTIONS": {
+                "pool": {
+                    "min_size": pool_min_size,
+                    "max_size": pool_max_size,
+                    "timeout": pool_timeout,
+                }
+            },
+        }
+    raise ImproperlyConfigured(
+        f"DB_CONN_MODE inválido: {mode!r} (opciones: {', '.join(CONNECTION_MODES)})"
+    )
+
+
+def apply_connection_settings(database, mode, **kwargs):
+    """Devuelve una copia de `database` configurada para el modo indicado"""
+    if mode == "pool":
+        if database["ENGINE"] != "django.db.backends.postgresql":
+            raise ImproperlyConfigured("DB_CONN_MODE=pool requiere PostgreSQL")
+        # Sin esto Django recién falla en la primera consulta
+        if not all(map(importlib.util.find_spec, ("psycopg", "psycopg_pool"))):
+            raise ImproperlyConfigured(
+                "DB_CONN_MODE=pool requiere psycopg 3 con el pool: "
+                "pip install 'psycopg[binary,pool]'"
+            )
+    extra = connection_settings(mode, **kwargs)
+    return {
+        **database,
+        "CONN_MAX_AGE": extra["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": extra["CONN_HEALTH_CHECKS"],
+        "OPTIONS": {
+            **{
+                key: value
+                for key, value in database.get("OPTIONS", {}).items()
+                if key != "pool"
+            },
+            **extra["OPTIONS"],
+        },
+    }
+
+
+def sqlite_database(path, mmap_size=256 * 1024 * 1024, cache_size_kb=64 * 1024):
+    """
+    Entrada de DATABASES para una instalación de un solo servidor en SQLite
+
+    - WAL: las lecturas no esperan a la escritura en curso (el público
+      consulta mientras los planilleros cargan resultados)
+    - synchronous=NORMAL: con WAL no pierde integridad y evita un fsync por
+      transacción
+    - mmap_size y cache_size: lecturas desde memoria en lugar de read()
+    - transacciones IMMEDIATE y timeout: dos escrituras simultáneas esperan
+      su turno en lugar de fallar con "database is locked"
+    """
+    pragmas = [
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        f"mmap_size={mmap_size}",
+        # Negativo: tamaño en KiB en lugar de páginas
+        f"cache_size=-{cache_size_kb}",
+        "temp_store=MEMORY",
+        "foreign_keys=ON",
+    ]
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": path,
+        "OPTIONS": {
+            "init_command": "; ".join(f"PRAGMA {pragma}" for pragma in pragmas),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        },
+    }
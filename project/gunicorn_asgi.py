@@ -0,0 +1,38 @@
+"""
+Perfil ASGI de producción para gunicorn
+=======================================
+
+gunicorn administra los procesos y uvicorn atiende los requests dentro de
+cada uno (event loop): un request esperando a la base de datos ya no ocupa
+un worker entero como con los workers sync sobre project/wsgi.py.
+
+Uso:
+    gunicorn project.asgi:application -c python:project.gunicorn_asgi
+
+Variables de entorno (opcionales):
+    GUNICORN_BIND: dirección (default: 127.0.0.1:8000, detrás de Nginx)
+    GUNICORN_WORKERS: procesos (default: 2 x CPU + 1)
+    GUNICORN_TIMEOUT: segundos antes de reiniciar un worker colgado
+
+Con este perfil ASGI_SERVER=True: se activan las vistas async de la API
+(api/viewsets/asynchronous.py) y una conexión a la base por request
+(DB_CONN_MODE=none; con psycopg[binary,pool] instalado conviene
+DB_CONN_MODE=pool, ver project/db.py). Los archivos estáticos los sirve
+Nginx (WhiteNoise solo funciona bajo WSGI).
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Reinicia los workers de a poco para acotar fugas de memoria
+max_requests = 2000
+max_requests_jitter = 200
+
+raw_env = ["ASGI_SERVER=True"]
@@ -0,0 +1,230 @@
+"""
+Instrumentación de Requests
+===========================
+
+Mide en qué se va el tiempo de cada request:
+
+- db: cantidad y tiempo de consultas SQL, con un execute_wrapper sobre
+  cada conexión
+- serialize: tiempo en to_representation de los serializers de DRF
+  (incluye las consultas que disparen los propios serializers)
+- view: tiempo de la vista hasta devolver la respuesta, sin renderizar
+- render: renderizado de la respuesta (JSON/HTML)
+- total: request completo dentro del middleware
+- cache: lecturas con acierto/fallo (ver project/cache.py)
+
+Opcionalmente guarda el SQL de las consultas que superan un umbral y de las
+más lentas del request, para el log de lentitud (project/slowlog.py).
+
+Las métricas del request en curso viven en un ContextVar, así que los
+wrappers no necesitan recibir el request.
+"""
+
+import contextvars
+import functools
+import heapq
+import itertools
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+_current_metrics = contextvars.ContextVar("request_metrics", default=None)
+
+# Consultas más lentas que se conservan por request
+SLOWEST_QUERIES = 5
+
+# Máximo de consultas lentas guardadas por request
+MAX_SLOW_QUERIES = 50
+
+
+class RequestMetrics:
+    """Métricas acumuladas de un request (tiempos en segundos)"""
+
+    def __init__(self, slow_query_threshold=None, track_slowest=False):
+        """
+        Args:
+            slow_query_threshold: Segundos a partir de los cuales se guarda
+                el SQL de una consulta (None para no guardar)
+            track_slowest: Guarda las SLOWEST_QUERIES consultas más lentas
+        """
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_ended = None
+        self.ended = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.view_name = None
+        self.serializing = False
+        self.slow_query_threshold = slow_query_threshold
+        self.track_slowest = track_slowest
+        self.slow_queries = []
+        self.slowest_queries = []
+        self._sequence = itertools.count()
+
+    def record_query(self, duration, alias, sql, params):
+        """Guarda el SQL de la consulta si es lenta o de las más lentas"""
+        query = (duration, alias, sql, params)
+        if (
+            self.slow_query_threshold is not None
+            and duration >= self.slow_query_threshold
+            and len(self.slow_queries) < MAX_SLOW_QUERIES
+        ):
+            self.slow_queries.append(query)
+        if self.track_slowest:
+            # El contador desempata sin comparar el SQL
+            entry = (duration, next(self._sequence), query)
+            if len(self.slowest_queries) < SLOWEST_QUERIES:
+                heapq.heappush(self.slowest_queries, entry)
+            else:
+                heapq.heappushpop(self.slowest_queries, entry)
+
+    def slowest(self):
+        """Consultas más lentas (duración, alias, sql, params), de mayor a menor"""
+        return [query for _, _, query in sorted(self.slowest_queries, reverse=True)]
+
+    def start_view(self, view_name):
+        self.view_name = view_name
+        self.view_started = time.perf_counter()
+
+    def end_view(self):
+        if self.view_started is not None and self.view_ended is None:
+            self.view_ended = time.perf_counter()
+
+    def finish(self):
+        self.end_view()
+        self.ended = time.perf_counter()
+
+    def as_dict(self):
+        """Métricas en milisegundos para logs y headers"""
+        view_time = render_time = 0.0
+        if self.view_started is not None:
+            view_time = self.view_ended - self.view_started
+            render_time = self.ended - self.view_ended
+        return {
+            "view": self.view_name,
+            "queries": self.queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            "serialize_ms": round(self.serialize_time * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "view_ms": round(view_time * 1000, 2),
+            "render_ms": round(render_time * 1000, 2),
+            "total_ms": round((self.ended - self.started) * 1000, 2),
+        }
+
+
+def current_metrics():
+    """Métricas del request en curso (None fuera de un request medido)"""
+    return _current_metrics.get()
+
+
+class QueryTimer:
+    """execute_wrapper que cuenta y cronometra las consultas SQL"""
+
+    def __init__(self, metrics, alias):
+        self.metrics = metrics
+        self.alias = alias
+        self.keep_sql = (
+            metrics.slow_query_threshold is not None or metrics.track_slowest
+        )
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.metrics.queries += 1
+            self.metrics.db_time += duration
+            if self.keep_sql:
+                self.metrics.record_query(duration, self.alias, sql, params)
+
+
+@contextmanager
+def timing_queries(metrics):
+    """
+    Cronometra las consultas del bloque en las conexiones del hilo actual
+
+    Las conexiones son propias de cada hilo: bajo ASGI el ORM corre en el
+    hilo del request (sync_to_async), así que el bloque debe abrirse y
+    cerrarse ahí y no en el del event loop.
+    """
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(
+                connection.execute_wrapper(QueryTimer(metrics, connection.alias))
+            )
+        yield
+
+
+@contextmanager
+def collect_metrics(time_queries=True, **options):
+    """
+    Activa la medición para el bloque y devuelve sus RequestMetrics
+
+    Con time_queries=False no cronometra las consultas (ver timing_queries).
+    El resto de las opciones se pasan a RequestMetrics.
+    """
+    metrics = RequestMetrics(**options)
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            if time_queries:
+                stack.enter_context(timing_queries(metrics))
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def view_label(view_func, request):
+    """
+    Nombre legible de la vista: "MatchTeamViewSet.by_team" para acciones de
+    ViewSets, "módulo.función" para el resto
+    """
+    view_class = getattr(view_func, "cls", None)
+    if view_class is not None:
+        actions = getattr(view_func, "actions", None) or {}
+        action = actions.get(request.method.lower(), request.method.lower())
+        return f"{view_class.__name__}.{action}"
+    view_class = getattr(view_func, "view_class", None)
+    if view_class is not None:
+        return f"{view_class.__module__}.{view_class.__name__}"
+    return f"{view_func.__module__}.{getattr(view_func, '__name__', view_func)}"
+
+
+def _timed_representation(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = _current_metrics.get()
+        # Solo se cronometra el serializer más externo (no los anidados)
+        if metrics is None or metrics.serializing:
+            return method(self, *args, **kwargs)
+        metrics.serializing = True
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            metrics.serializing = False
+            metrics.serialize_time += time.perf_counter() - started
+
+    wrapper.instrumented = True
+    return wrapper
+
+
+def instrument_serializers():
+    """
+    Cronometra to_representation de los serializers de DRF
+
+    Se instala una sola vez y solo si la instrumentación está activa; fuera
+    de un request medido el wrapper solo consulta el ContextVar.
+    """
+    from rest_framework import serializers
+
+    for serializer_class in (serializers.Serializer, serializers.ListSerializer):
+        method = serializer_class.to_representation
+        if not getattr(method, "instrumented", False):
+            serializer_class.to_representation = _timed_representation(method)
@@ -0,0 +1,184 @@
+"""
+Comando para medir los modos de conexión
+========================================
+
+Compara la latencia por request con cada modo de conexión a la base de
+datos (none, persistent y pool; ver project/db.py) sobre la misma base
+configurada en DATABASES["default"].
+
+Cada request se simula como en producción: se emiten request_started y
+request_finished, que abren, verifican, devuelven al pool o cierran la
+conexión según el modo. Sin --path la request solo ejecuta SELECT 1 (el
+costo de la conexión aislado); con --path pasa por el WSGIHandler completo.
+
+El modo pool necesita PostgreSQL con psycopg[pool]; si no está disponible
+se omite.
+
+Uso:
+    python manage.py benchmark_db_connections
+    python manage.py benchmark_db_connections --iterations 500 --mode none --mode pool
+    python manage.py benchmark_db_connections --path / --host copa.example.com
+"""
+
+import json
+import statistics
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+
+from api.benchmarks import percentile
+from project.db import CONNECTION_MODES, apply_connection_settings
+
+
+class Command(BaseCommand):
+    help = "Mide la latencia por request con y sin reutilizar conexiones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            action="append",
+            choices=CONNECTION_MODES,
+            help="Modo a medir, repetible (default: todos)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Requests medidas por modo (default: 200)",
+        )
+        parser.add_argument(
+            "--path",
+            type=str,
+            help="URL a pedir en cada request (default: solo SELECT 1)",
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            default="localhost",
+            help="Header Host de las requests con --path (default: localhost)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            help="Guarda los resultados en un archivo JSON",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 2:
+            raise CommandError("--iterations debe ser al menos 2")
+
+        original = dict(connection.settings_dict)
+        results = []
+        try:
+            for mode in options["mode"] or CONNECTION_MODES:
+                if mode == "pool" and not self.pool_available():
+                    self.stdout.write(
+                        self.style.WARNING(
+                            "pool omitido: requiere PostgreSQL y psycopg[pool]"
+                        )
+                    )
+                    continue
+                self.configure(apply_connection_settings(original, mode))
+                results.append(self.measure(mode, options))
+        finally:
+            self.configure(original)
+
+        self.print_results(results)
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as output:
+                json.dump(results, output, indent=2)
+
+    def pool_available(self):
+        if connection.vendor != "postgresql":
+            return False
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            return False
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        return is_psycopg3
+
+    def configure(self, database):
+        """Cierra la conexión (y el pool) y aplica la nueva configuración"""
+        connection.close()
+        if getattr(connection, "pool", None):
+            connection.close_pool()
+        connection.settings_dict.clear()
+        connection.settings_dict.update(database)
+
+    def measure(self, mode, options):
+        if options["path"]:
+            handler = WSGIHandler()
+            factory = RequestFactory()
+
+            def request():
+                environ = factory.get(
+                    options["path"], secure=True, HTTP_HOST=options["host"]
+                ).environ
+                response = handler(environ, lambda status, headers: None)
+                b"".join(response)
+                # Emite request_finished: cierra o devuelve la conexión
+                response.close()
+                return int(response.status_code)
+
+        else:
+
+            def request():
+                request_started.send(sender=self.__class__)
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                finally:
+                    request_finished.send(sender=self.__class__)
+                return 200
+
+        opened = []
+
+        def count_connection(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        connection_created.connect(count_connection)
+        try:
+            # Calentamiento: la primera conexión (o el pool) no se mide
+            status = request()
+            opened.clear()
+            timings = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                status = request()
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection_created.disconnect(count_connection)
+
+        connections = len(opened)
+        if mode == "pool":
+            # Con pool connection_created se emite en cada préstamo
+            connections = connection.pool.get_stats().get("connections_num", 0)
+        return {
+            "mode": mode,
+            "status": status,
+            "connections": connections,
+            "mean": statistics.fmean(timings),
+            "p50": percentile(timings, 50),
+            "p95": percentile(timings, 95),
+            "max": max(timings),
+        }
+
+    def print_results(self, results):
+        self.stdout.write(
+            f"{'modo':<12} {'status':>6} {'conexiones':>11} "
+            f"{'media ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'máx ms':>8}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['mode']:<12} {result['status']:>6} "
+                f"{result['connections']:>11} {result['mean']:>9.2f} "
+                f"{result['p50']:>8.2f} {result['p95']:>8.2f} {result['max']:>8.2f}"
+            )
@@ -0,0 +1,120 @@
+"""
+Comando para medir el arranque
+==============================
+
+Reporta cuánto tarda en importarse cada módulo al iniciar un proceso
+(django.setup() y, con --urls, las URLs del proyecto, como un worker al
+atender su primer request). Usa `python -X importtime` en un proceso nuevo
+con el mismo entorno y DJANGO_SETTINGS_MODULE.
+
+Muestra el tiempo total, los módulos más lentos (tiempo acumulado, con sus
+dependencias) y el total por paquete de primer nivel.
+
+Uso:
+    python manage.py profile_startup
+    python manage.py profile_startup --urls --top 30
+    python manage.py profile_startup --json arranque.json
+"""
+
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+SETUP_CODE = "import django; django.setup()"
+URLS_CODE = "from django.urls import get_resolver; get_resolver().url_patterns"
+
+
+def parse_importtime(output):
+    """
+    Líneas de -X importtime: [(módulo, propio µs, acumulado µs, nivel)]
+
+    El nivel (indentación) distingue los módulos importados directamente de
+    sus dependencias.
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|", 2)
+        level = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(own), int(cumulative), level))
+    return modules
+
+
+class Command(BaseCommand):
+    help = "Reporta el tiempo de importación de cada módulo al iniciar"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--urls",
+            action="store_true",
+            help="Carga también las URLs (vistas, serializers, admin)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Módulos más lentos a mostrar (default: 20)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            help="Guarda el reporte en un archivo JSON",
+        )
+
+    def handle(self, *args, **options):
+        code = SETUP_CODE + ("; " + URLS_CODE if options["urls"] else "")
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        )
+        if result.returncode:
+            raise CommandError(f"El proceso de prueba falló:\n{result.stderr}")
+
+        modules = parse_importtime(result.stderr)
+        total = sum(own for _, own, _, _ in modules)
+
+        packages = defaultdict(int)
+        for name, own, _, _ in modules:
+            packages[name.split(".")[0]] += own
+        slowest = sorted(modules, key=lambda module: module[2], reverse=True)
+
+        self.stdout.write(
+            f"{len(modules)} módulos importados en {total / 1000:.1f} ms\n"
+        )
+        self.stdout.write(f"{'acumulado ms':>12} {'propio ms':>10}  módulo")
+        for name, own, cumulative, level in slowest[: options["top"]]:
+            self.stdout.write(
+                f"{cumulative / 1000:>12.1f} {own / 1000:>10.1f}  "
+                f"{'  ' * level}{name}"
+            )
+
+        self.stdout.write(f"\n{'total ms':>12}  paquete")
+        top_packages = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for package, own in top_packages[: options["top"]]:
+            self.stdout.write(f"{own / 1000:>12.1f}  {package}")
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as output:
+                json.dump(
+                    {
+                        "total_ms": total / 1000,
+                        "modules": [
+                            {
+                                "module": name,
+                                "self_ms": own / 1000,
+                                "cumulative_ms": cumulative / 1000,
+                            }
+                            for name, own, cumulative, _ in slowest
+                        ],
+                        "packages": dict(top_packages),
+                    },
+                    output,
+                    indent=2,
+                )
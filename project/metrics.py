@@ -0,0 +1,280 @@
+"""
+Métricas de la Aplicación
+=========================
+
+Registro de métricas en memoria alimentado por RequestInstrumentationMiddleware
+y expuesto en formato de texto de Prometheus en /metrics/ (solo staff; 404 si
+METRICS_ENABLED está apagado).
+
+Métricas por vista (ej: view="MatchViewSet.by_date"):
+- donbosco_requests_total{view, method, status}
+- donbosco_request_duration_seconds (histograma)
+- donbosco_db_queries_total / donbosco_db_query_seconds_total
+- donbosco_cache_requests_total{view, result="hit|miss"}
+
+Modo multiproceso: con METRICS_MULTIPROCESS_DIR cada worker de gunicorn
+vuelca su registro a un archivo JSON propio (como máximo cada
+METRICS_FLUSH_INTERVAL segundos y al terminar) y el endpoint suma los
+archivos de todos los workers. El directorio debe vaciarse al desplegar.
+"""
+
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.permissions import IsAdminUser
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+# Límites del histograma de latencia (segundos)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsRegistry:
+    """Contadores e histogramas por vista, seguros entre hilos"""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = defaultdict(int)
+        self.durations = {}
+        self.queries = defaultdict(int)
+        self.db_seconds = defaultdict(float)
+        self.cache = defaultdict(int)
+
+    def observe(self, view, method, status, metrics):
+        """Registra un request medido (RequestMetrics ya finalizado)"""
+        view = view or "unresolved"
+        duration = metrics.ended - metrics.started
+        with self.lock:
+            self.requests[(view, method, str(status))] += 1
+
+            histogram = self.durations.get(view)
+            if histogram is None:
+                histogram = self.durations[view] = {
+                    "buckets": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    histogram["buckets"][index] += 1
+            histogram["sum"] += duration
+            histogram["count"] += 1
+
+            self.queries[view] += metrics.queries
+            self.db_seconds[view] += metrics.db_time
+            if metrics.cache_hits:
+                self.cache[(view, "hit")] += metrics.cache_hits
+            if metrics.cache_misses:
+                self.cache[(view, "miss")] += metrics.cache_misses
+
+    def snapshot(self):
+        """Estado del registro serializable a JSON"""
+        with self.lock:
+            return {
+                "buckets": list(self.buckets),
+                "requests": [[*key, count] for key, count in self.requests.items()],
+                "durations": {
+                    view: {**histogram, "buckets": list(histogram["buckets"])}
+                    for view, histogram in self.durations.items()
+                },
+                "queries": dict(self.queries),
+                "db_seconds": dict(self.db_seconds),
+                "cache": [[*key, count] for key, count in self.cache.items()],
+            }
+
+
+def merge_snapshots(snapshots):
+    """Suma los snapshots de varios workers en uno"""
+    merged = MetricsRegistry()
+    for snapshot in snapshots:
+        if tuple(snapshot.get("buckets", ())) != merged.buckets:
+            continue
+        for view, method, status, count in snapshot["requests"]:
+            merged.requests[(view, method, status)] += count
+        for view, histogram in snapshot["durations"].items():
+            target = merged.durations.setdefault(
+                view, {"buckets": [0] * len(merged.buckets), "sum": 0.0, "count": 0}
+            )
+            target["buckets"] = [
+                total + count
+                for total, count in zip(target["buckets"], histogram["buckets"])
+            ]
+            target["sum"] += histogram["sum"]
+            target["count"] += histogram["count"]
+        for view, count in snapshot["queries"].items():
+            merged.queries[view] += count
+        for view, seconds in snapshot["db_seconds"].items():
+            merged.db_seconds[view] += seconds
+        for view, result, count in snapshot["cache"]:
+            merged.cache[(view, result)] += count
+    return merged.snapshot()
+
+
+class SharedFileExporter:
+    """
+    Vuelca el registro del worker a METRICS_MULTIPROCESS_DIR
+
+    El nombre del archivo incluye pid y momento de inicio para que un worker
+    nuevo con el mismo pid no pise los contadores de uno anterior.
+    """
+
+    def __init__(self, registry, directory, interval):
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self.path = os.path.join(
+            directory, f"metrics-{os.getpid()}-{time.time_ns()}.json"
+        )
+        self.last_flush = 0.0
+        self.flush_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        atexit.register(self.flush)
+
+    def maybe_flush(self):
+        if time.monotonic() - self.last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        with self.flush_lock:
+            self.last_flush = time.monotonic()
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as output:
+                json.dump(self.registry.snapshot(), output)
+            os.replace(temporary, self.path)
+
+    def collect(self):
+        """Snapshots de todos los workers (incluido este, recién volcado)"""
+        self.flush()
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                with open(path, encoding="utf-8") as snapshot_file:
+                    snapshots.append(json.load(snapshot_file))
+            except (OSError, ValueError):
+                # Archivo de un worker a medio escribir o borrado
+                continue
+        return snapshots
+
+
+registry = MetricsRegistry()
+_exporter = None
+
+
+def _get_exporter():
+    global _exporter
+    if _exporter is None and settings.METRICS_MULTIPROCESS_DIR:
+        _exporter = SharedFileExporter(
+            registry,
+            settings.METRICS_MULTIPROCESS_DIR,
+            settings.METRICS_FLUSH_INTERVAL,
+        )
+    return _exporter
+
+
+def record_request(request, response, metrics):
+    """Registra un request medido y, en modo multiproceso, lo vuelca"""
+    registry.observe(metrics.view_name, request.method, response.status_code, metrics)
+    exporter = _get_exporter()
+    if exporter is not None:
+        exporter.maybe_flush()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+def render_prometheus(snapshot):
+    """Texto de exposición de Prometheus para un snapshot"""
+    lines = [
+        "# HELP donbosco_requests_total Requests atendidos por vista",
+        "# TYPE donbosco_requests_total counter",
+    ]
+    for view, method, status, count in sorted(snapshot["requests"]):
+        lines.append(
+            f"donbosco_requests_total{_labels(view=view, method=method, status=status)} {count}"
+        )
+
+    lines += [
+        "# HELP donbosco_request_duration_seconds Latencia de los requests por vista",
+        "# TYPE donbosco_request_duration_seconds histogram",
+    ]
+    for view, histogram in sorted(snapshot["durations"].items()):
+        for bound, count in zip(snapshot["buckets"], histogram["buckets"]):
+            lines.append(
+                "donbosco_request_duration_seconds_bucket"
+                f"{_labels(view=view, le=bound)} {count}"
+            )
+        lines += [
+            "donbosco_request_duration_seconds_bucket"
+            f"{_labels(view=view, le='+Inf')} {histogram['count']}",
+            f"donbosco_request_duration_seconds_sum{_labels(view=view)} {histogram['sum']}",
+            f"donbosco_request_duration_seconds_count{_labels(view=view)} {histogram['count']}",
+        ]
+
+    lines += [
+        "# HELP donbosco_db_queries_total Consultas SQL ejecutadas por vista",
+        "# TYPE donbosco_db_queries_total counter",
+    ]
+    for view, count in sorted(snapshot["queries"].items()):
+        lines.append(f"donbosco_db_queries_total{_labels(view=view)} {count}")
+
+    lines += [
+        "# HELP donbosco_db_query_seconds_total Tiempo en consultas SQL por vista",
+        "# TYPE donbosco_db_query_seconds_total counter",
+    ]
+    for view, seconds in sorted(snapshot["db_seconds"].items()):
+        lines.append(f"donbosco_db_query_seconds_total{_labels(view=view)} {seconds}")
+
+    lines += [
+        "# HELP donbosco_cache_requests_total Lecturas de caché por vista y resultado",
+        "# TYPE donbosco_cache_requests_total counter",
+    ]
+    for view, result, count in sorted(snapshot["cache"]):
+        lines.append(
+            f"donbosco_cache_requests_total{_labels(view=view, result=result)} {count}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+@api_view(["GET"])
+@authentication_classes([JWTAuthentication, SessionAuthentication])
+@permission_classes([IsAdminUser])
+def metrics_view(request):
+    """Métricas en formato Prometheus (solo usuarios staff)"""
+    if not settings.METRICS_ENABLED:
+        raise Http404("Métricas deshabilitadas (METRICS_ENABLED)")
+    exporter = _get_exporter()
+    if exporter is not None:
+        snapshot = merge_snapshots(exporter.collect())
+    else:
+        snapshot = registry.snapshot()
+    return HttpResponse(
+        render_prometheus(snapshot), content_type=PROMETHEUS_CONTENT_TYPE
+    )
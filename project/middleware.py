@@ -0,0 +1,232 @@
+"""
+Middleware de Instrumentación
+=============================
+
+RequestInstrumentationMiddleware mide cada request de las rutas en
+INSTRUMENTATION_PATH_PREFIXES (ver project/instrumentation.py) y:
+
+- SERVER_TIMING_ENABLED: agrega el header Server-Timing (db, serialize,
+  view, render, total) y escribe una línea de log JSON en el logger
+  "project.requests"
+- METRICS_ENABLED: registra el request en las métricas de /metrics/
+  (ver project/metrics.py)
+- SLOW_REQUEST_THRESHOLD_MS / SLOW_QUERY_THRESHOLD_MS: registra los
+  requests y consultas lentos (ver project/slowlog.py)
+
+Si ninguna opción está activa el middleware se desactiva al iniciar
+(MiddlewareNotUsed) y no agrega ningún costo a los requests.
+
+ReplicaRoutingMiddleware (DB_REPLICA_HOSTS) envía las lecturas de los
+requests seguros a las réplicas (ver project/replicas.py).
+
+ProfilingMiddleware (PROFILING_ENABLED) perfila los requests de staff que lo
+piden con ?_profile (ver project/profiling.py).
+
+Los tres son sincrónicos y asíncronos: bajo ASGI (ASGI_SERVER) no obligan a
+pasar cada request por un hilo.
+"""
+
+import json
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from . import profiling, replicas, slowlog
+from .instrumentation import (
+    collect_metrics,
+    current_metrics,
+    instrument_serializers,
+    timing_queries,
+    view_label,
+)
+from .metrics import record_request
+
+logger = logging.getLogger("project.requests")
+
+
+def server_timing_header(metrics):
+    """Valor del header Server-Timing (duraciones en ms)"""
+    data = metrics.as_dict()
+    return ", ".join(
+        [
+            f'db;dur={data["db_ms"]};desc="{data["queries"]} queries"',
+            f"serialize;dur={data['serialize_ms']}",
+            f"view;dur={data['view_ms']}",
+            f"render;dur={data['render_ms']}",
+            f"total;dur={data['total_ms']}",
+        ]
+    )
+
+
+class RequestInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.server_timing = settings.SERVER_TIMING_ENABLED
+        self.metrics = settings.METRICS_ENABLED
+        self.slow_log = bool(
+            settings.SLOW_REQUEST_THRESHOLD_MS or settings.SLOW_QUERY_THRESHOLD_MS
+        )
+        if not (self.server_timing or self.metrics or self.slow_log):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.path_prefixes = tuple(settings.INSTRUMENTATION_PATH_PREFIXES)
+        self.metrics_options = {
+            "slow_query_threshold": (
+                settings.SLOW_QUERY_THRESHOLD_MS / 1000
+                if settings.SLOW_QUERY_THRESHOLD_MS
+                else None
+            ),
+            "track_slowest": bool(settings.SLOW_REQUEST_THRESHOLD_MS),
+        }
+        instrument_serializers()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not request.path.startswith(self.path_prefixes):
+            return self.get_response(request)
+
+        with collect_metrics(**self.metrics_options) as metrics:
+            response = self.get_response(request)
+        metrics.finish()
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request):
+        if not request.path.startswith(self.path_prefixes):
+            return await self.get_response(request)
+
+        with collect_metrics(time_queries=False, **self.metrics_options) as metrics:
+            # Las consultas corren en el hilo del request, no en el event loop
+            queries = timing_queries(metrics)
+            await sync_to_async(queries.__enter__)()
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(queries.__exit__)(None, None, None)
+        metrics.finish()
+        # Solo memoria y logging: no bloquea el event loop
+        return self.report(request, response, metrics)
+
+    def report(self, request, response, metrics):
+        if self.metrics:
+            record_request(request, response, metrics)
+
+        if self.slow_log:
+            slowlog.report(request, response, metrics)
+
+        if self.server_timing:
+            response["Server-Timing"] = server_timing_header(metrics)
+            logger.info(
+                json.dumps(
+                    {
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        **metrics.as_dict(),
+                    }
+                )
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.start_view(view_label(view_func, request))
+
+    def process_template_response(self, request, response):
+        # Las respuestas de DRF se renderizan después de este punto
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.end_view()
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    # Sincrónico y asíncrono: bajo ASGI no obliga a pasar el request a un hilo
+    sync_capable = True
+    async_capable = True
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.cookie = settings.REPLICA_PIN_COOKIE
+        self.pin_seconds = settings.REPLICA_PIN_SECONDS
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.routing(request):
+            response = self.get_response(request)
+        return self.pin(request, response)
+
+    async def __acall__(self, request):
+        with self.routing(request):
+            response = await self.get_response(request)
+        return self.pin(request, response)
+
+    def routing(self, request):
+        return replicas.reading_from_replicas(
+            request.method in self.safe_methods and self.cookie not in request.COOKIES
+        )
+
+    def pin(self, request, response):
+        if request.method not in self.safe_methods:
+            # Las próximas lecturas de este navegador ven lo recién escrito
+            response.set_cookie(
+                self.cookie,
+                "1",
+                max_age=self.pin_seconds,
+                secure=request.is_secure(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.path_prefixes = tuple(settings.INSTRUMENTATION_PATH_PREFIXES)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        mode = self.requested_mode(request)
+        if mode is None or not profiling.is_profiling_allowed(request):
+            return self.get_response(request)
+        return profiling.profiled_response(self.get_response, request, mode)
+
+    async def __acall__(self, request):
+        mode = self.requested_mode(request)
+        # is_profiling_allowed consulta la base (sesión o JWT)
+        if mode is None or not await sync_to_async(profiling.is_profiling_allowed)(
+            request
+        ):
+            return await self.get_response(request)
+        return await profiling.aprofiled_response(self.get_response, request, mode)
+
+    def requested_mode(self, request):
+        """Modo de ?_profile pedido, o None si el request no se perfila"""
+        mode = request.GET.get(profiling.PROFILE_PARAM)
+        if mode in profiling.PROFILE_MODES and request.path.startswith(
+            self.path_prefixes
+        ):
+            return mode
+        return None
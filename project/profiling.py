@@ -0,0 +1,264 @@
+"""
+Perfilado a Pedido
+==================
+
+Permite a usuarios staff perfilar cualquier request de la API o del admin
+agregando el parámetro ?_profile a la URL:
+
+- ?_profile=1: la respuesta se reemplaza por el reporte en texto
+- ?_profile=store: la respuesta es la normal; el perfil se guarda en
+  PROFILING_DIR (.prof para snakeviz/pstats y .txt con el reporte) y su
+  nombre se devuelve en el header X-Profile-File
+
+Si el perfilador no puede activarse (otro perfil en curso) el request se
+atiende igual, sin perfilar, con el header X-Profile-Skipped.
+
+El reporte incluye las funciones más costosas (tiempo propio y acumulado),
+el árbol de llamadas de las más costosas y la lista de consultas SQL con su
+duración. Usa cProfile (determinístico, incluido en Python).
+
+Lo activa PROFILING_ENABLED; sin el parámetro el costo por request es leer
+el query string (ver ProfilingMiddleware en project/middleware.py).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.text import slugify
+
+PROFILE_PARAM = "_profile"
+
+# Valores del parámetro: reporte como respuesta o guardado en disco
+PROFILE_MODES = ("1", "store")
+
+# Filas por sección del reporte
+REPORT_LIMIT = 30
+
+# Funciones cuyo árbol de llamadas se incluye en el reporte
+CALL_TREE_LIMIT = 10
+
+# Header de la respuesta normal cuando el request no pudo perfilarse
+SKIPPED_HEADER = "X-Profile-Skipped"
+
+# Un perfil por vez en el proceso (ver _start_profiler)
+_profiling_lock = threading.Lock()
+
+
+class QueryLog:
+    """execute_wrapper que guarda cada consulta con su duración"""
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                (time.perf_counter() - started, self.alias, sql, params)
+            )
+
+
+def is_profiling_allowed(request):
+    """Solo staff: sesión (admin) o JWT (API)"""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+    try:
+        authenticated = JWTAuthentication().authenticate(request)
+    except (InvalidToken, TokenError):
+        return False
+    return authenticated is not None and authenticated[0].is_staff
+
+
+@contextmanager
+def logging_queries():
+    """Guarda las consultas del bloque en las conexiones del hilo actual"""
+    logs = [QueryLog(connection.alias) for connection in connections.all()]
+    with ExitStack() as stack:
+        for connection, log in zip(connections.all(), logs):
+            stack.enter_context(connection.execute_wrapper(log))
+        yield logs
+
+
+def _start_profiler(profiler):
+    """
+    Activa el perfilador si no hay otro perfil en curso en el proceso
+
+    Desde Python 3.12 cProfile no admite dos perfiladores activos a la vez,
+    ni en hilos distintos (ValueError): con workers de hilos dos requests
+    perfilados en paralelo chocarían. Se perfila uno por vez; el lock no
+    espera.
+
+    Returns:
+        True si quedó activo (liberarlo con _stop_profiler)
+    """
+    if not _profiling_lock.acquire(blocking=False):
+        return False
+    try:
+        profiler.enable()
+    except ValueError:
+        # Otro perfilador activo fuera de este módulo
+        _profiling_lock.release()
+        return False
+    return True
+
+
+def _stop_profiler(profiler):
+    try:
+        profiler.disable()
+    finally:
+        _profiling_lock.release()
+
+
+def profile_request(get_response, request):
+    """
+    Ejecuta el request bajo cProfile
+
+    Returns:
+        Tupla (respuesta, pstats.Stats, consultas), o None si hay otro
+        perfil en curso (el request no se ejecutó)
+    """
+    profiler = cProfile.Profile()
+    if not _start_profiler(profiler):
+        return None
+    try:
+        with logging_queries() as logs:
+            response = get_response(request)
+    finally:
+        _stop_profiler(profiler)
+
+    queries = [query for log in logs for query in log.queries]
+    return response, pstats.Stats(profiler), queries
+
+
+async def aprofile_request(get_response, request):
+    """
+    Versión async de profile_request (ASGI)
+
+    Un solo perfilador, activado en el hilo del request, donde corren las
+    vistas sync y el ORM (sync_to_async). Desde Python 3.12 cProfile registra
+    todos los hilos y el reporte incluye también el event loop (con lo que
+    hagan en paralelo otros requests async del worker); en 3.11 solo ese
+    hilo.
+
+    Returns:
+        Tupla (respuesta, pstats.Stats, consultas), o None si hay otro
+        perfil en curso (el request no se ejecutó)
+    """
+    profiler = cProfile.Profile()
+    queries = logging_queries()
+
+    def start():
+        if not _start_profiler(profiler):
+            return None
+        return queries.__enter__()
+
+    def stop():
+        try:
+            queries.__exit__(None, None, None)
+        finally:
+            _stop_profiler(profiler)
+
+    logs = await sync_to_async(start)()
+    if logs is None:
+        return None
+    try:
+        response = await get_response(request)
+    finally:
+        await sync_to_async(stop)()
+
+    queries = [query for log in logs for query in log.queries]
+    return response, pstats.Stats(profiler), queries
+
+
+def skipped_response(response):
+    """Respuesta normal de un request que no pudo perfilarse"""
+    response[SKIPPED_HEADER] = "otro perfil en curso"
+    return response
+
+
+def build_report(request, response, stats, queries):
+    """Reporte en texto: resumen, funciones más costosas, árbol y SQL"""
+    output = io.StringIO()
+    db_time = sum(duration for duration, _, _, _ in queries)
+    output.write(
+        f"{request.method} {request.get_full_path()} -> {response.status_code}\n"
+        f"Tiempo total: {stats.total_tt * 1000:.1f} ms | "
+        f"Consultas SQL: {len(queries)} ({db_time * 1000:.1f} ms)\n"
+    )
+
+    stats.stream = output
+    output.write("\n=== Funciones más costosas (tiempo propio) ===\n")
+    stats.sort_stats("tottime").print_stats(REPORT_LIMIT)
+    output.write("\n=== Funciones más costosas (tiempo acumulado) ===\n")
+    stats.sort_stats("cumulative").print_stats(REPORT_LIMIT)
+    output.write("\n=== Árbol de llamadas ===\n")
+    stats.sort_stats("cumulative").print_callees(CALL_TREE_LIMIT)
+
+    output.write("\n=== Consultas SQL ===\n")
+    for index, (duration, alias, sql, params) in enumerate(queries, start=1):
+        output.write(f"{index}. [{alias}] {duration * 1000:.2f} ms\n{sql}\n")
+        if params:
+            output.write(f"   params: {params!r}\n")
+    return output.getvalue()
+
+
+def store_profile(request, report, stats):
+    """Guarda el perfil en PROFILING_DIR y devuelve el nombre base del archivo"""
+    os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+    name = "{}-{}".format(
+        timezone.now().strftime("%Y%m%d-%H%M%S-%f"),
+        slugify(request.path)[:80] or "root",
+    )
+    path = os.path.join(settings.PROFILING_DIR, name)
+    stats.dump_stats(f"{path}.prof")
+    with open(f"{path}.txt", "w", encoding="utf-8") as report_file:
+        report_file.write(report)
+    return name
+
+
+def report_response(request, response, stats, queries, mode):
+    """Respuesta del request perfilado según el modo pedido"""
+    report = build_report(request, response, stats, queries)
+
+    if mode == "store":
+        response["X-Profile-File"] = store_profile(request, report, stats)
+        return response
+
+    return HttpResponse(report, content_type="text/plain; charset=utf-8")
+
+
+def profiled_response(get_response, request, mode):
+    """Perfila el request y devuelve la respuesta según el modo pedido"""
+    result = profile_request(get_response, request)
+    if result is None:
+        return skipped_response(get_response(request))
+    response, stats, queries = result
+    return report_response(request, response, stats, queries, mode)
+
+
+async def aprofiled_response(get_response, request, mode):
+    """Versión async de profiled_response (ASGI)"""
+    result = await aprofile_request(get_response, request)
+    if result is None:
+        return skipped_response(await get_response(request))
+    response, stats, queries = result
+    # El reporte escribe en disco con ?_profile=store
+    return await sync_to_async(report_response)(request, response, stats, queries, mode)
@@ -0,0 +1,70 @@
+"""
+Réplicas de Lectura
+===================
+
+Con réplicas configuradas (DB_REPLICA_HOSTS en el .env) las lecturas de los
+requests GET/HEAD/OPTIONS van a una réplica al azar y todo lo demás sigue en
+la base principal ("default"): así el público consultando resultados no
+compite con los planilleros cargándolos.
+
+Lectura de lo propio escrito: después de un POST/PUT/PATCH/DELETE, el
+ReplicaRoutingMiddleware deja la cookie REPLICA_PIN_COOKIE durante
+REPLICA_PIN_SECONDS y, mientras exista, ese navegador lee de la principal
+(la réplica puede estar unos instantes atrasada).
+
+Fuera de un request (comandos, shell, tareas) y dentro de transacciones
+todo va a la principal. Las migraciones solo corren en la principal.
+
+Lo que se guarda en la caché (cuadro eliminatorio, dashboard del admin) se
+calcula con reading_from_replicas(False): si se leyera de una réplica
+atrasada justo después de invalidarlo, la caché volvería a quedar vieja.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# True durante un request que puede leer de una réplica
+_use_replica = ContextVar("use_replica", default=False)
+
+
+@contextmanager
+def reading_from_replicas(enabled=True):
+    """Permite (o no) leer de réplicas dentro del bloque"""
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    """Router de DATABASE_ROUTERS: lecturas a réplicas, escrituras a default"""
+
+    def __init__(self):
+        self.replicas = list(settings.DATABASE_REPLICAS)
+        self.databases = {DEFAULT_DB_ALIAS, *self.replicas}
+
+    def db_for_read(self, model, **hints):
+        if (
+            not self.replicas
+            or not _use_replica.get()
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas y principal tienen los mismos datos
+        if {obj1._state.db, obj2._state.db} <= self.databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
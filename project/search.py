@@ -0,0 +1,147 @@
+"""
+Búsqueda de Texto Completo
+==========================
+
+En SQLite las búsquedas de jugadores (API y admin) usan el índice FTS5
+teams_player_fts (migración teams 0005) en lugar de un LIKE '%...%' sobre
+seis columnas, que recorre la tabla entera.
+
+Cada palabra buscada es un prefijo: "gonz 301" encuentra a Gonzalo con DNI
+30112233. Sin acentos ni mayúsculas (unicode61 remove_diacritics).
+
+En otras bases (o con SQLITE_FULL_TEXT_SEARCH=False) full_text_filter()
+devuelve None y se usa la búsqueda habitual de Django/DRF.
+
+Los triggers que mantienen el índice se pierden cuando una migración
+reconstruye la tabla de jugadores en SQLite (cualquier AlterField): después
+de cada migrate ensure_full_text_triggers() los vuelve a crear y reconstruye
+el índice (ver project/signals.py).
+
+El filtro de DRF está en api/filters: este módulo lo importa el admin y no
+carga DRF.
+"""
+
+from django.conf import settings
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+# Modelo (label_lower) -> tabla FTS5 con su texto
+FULL_TEXT_TABLES = {"teams.player": "teams_player_fts"}
+
+# Tabla FTS5 -> (tabla de contenido, columnas indexadas), como en la migración
+FULL_TEXT_CONTENT = {
+    "teams_player_fts": (
+        "teams_player",
+        (
+            "first_name",
+            "last_name",
+            "dni",
+            "jersey_number",
+            "phone_number",
+            "profession",
+        ),
+    ),
+}
+
+_available_tables = {}
+
+
+def fts_query(search_term):
+    """Consulta MATCH: cada palabra como prefijo entre comillas (AND)"""
+    words = [word.replace('"', "") for word in search_term.split()]
+    return " ".join(f'"{word}"*' for word in words if word)
+
+
+def _table_available(alias, table):
+    if (alias, table) not in _available_tables:
+        connection = connections[alias]
+        with connection.cursor() as cursor:
+            tables = connection.introspection.table_names(cursor)
+        _available_tables[alias, table] = table in tables
+    return _available_tables[alias, table]
+
+
+def full_text_filter(queryset, search_term):
+    """
+    Filtra el queryset con el índice FTS5 de su modelo
+
+    Returns:
+        Queryset filtrado, o None si no hay índice (usar la búsqueda normal)
+    """
+    table = FULL_TEXT_TABLES.get(queryset.model._meta.label_lower)
+    query = fts_query(search_term)
+    if (
+        table is None
+        or not query
+        or not settings.SQLITE_FULL_TEXT_SEARCH
+        or connections[queryset.db].vendor != "sqlite"
+        or not _table_available(queryset.db, table)
+    ):
+        return None
+    return queryset.filter(
+        pk__in=RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [query])
+    )
+
+
+def full_text_triggers(table):
+    """
+    CREATE TRIGGER de una tabla FTS5 de contenido externo: {nombre: sql}
+
+    Mismos nombres y cuerpo que los de la migración teams 0005, con IF NOT
+    EXISTS para poder ejecutarlos otra vez.
+    """
+    content_table, columns = FULL_TEXT_CONTENT[table]
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert = f"INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new_values});"
+    delete = (
+        f"INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    bodies = {
+        "insert": ("INSERT", insert),
+        "delete": ("DELETE", delete),
+        "update": ("UPDATE", f"{delete} {insert}"),
+    }
+    return {
+        f"{table}_{suffix}": (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_{suffix} "
+            f"AFTER {event} ON {content_table} BEGIN {body} END"
+        )
+        for suffix, (event, body) in bodies.items()
+    }
+
+
+def ensure_full_text_triggers(alias):
+    """
+    Vuelve a crear los triggers que falten y reconstruye esos índices
+
+    En SQLite un AlterField reconstruye la tabla (crea una nueva, copia los
+    datos y la renombra) y los triggers de la tabla vieja se pierden sin
+    error: el índice deja de seguir las altas y cambios. Las escrituras
+    hechas sin triggers no están en el índice, por eso se reconstruye.
+
+    Returns:
+        Tablas FTS5 reparadas
+    """
+    connection = connections[alias]
+    if connection.vendor != "sqlite":
+        return []
+
+    repaired = []
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        existing = {row[0] for row in cursor.fetchall()}
+        for table in FULL_TEXT_CONTENT:
+            if table not in tables:
+                continue
+            triggers = full_text_triggers(table)
+            if set(triggers) <= existing:
+                continue
+            for sql in triggers.values():
+                cursor.execute(sql)
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            repaired.append(table)
+    return repaired
@@ -7,11 +7,9 @@ DEVELOPMENT_ENVIRONMENT = (
 )
 
 # Enviroments deberia devolver un bool
+# Sin print: cada proceso (workers, comandos) importa los settings y la salida
+# de los comandos debe quedar limpia
 if DEVELOPMENT_ENVIRONMENT:
-    print("entorno de desarrollo")
     from .dev import *
-
-    print("Configuración de desarrollo cargada")
 else:
-    print("entorno de produccion")
     from .prod import *
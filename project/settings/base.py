@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 # Importando Librerias para caonfiguracion base del proyecto
 import json
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -50,7 +51,8 @@ ALLOWED_HOSTS = config(
 # Application definition
 
 DJANGO_APPS = (
-    "django.contrib.admin",
+    # Admin con dashboard (project/apps.py)
+    "project.apps.CopaDonBoscoAdminConfig",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -67,10 +69,12 @@ DJANGO_APPS = (
 )
 
 # Aplicaciones de Terceros
-THIRD_PARTY_APPS = (
+THIRD_PARTY_APPS = ("dj_rest_auth",)
+
+# Solo en desarrollo (dev.py): no se cargan en los workers de producción
+DEV_APPS = (
     "crispy_forms",
     "crispy_bootstrap5",
-    "dj_rest_auth",
     "django_extensions",  # Para comandos como show_urls
 )
 
@@ -87,6 +91,11 @@ LOCAL_APPS = (
 INSTALLED_APPS = THIRD_PARTY_APPS + DJANGO_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    # Primero para medir el request completo (se desactiva si no se usa)
+    "project.middleware.RequestInstrumentationMiddleware",
+    # Antes de sesiones y autenticación, que ya leen la base (se desactiva
+    # sin réplicas)
+    "project.middleware.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Para archivos estáticos
     "corsheaders.middleware.CorsMiddleware",  # 🚀 Agrega esta línea aquí
@@ -94,6 +103,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Después de la autenticación para saber si el usuario es staff
+    "project.middleware.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -179,6 +190,74 @@ STATIC_ROOT = os.path.join(
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Caché en disco: compartida entre los workers de gunicorn del mismo servidor
+CACHES = {
+    "default": {
+        # FileBasedCache que cuenta aciertos/fallos para las métricas
+        "BACKEND": "project.cache.InstrumentedFileBasedCache",
+        "LOCATION": config(
+            "CACHE_DIR",
+            default=os.path.join(tempfile.gettempdir(), "donbosco_cup_cache"),
+        ),
+    }
+}
+
+# Instrumentación de requests (project/middleware.py): header Server-Timing y
+# log JSON con consultas SQL y tiempos de cada request de la API y del admin
+SERVER_TIMING_ENABLED = config("SERVER_TIMING_ENABLED", default=False, cast=bool)
+INSTRUMENTATION_PATH_PREFIXES = ("/api/", "/admin/")
+
+# Métricas por vista en formato Prometheus en /metrics/ (solo staff). Con
+# varios workers de gunicorn, METRICS_MULTIPROCESS_DIR es un directorio
+# compartido (vaciarlo en cada despliegue) donde cada worker vuelca las suyas
+METRICS_ENABLED = config("METRICS_ENABLED", default=False, cast=bool)
+METRICS_MULTIPROCESS_DIR = config("METRICS_MULTIPROCESS_DIR", default="")
+METRICS_FLUSH_INTERVAL = config("METRICS_FLUSH_INTERVAL", default=5, cast=int)
+
+# Log de lentitud (logger "project.slow"): requests y consultas SQL que superan
+# estos umbrales en milisegundos (0 = desactivado). En PostgreSQL se guarda
+# además el EXPLAIN de las consultas lentas, calculado en segundo plano
+SLOW_REQUEST_THRESHOLD_MS = config("SLOW_REQUEST_THRESHOLD_MS", default=0, cast=int)
+SLOW_QUERY_THRESHOLD_MS = config("SLOW_QUERY_THRESHOLD_MS", default=0, cast=int)
+SLOW_QUERY_EXPLAIN = config("SLOW_QUERY_EXPLAIN", default=True, cast=bool)
+
+# Perfilado a pedido (project/profiling.py): los usuarios staff agregan
+# ?_profile=1 (reporte como respuesta) o ?_profile=store (guardado en
+# PROFILING_DIR) a cualquier request de la API o del admin
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=False, cast=bool)
+PROFILING_DIR = config(
+    "PROFILING_DIR",
+    default=os.path.join(tempfile.gettempdir(), "donbosco_cup_profiles"),
+)
+
+# Motor de base de datos: "postgresql" o "sqlite" (un solo servidor, con WAL
+# y pragmas ajustados; ver project/db.py). En SQLite la búsqueda de jugadores
+# usa el índice FTS5 (project/search.py)
+DB_ENGINE = config("DB_ENGINE", default="postgresql")
+if DB_ENGINE not in ("postgresql", "sqlite"):
+    raise ImproperlyConfigured(f"DB_ENGINE inválido: {DB_ENGINE!r}")
+SQLITE_PATH = config("SQLITE_PATH", default=str(BASE_DIR / "db.sqlite3"))
+SQLITE_MMAP_SIZE = config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int)
+SQLITE_CACHE_KB = config("SQLITE_CACHE_KB", default=64 * 1024, cast=int)
+SQLITE_FULL_TEXT_SEARCH = config("SQLITE_FULL_TEXT_SEARCH", default=True, cast=bool)
+
+# Perfil ASGI (project/gunicorn_asgi.py): el proceso corre bajo uvicorn y las
+# lecturas más consultadas de la API se atienden con vistas async
+ASGI_SERVER = config("ASGI_SERVER", default=False, cast=bool)
+if ASGI_SERVER:
+    # WhiteNoise es solo sincrónico: haría pasar cada request por un hilo. Bajo
+    # ASGI los estáticos los sirve Nginx
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
+# Réplicas de lectura (project/replicas.py): alias de DATABASES que reciben
+# las lecturas de los requests GET. Los definen dev.py/prod.py; sin réplicas
+# el router y su middleware no hacen nada. Tras una escritura el navegador
+# lee de la principal durante REPLICA_PIN_SECONDS
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ["project.replicas.ReplicaRouter"]
+REPLICA_PIN_COOKIE = "db_pin"
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=5, cast=int)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
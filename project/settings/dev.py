@@ -1,5 +1,9 @@
+import importlib.util
+
 from decouple import config
 
+from project.db import sqlite_database
+
 from .base import *
 
 # Configuración de desarrollo
@@ -9,21 +13,34 @@ from .base import *
 # ALLOWED_HOSTS ya se lee desde base.py
 # ALLOWED_HOSTS ya está configurado en base.py desde el .env
 
-# Base de datos PostgreSQL para desarrollo
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": config("DB_NAME"),
-        "USER": config("DB_USER"),
-        "PASSWORD": config("DB_PASSWORD"),
-        "HOST": config("DB_HOST"),
-        "PORT": config("DB_PORT"),
+# Base de datos PostgreSQL para desarrollo (o SQLite con DB_ENGINE=sqlite)
+if DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": sqlite_database(
+            SQLITE_PATH, mmap_size=SQLITE_MMAP_SIZE, cache_size_kb=SQLITE_CACHE_KB
+        )
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": config("DB_NAME"),
+            "USER": config("DB_USER"),
+            "PASSWORD": config("DB_PASSWORD"),
+            "HOST": config("DB_HOST"),
+            "PORT": config("DB_PORT"),
+        }
     }
-}
 
 # SECRET_KEY para desarrollo - ya se lee desde base.py
 # SECRET_KEY ya está configurado en base.py desde el .env
 
+# Aplicaciones solo de desarrollo (ver DEV_APPS en base.py), si están
+# instaladas: requirements-dev.txt las trae, requirements.txt no
+INSTALLED_APPS = (
+    tuple(app for app in DEV_APPS if importlib.util.find_spec(app)) + INSTALLED_APPS
+)
+
 # Configuración adicional para desarrollo
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -1,4 +1,7 @@
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
+
+from project.db import apply_connection_settings, sqlite_database
 
 from .base import *
 
@@ -13,20 +16,59 @@ from .base import *
 # Redirección a HTTPS detrás de proxy/Nginx
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
-# Base de datos PostgreSQL para producción
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": config("DB_NAME"),
-        "USER": config("DB_USER"),
-        "PASSWORD": config("DB_PASSWORD"),
-        "HOST": config("DB_HOST"),
-        "PORT": config("DB_PORT"),
-        "OPTIONS": {
-            "sslmode": "require",
-        },
+# Base de datos PostgreSQL para producción (o SQLite con DB_ENGINE=sqlite
+# para instalaciones de un solo servidor, ver project/db.py)
+if DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": sqlite_database(
+            SQLITE_PATH, mmap_size=SQLITE_MMAP_SIZE, cache_size_kb=SQLITE_CACHE_KB
+        )
     }
-}
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": config("DB_NAME"),
+            "USER": config("DB_USER"),
+            "PASSWORD": config("DB_PASSWORD"),
+            "HOST": config("DB_HOST"),
+            "PORT": config("DB_PORT"),
+            "OPTIONS": {
+                "sslmode": "require",
+            },
+        }
+    }
+
+# Reutilización de conexiones (none, persistent o pool; ver project/db.py).
+# Bajo ASGI Django no cierra de forma fiable las conexiones persistentes
+# entre requests: por defecto una conexión por request. El pool requiere
+# psycopg 3 con su extra pool (comentado en requirements.txt)
+DB_CONN_MODE = config("DB_CONN_MODE", default="none" if ASGI_SERVER else "persistent")
+if ASGI_SERVER and DB_CONN_MODE == "persistent":
+    raise ImproperlyConfigured("Con ASGI_SERVER usa DB_CONN_MODE=pool o none")
+DATABASES["default"] = apply_connection_settings(
+    DATABASES["default"],
+    DB_CONN_MODE,
+    max_age=config("DB_CONN_MAX_AGE", default=60, cast=int),
+    pool_min_size=config("DB_POOL_MIN_SIZE", default=2, cast=int),
+    pool_max_size=config("DB_POOL_MAX_SIZE", default=10, cast=int),
+    pool_timeout=config("DB_POOL_TIMEOUT", default=10, cast=int),
+)
+
+# Réplicas de lectura: mismas credenciales, otro host (ver project/replicas.py)
+DATABASE_REPLICAS = []
+DB_REPLICA_HOSTS = config("DB_REPLICA_HOSTS", default="", cast=Csv())
+if DB_REPLICA_HOSTS and DB_ENGINE != "postgresql":
+    raise ImproperlyConfigured("DB_REPLICA_HOSTS requiere DB_ENGINE=postgresql")
+for number, host in enumerate(DB_REPLICA_HOSTS, start=1):
+    alias = f"replica_{number}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
 
 # SECRET_KEY para producción - ya se lee desde base.py
 # SECRET_KEY ya está configurado en base.py desde el .env
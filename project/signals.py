@@ -0,0 +1,65 @@
+"""
+Señales del proyecto
+====================
+
+Invalida la caché del dashboard del admin (project/dashboard.py):
+
+- totales: al crear o borrar registros de los modelos contados
+- widgets: con cualquier cambio de partidos, equipos en partido o eventos
+
+La invalidación corre en transaction.on_commit para que un request
+concurrente no vuelva a cachear datos de una transacción sin confirmar.
+
+Después de cada migrate repara los triggers del índice de texto completo
+de SQLite (ver project/search.py).
+"""
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+from events.models import MatchEvent
+from matches.models import Match, MatchTeam
+
+from .dashboard import COUNTED_MODELS, invalidate_counts, invalidate_widgets
+from .search import ensure_full_text_triggers
+
+WIDGET_MODELS = (Match, MatchTeam, MatchEvent)
+
+
+def _saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    if created and sender in COUNTED_MODELS.values():
+        transaction.on_commit(invalidate_counts)
+    if sender in WIDGET_MODELS:
+        transaction.on_commit(invalidate_widgets)
+
+
+def _deleted(sender, instance, **kwargs):
+    if sender in COUNTED_MODELS.values():
+        transaction.on_commit(invalidate_counts)
+    if sender in WIDGET_MODELS:
+        transaction.on_commit(invalidate_widgets)
+
+
+def _migrated(sender, using, **kwargs):
+    ensure_full_text_triggers(using)
+
+
+def connect():
+    for model in {*COUNTED_MODELS.values(), *WIDGET_MODELS}:
+        post_save.connect(
+            _saved, sender=model, dispatch_uid=f"dashboard_saved_{model._meta.label}"
+        )
+        post_delete.connect(
+            _deleted,
+            sender=model,
+            dispatch_uid=f"dashboard_deleted_{model._meta.label}",
+        )
+    # Una vez por migrate: post_migrate se envía por cada aplicación
+    post_migrate.connect(
+        _migrated,
+        sender=apps.get_app_config("teams"),
+        dispatch_uid="full_text_triggers",
+    )
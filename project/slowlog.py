@@ -0,0 +1,142 @@
+"""
+Log de Lentitud
+===============
+
+Registra en el logger "project.slow" (una línea JSON por entrada):
+
+- slow_query: cada consulta que supera SLOW_QUERY_THRESHOLD_MS, con su SQL,
+  parámetros, duración y la vista que la ejecutó
+- slow_request: cada request que supera SLOW_REQUEST_THRESHOLD_MS, con sus
+  tiempos y las consultas más lentas
+- query_plan: en PostgreSQL, el EXPLAIN de cada consulta lenta (solo
+  SELECT), calculado en un hilo aparte para no demorar la respuesta; una
+  misma consulta se explica como máximo una vez cada EXPLAIN_INTERVAL
+
+Lo alimenta RequestInstrumentationMiddleware (project/middleware.py).
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("project.slow")
+
+# Segundos mínimos entre dos EXPLAIN de la misma consulta
+EXPLAIN_INTERVAL = 300
+
+# Consultas distintas recordadas para no repetir el EXPLAIN
+EXPLAIN_MEMORY = 500
+
+# Largo máximo de los parámetros en el log
+MAX_PARAMS_LENGTH = 500
+
+_explain_lock = threading.Lock()
+_explained = {}
+_explain_executor = None
+
+
+def _log(entry):
+    logger.warning(json.dumps(entry, default=str))
+
+
+def _params(params):
+    text = repr(params)
+    if len(text) > MAX_PARAMS_LENGTH:
+        return text[:MAX_PARAMS_LENGTH] + "..."
+    return text
+
+
+def _query_entry(query):
+    duration, alias, sql, params = query
+    return {
+        "duration_ms": round(duration * 1000, 2),
+        "database": alias,
+        "sql": sql,
+        "params": _params(params),
+    }
+
+
+def report(request, response, metrics):
+    """Registra las consultas lentas y el request si superó el umbral"""
+    context = {
+        "view": metrics.view_name,
+        "method": request.method,
+        "path": request.path,
+    }
+
+    for query in metrics.slow_queries:
+        _log({"type": "slow_query", **context, **_query_entry(query)})
+        if settings.SLOW_QUERY_EXPLAIN:
+            explain_async(query, context["view"])
+
+    threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+    data = metrics.as_dict()
+    if threshold and data["total_ms"] >= threshold:
+        _log(
+            {
+                "type": "slow_request",
+                **context,
+                "status": response.status_code,
+                **data,
+                "slowest_queries": [_query_entry(query) for query in metrics.slowest()],
+            }
+        )
+
+
+def explain_async(query, view):
+    """Pide el plan de una consulta lenta en segundo plano (PostgreSQL)"""
+    _, alias, sql, params = query
+    if connections[alias].vendor != "postgresql":
+        return
+    if not sql.lstrip()[:6].upper() == "SELECT":
+        # EXPLAIN sin ANALYZE no ejecuta, pero solo interesan las lecturas
+        return
+
+    now = time.monotonic()
+    with _explain_lock:
+        if now - _explained.get(sql, -EXPLAIN_INTERVAL) < EXPLAIN_INTERVAL:
+            return
+        if len(_explained) >= EXPLAIN_MEMORY:
+            _explained.clear()
+        _explained[sql] = now
+
+    _get_executor().submit(_explain, alias, sql, params, view)
+
+
+def _get_executor():
+    global _explain_executor
+    with _explain_lock:
+        if _explain_executor is None:
+            _explain_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="slow-query-explain"
+            )
+    return _explain_executor
+
+
+def _explain(alias, sql, params, view):
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+    except Exception:
+        logger.exception("No se pudo obtener el plan de la consulta lenta")
+        return
+    finally:
+        # Conexión propia del hilo: se cierra para no dejarla ociosa
+        connection.close()
+
+    _log(
+        {
+            "type": "query_plan",
+            "view": view,
+            "database": alias,
+            "sql": sql,
+            "plan": plan,
+        }
+    )
@@ -20,10 +20,14 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from project.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API REST para usuarios con permisos limitados
     path("api/", include("api.urls")),
+    # Métricas en formato Prometheus (solo staff)
+    path("metrics/", metrics_view, name="metrics"),
     # Página principal del torneo
     path("", include("tournaments.urls", namespace="home")),
     # Rutas para TORNEOS
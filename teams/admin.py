@@ -28,6 +28,9 @@ from django.shortcuts import redirect
 from django.urls import path
 from django.utils.html import format_html
 
+from project.admin import autocomplete_param, select_related_filter
+from project.search import full_text_filter
+
 from .models import Player, Team
 from .views import upload_players_from_excel
 
@@ -89,6 +92,7 @@ class TeamAdmin(admin.ModelAdmin):
     list_filter = ["tournament_category__tournament", "tournament_category"]
     search_fields = ["name", "abbreviation"]
     ordering = ["tournament_category", "name"]
+    autocomplete_fields = ["tournament_category"]
     inlines = [PlayerInline]
 
     fieldsets = (
@@ -123,6 +127,20 @@ class TeamAdmin(admin.ModelAdmin):
 
     player_count.short_description = "Jugadores"
 
+    def get_queryset(self, request):
+        """Team.__str__ muestra la categoría"""
+        return super().get_queryset(request).select_related("tournament_category")
+
+    def get_search_results(self, request, queryset, search_term):
+        """El autocompletado puede limitarse a una categoría (?category=)"""
+        queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        category = autocomplete_param(request, "category")
+        if category is not None:
+            queryset = queryset.filter(tournament_category_id=category)
+        return queryset, may_have_duplicates
+
 
 @admin.register(Player)
 class PlayerAdmin(admin.ModelAdmin):
@@ -168,8 +186,8 @@ class PlayerAdmin(admin.ModelAdmin):
     ]
     list_filter = [
         "position",
-        "team__tournament_category",
-        "team",
+        ("team__tournament_category", select_related_filter("tournament")),
+        ("team", select_related_filter("tournament_category")),
         "promo",  # permite filtrar por promoción
         "profession",  # filtra por profesión
     ]
@@ -182,6 +200,7 @@ class PlayerAdmin(admin.ModelAdmin):
         "profession",
     ]
     ordering = ["team", "jersey_number"]
+    autocomplete_fields = ["team"]
 
     fieldsets = (
         (
@@ -213,3 +232,25 @@ class PlayerAdmin(admin.ModelAdmin):
         )
 
     age.short_description = "Edad"
+
+    def get_queryset(self, request):
+        """Player.__str__ y la columna del equipo muestran equipo y categoría"""
+        return super().get_queryset(request).select_related("team__tournament_category")
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        El autocompletado puede limitarse a un equipo (?team=)
+
+        En SQLite busca con el índice de texto completo (project/search.py).
+        """
+        filtered = full_text_filter(queryset, search_term)
+        if filtered is not None:
+            queryset, may_have_duplicates = filtered, False
+        else:
+            queryset, may_have_duplicates = super().get_search_results(
+                request, queryset, search_term
+            )
+        team = autocomplete_param(request, "team")
+        if team is not None:
+            queryset = queryset.filter(team_id=team)
+        return queryset, may_have_duplicates
@@ -2,6 +2,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 
 from .models import Team
+from .utils import SUPPORTED_EXTENSIONS
 
 
 class ExcelPlayerUploadForm(forms.Form):
@@ -11,8 +12,8 @@ class ExcelPlayerUploadForm(forms.Form):
         help_text="Selecciona el equipo al que pertenecen los jugadores",
     )
     excel_file = forms.FileField(
-        label="Archivo Excel",
-        help_text="Sube el archivo Excel (.xlsx) con los datos de los jugadores",
+        label="Archivo de jugadores",
+        help_text="Sube la planilla (.xlsx, .csv u .ods) con los datos de los jugadores",
     )
 
     # Opciones de configuración
@@ -42,6 +43,9 @@ class ExcelPlayerUploadForm(forms.Form):
 
     def clean_excel_file(self):
         file = self.cleaned_data["excel_file"]
-        if not file.name.endswith((".xlsx", ".xls")):
-            raise ValidationError("El archivo debe ser un Excel (.xlsx o .xls)")
+        if not file.name.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise ValidationError(
+                "El archivo debe ser un Excel (.xlsx o .xls), un CSV (.csv) "
+                "o una hoja OpenDocument (.ods)"
+            )
         return file
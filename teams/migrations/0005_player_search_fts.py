@@ -0,0 +1,75 @@
+from django.db import migrations
+
+# Índice de texto completo de jugadores (FTS5) solo en SQLite; en
+# PostgreSQL la búsqueda sigue con icontains (ver project/search.py).
+# Tabla de contenido externo: el texto vive en teams_player y los triggers
+# mantienen el índice al día. Un AlterField posterior sobre teams_player
+# reconstruye la tabla y borra los triggers: después de cada migrate
+# project.search.ensure_full_text_triggers() los vuelve a crear.
+COLUMNS = "first_name, last_name, dni, jersey_number, phone_number, profession"
+NEW_VALUES = ", ".join(f"new.{column}" for column in COLUMNS.split(", "))
+OLD_VALUES = ", ".join(f"old.{column}" for column in COLUMNS.split(", "))
+
+CREATE_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE teams_player_fts USING fts5(
+        {COLUMNS},
+        content='teams_player',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER teams_player_fts_insert AFTER INSERT ON teams_player BEGIN
+        INSERT INTO teams_player_fts(rowid, {COLUMNS})
+        VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER teams_player_fts_delete AFTER DELETE ON teams_player BEGIN
+        INSERT INTO teams_player_fts(teams_player_fts, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER teams_player_fts_update AFTER UPDATE ON teams_player BEGIN
+        INSERT INTO teams_player_fts(teams_player_fts, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+        INSERT INTO teams_player_fts(rowid, {COLUMNS})
+        VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+    "INSERT INTO teams_player_fts(teams_player_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS teams_player_fts_insert",
+    "DROP TRIGGER IF EXISTS teams_player_fts_delete",
+    "DROP TRIGGER IF EXISTS teams_player_fts_update",
+    "DROP TABLE IF EXISTS teams_player_fts",
+]
+
+
+def create_player_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_player_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teams", "0004_rename_telefono_player_phone_number_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_player_fts, drop_player_fts),
+    ]
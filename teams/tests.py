@@ -1,3 +1,257 @@
-from django.test import TestCase
+import io
+import zipfile
+from datetime import date
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from project.search import ensure_full_text_triggers, full_text_filter
+from tournaments.tests.factories import create_category, create_player, create_teams
+
+from .models import Player
+from .utils import (
+    extract_players_from_file,
+    import_players,
+    preview_players_import,
+)
+
+
+def player_row(row_number, dni, jersey_number, **fields):
+    """Fila normalizada como las de extract_players_from_file"""
+    return {
+        "first_name": "Juan",
+        "last_name": f"Jugador {row_number}",
+        "dni": dni,
+        "jersey_number": jersey_number,
+        "position": "MID",
+        "birth_date": date(1990, 1, 1),
+        "phone": "",
+        "promo": 2010,
+        "profession": "",
+        "row_number": row_number,
+        **fields,
+    }
+
+
+class ImportPlayersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        (cls.team,) = create_teams(create_category(), 1)
+        create_player(cls.team, dni="30000001", jersey_number="10")
+
+    def setUp(self):
+        self.rows = [
+            player_row(25, "31000001", "1"),
+            player_row(26, "31000002", "1234"),  # Camiseta de más de 3 caracteres
+            player_row(27, "30000001", "2"),  # DNI ya cargado
+            player_row(28, "31000003", "10"),  # Camiseta en uso
+            player_row(29, "31000004", "3", position="XX"),
+            player_row(30, "31000005", "4"),
+        ]
+
+    def test_preview_reports_invalid_rows(self):
+        preview = preview_players_import(self.rows, self.team)
+
+        sections = {
+            section: [row["row_number"] for row in rows]
+            for section, rows in preview.items()
+        }
+        self.assertEqual(
+            sections,
+            {
+                "new": [25, 30],
+                "duplicates": [27],
+                "jersey_conflicts": [28],
+                "invalid": [26, 29],
+            },
+        )
+        self.assertIn("jersey_number", preview["invalid"][0]["errors"])
+        self.assertIn("position", preview["invalid"][1]["errors"])
+
+    def test_invalid_rows_do_not_block_the_rest(self):
+        created, preview = import_players(self.rows, self.team)
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(
+            set(self.team.players.values_list("dni", flat=True)),
+            {"30000001", "31000001", "31000005"},
+        )
+        self.assertEqual(len(preview["invalid"]), 2)
+
+    def test_rows_are_saved_one_by_one_when_the_batch_fails(self):
+        with mock.patch.object(
+            Player.objects, "bulk_create", side_effect=IntegrityError
+        ):
+            created, preview = import_players(self.rows, self.team)
+
+        self.assertEqual([player.dni for player in created], ["31000001", "31000005"])
+        self.assertEqual(self.team.players.count(), 3)
+        self.assertEqual([row["row_number"] for row in preview["new"]], [25, 30])
+
+
+def ods_file(rows_xml):
+    """Planilla .ods mínima (solo content.xml) con las filas indicadas"""
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<office:document-content"
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+        "<office:body><office:spreadsheet>"
+        f'<table:table table:name="Plantel">{rows_xml}</table:table>'
+        "</office:spreadsheet></office:body></office:document-content>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("content.xml", content)
+    return SimpleUploadedFile("plantel.ods", buffer.getvalue())
+
+
+def ods_row(*values):
+    cells = "".join(
+        f'<table:table-cell office:value-type="string"><text:p>{value}</text:p>'
+        "</table:table-cell>"
+        for value in values
+    )
+    return f"<table:table-row>{cells}</table:table-row>"
+
+
+def ods_blank_rows(count):
+    return (
+        f'<table:table-row table:number-rows-repeated="{count}">'
+        '<table:table-cell table:number-columns-repeated="1024"/>'
+        "</table:table-row>"
+    )
+
+
+class ExtractPlayersFromFileTests(SimpleTestCase):
+    def test_semicolon_latin1_csv_with_multiline_cell(self):
+        content = (
+            "Apellido;Nombre;DNI;Numero;Oficio\n"
+            'Peña;José;30.111.222;7;"Albañil\nPintor"\n'
+            "Zeta;Juan;35111222;8;\n"
+        ).encode("latin-1")
+
+        players = extract_players_from_file(
+            SimpleUploadedFile("plantel.csv", content), header_row=1, start_data_row=2
+        )
+
+        self.assertEqual(
+            [
+                (player["last_name"], player["first_name"], player["dni"])
+                for player in players
+            ],
+            [("Peña", "José", "30111222"), ("Zeta", "Juan", "35111222")],
+        )
+        self.assertEqual(players[0]["profession"], "Albañil\nPintor")
+        self.assertEqual(players[1]["row_number"], 3)
+
+    def test_ods_with_repeated_blank_rows(self):
+        uploaded_file = ods_file(
+            ods_row("Apellido", "Nombre", "DNI")
+            + ods_blank_rows(2)
+            + ods_row("Peña", "José", "30111222")
+            # Relleno habitual hasta el final de la hoja
+            + ods_blank_rows(1048571)
+        )
+
+        players = extract_players_from_file(
+            uploaded_file, header_row=1, start_data_row=2
+        )
+
+        self.assertEqual(
+            [(player["last_name"], player["row_number"]) for player in players],
+            [("Peña", 4)],
+        )
+
+
+@skipUnless(connection.vendor == "sqlite", "Índice FTS5 solo en SQLite")
+class FullTextTriggersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        (cls.team,) = create_teams(create_category(), 1)
+
+    def search(self, term):
+        return list(full_text_filter(Player.objects.all(), term))
+
+    def drop_triggers(self):
+        # Lo que hace SQLite al reconstruir teams_player en un AlterField
+        with connection.cursor() as cursor:
+            for suffix in ("insert", "delete", "update"):
+                cursor.execute(f"DROP TRIGGER teams_player_fts_{suffix}")
+
+    def test_triggers_keep_the_index_up_to_date(self):
+        player = create_player(self.team)
+        self.assertEqual(self.search("perez"), [player])
+
+        player.last_name = "Gómez"
+        player.save()
+        self.assertEqual(self.search("perez"), [])
+        self.assertEqual(self.search("gomez 3011"), [player])
+
+    def test_missing_triggers_are_recreated_after_migrate(self):
+        self.drop_triggers()
+        player = create_player(self.team)
+        self.assertEqual(self.search("perez"), [])
+
+        emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+        # El índice se reconstruyó con lo escrito sin triggers
+        self.assertEqual(self.search("perez"), [player])
+
+        player.delete()
+        self.assertEqual(self.search("perez"), [])
+
+    def test_existing_triggers_are_left_alone(self):
+        self.assertEqual(ensure_full_text_triggers("default"), [])
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PlayerImportViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.team, cls.other_team = create_teams(create_category(), 2)
+        cls.user = User.objects.create_user("staff", password="x", is_staff=True)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = reverse("admin:upload_players_from_excel")
+
+    def preview(self, team):
+        csv_file = SimpleUploadedFile(
+            "plantel.csv", b"Apellido,Nombre,DNI,Numero\nZeta,Juan,35111222,7\n"
+        )
+        response = self.client.post(
+            self.url,
+            {
+                "team": team.pk,
+                "excel_file": csv_file,
+                "header_row": 1,
+                "start_data_row": 2,
+                "default_position": "MID",
+                "preview": "1",
+            },
+        )
+        return response.context["import_key"]
+
+    def commit(self, import_key, team):
+        return self.client.post(self.url, {"import_key": import_key, "team": team.pk})
+
+    def test_commit_into_the_previewed_team(self):
+        self.commit(self.preview(self.team), self.team)
+        self.assertEqual(
+            list(self.team.players.values_list("dni", flat=True)), ["35111222"]
+        )
+
+    def test_commit_into_another_team_is_rejected(self):
+        import_key = self.preview(self.team)
+        response = self.commit(import_key, self.other_team)
+
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        self.assertFalse(Player.objects.exists())
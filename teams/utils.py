@@ -1,65 +1,255 @@
+import codecs
+import csv
+import hashlib
+import logging
+import os
 import re
+import zipfile
 from datetime import date, datetime
+from xml.etree import ElementTree
 
-import openpyxl
 from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
 
+from .models import Player
 
-def extract_players_from_excel(
-    excel_file, header_row=24, start_data_row=25, default_position="MID"
+logger = logging.getLogger(__name__)
+
+# Extensiones aceptadas para la carga de planillas de jugadores
+SUPPORTED_EXTENSIONS = (".xlsx", ".xls", ".csv", ".ods")
+
+# Espacios de nombres XML usados en content.xml de OpenDocument
+ODS_NAMESPACES = {
+    "table": "urn:oasis:names:tc:opendocument:xmlns:table:1.0",
+    "office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
+    "text": "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
+}
+
+
+def _ods_attr(prefix, name):
+    return f"{{{ODS_NAMESPACES[prefix]}}}{name}"
+
+
+def extract_players_from_file(
+    uploaded_file, header_row=24, start_data_row=25, default_position="MID"
 ):
     """
-    Extrae datos de jugadores del archivo Excel
+    Extrae datos de jugadores de una planilla (.xlsx, .csv u .ods)
+
+    Selecciona el lector según la extensión del archivo y pasa las filas por
+    el mismo pipeline de normalización (DNI, fechas, camisetas).
 
     Args:
-        excel_file: Archivo Excel subido
+        uploaded_file: Archivo subido
         header_row: Fila donde están los encabezados (1-indexed)
         start_data_row: Fila donde empiezan los datos (1-indexed)
         default_position: Posición por defecto para los jugadores
     """
     try:
-        # Cargar el workbook
-        workbook = openpyxl.load_workbook(excel_file, data_only=True)
+        rows = iter_rows_from_file(uploaded_file)
+        return list(
+            iter_players_from_rows(rows, header_row, start_data_row, default_position)
+        )
 
-        # Obtener la primera hoja
-        worksheet = workbook.active
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise ValidationError(f"Error al procesar el archivo: {str(e)}")
+
+
+def iter_rows_from_file(uploaded_file):
+    """
+    Devuelve un generador de filas (número de fila, valores) según la extensión
+    """
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    readers = {
+        ".xlsx": iter_excel_rows,
+        ".xls": iter_excel_rows,
+        ".csv": iter_csv_rows,
+        ".ods": iter_ods_rows,
+    }
+    if extension not in readers:
+        raise ValidationError(
+            f"Formato no soportado: {extension or 'sin extensión'}. "
+            f"Use {', '.join(SUPPORTED_EXTENSIONS)}"
+        )
+    return readers[extension](uploaded_file)
+
+
+def iter_players_from_rows(
+    rows, header_row=24, start_data_row=25, default_position="MID"
+):
+    """
+    Pipeline común: recibe filas (número de fila, valores) de cualquier formato
+    y genera diccionarios de jugadores normalizados
+
+    Args:
+        rows: Iterable de tuplas (row_number, values) con row_number 1-indexed
+        header_row: Fila donde están los encabezados (1-indexed)
+        start_data_row: Fila donde empiezan los datos (1-indexed)
+        default_position: Posición por defecto para los jugadores
+    """
+    column_mapping = None
+
+    for row, values in rows:
+        if row < header_row:
+            continue
 
         # Leer encabezados para mapear columnas
-        headers = {}
-        for col in range(1, worksheet.max_column + 1):
-            cell_value = worksheet.cell(row=header_row, column=col).value
-            if cell_value:
-                header_name = str(cell_value).strip().upper()
-                headers[col] = header_name
+        if row == header_row:
+            headers = {}
+            for col, cell_value in enumerate(values, start=1):
+                if cell_value:
+                    headers[col] = str(cell_value).strip().upper()
 
-        print(f"Encabezados encontrados: {headers}")
+            logger.debug("Encabezados encontrados: %s", headers)
 
-        # Mapear columnas según los encabezados encontrados
-        column_mapping = find_column_mapping(headers)
+            # Mapear columnas según los encabezados encontrados
+            column_mapping = find_column_mapping(headers)
+            continue
 
-        # Extraer datos de jugadores
-        players_data = []
+        if row < start_data_row or column_mapping is None:
+            continue
 
-        for row in range(start_data_row, worksheet.max_row + 1):
-            # Verificar si la fila tiene datos
-            if is_empty_row(worksheet, row, column_mapping):
-                continue
+        # Verificar si la fila tiene datos
+        if is_empty_row(values, column_mapping):
+            continue
 
-            try:
-                player_data = extract_player_from_row(
-                    worksheet, row, column_mapping, default_position
-                )
-                if player_data:
-                    players_data.append(player_data)
-
-            except Exception as e:
-                print(f"Error procesando fila {row}: {str(e)}")
-                continue
+        try:
+            player_data = extract_player_from_row(
+                values, row, column_mapping, default_position
+            )
+            if player_data:
+                yield player_data
 
-        return players_data
+        except Exception as e:
+            logger.debug("Error procesando fila %s: %s", row, e)
+            continue
 
-    except Exception as e:
-        raise ValidationError(f"Error al procesar el archivo Excel: {str(e)}")
+
+def iter_excel_rows(excel_file):
+    """
+    Lee las filas de la primera hoja de un Excel en modo solo lectura
+    """
+    # openpyxl tarda ~80 ms en importarse: solo se carga al importar un Excel,
+    # no al iniciar cada worker (teams.admin -> teams.views -> teams.utils)
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.active
+        for row, values in enumerate(worksheet.iter_rows(values_only=True), start=1):
+            yield row, values
+    finally:
+        workbook.close()
+
+
+def iter_csv_rows(csv_file, encoding=None):
+    """
+    Lee un CSV en streaming (sin cargarlo completo en memoria)
+
+    Detecta el separador (coma, punto y coma, tabulador) y la codificación
+    (UTF-8 o Latin-1, habitual en exportaciones de Excel en español).
+    """
+    csv_file.seek(0)
+    sample = csv_file.read(4096)
+    csv_file.seek(0)
+
+    if encoding is None:
+        try:
+            sample.decode("utf-8-sig")
+            encoding = "utf-8-sig"
+        except UnicodeDecodeError as e:
+            # La muestra puede cortar un carácter multibyte al final
+            encoding = "utf-8-sig" if e.start >= len(sample) - 3 else "latin-1"
+
+    # El separador más frecuente en la muestra (las exportaciones en español
+    # suelen usar punto y coma)
+    text_sample = sample.decode(encoding, errors="ignore")
+    delimiter = max(",;\t", key=text_sample.count)
+
+    lines = codecs.iterdecode(csv_file, encoding)
+    for row, values in enumerate(csv.reader(lines, delimiter=delimiter), start=1):
+        yield row, values
+
+
+def iter_ods_rows(ods_file):
+    """
+    Lee las filas de la primera hoja de un .ods con la librería estándar
+
+    Recorre content.xml con iterparse, expandiendo celdas y filas repetidas
+    y liberando cada fila una vez procesada.
+    """
+    table_tag = _ods_attr("table", "table")
+    row_tag = _ods_attr("table", "table-row")
+    cell_tags = (
+        _ods_attr("table", "table-cell"),
+        _ods_attr("table", "covered-table-cell"),
+    )
+    repeated_cols = _ods_attr("table", "number-columns-repeated")
+    repeated_rows = _ods_attr("table", "number-rows-repeated")
+
+    with zipfile.ZipFile(ods_file) as archive:
+        with archive.open("content.xml") as content:
+            row = 0
+            for event, element in ElementTree.iterparse(content, events=("end",)):
+                if element.tag == table_tag:
+                    # Solo se procesa la primera hoja
+                    break
+                if element.tag != row_tag:
+                    continue
+
+                values = []
+                for cell in element:
+                    if cell.tag not in cell_tags:
+                        continue
+                    value = parse_ods_cell(cell)
+                    values.extend([value] * int(cell.get(repeated_cols, 1)))
+
+                # Quitar celdas vacías finales (las hojas suelen rellenar columnas)
+                while values and values[-1] is None:
+                    values.pop()
+
+                repeat = int(element.get(repeated_rows, 1))
+                element.clear()
+
+                if not values:
+                    row += repeat
+                    continue
+
+                for _ in range(repeat):
+                    row += 1
+                    yield row, values
+
+
+def parse_ods_cell(cell):
+    """
+    Convierte una celda de OpenDocument a un valor de Python
+    """
+    value_type = cell.get(_ods_attr("office", "value-type"))
+
+    if value_type in ("float", "percentage", "currency"):
+        number = float(cell.get(_ods_attr("office", "value")))
+        # Los DNI y números de camiseta se guardan como float en ODS
+        return int(number) if number.is_integer() else number
+
+    if value_type == "date":
+        date_value = cell.get(_ods_attr("office", "date-value"))
+        return datetime.fromisoformat(date_value)
+
+    text = "\n".join(
+        "".join(paragraph.itertext()) for paragraph in cell.iter(_ods_attr("text", "p"))
+    )
+    return text or None
+
+
+def _cell_value(values, column):
+    """
+    Devuelve el valor de la columna (1-indexed) o None si la fila es más corta
+    """
+    if column <= len(values):
+        return values[column - 1]
+    return None
 
 
 def find_column_mapping(headers):
@@ -110,11 +300,11 @@ def find_column_mapping(headers):
         ):
             mapping["oficio"] = col
 
-    print(f"Mapeo de columnas: {mapping}")
+    logger.debug("Mapeo de columnas: %s", mapping)
     return mapping
 
 
-def is_empty_row(worksheet, row, column_mapping):
+def is_empty_row(values, column_mapping):
     """
     Verifica si una fila está vacía o contiene solo datos irrelevantes
     """
@@ -122,22 +312,26 @@ def is_empty_row(worksheet, row, column_mapping):
 
     for col_name in important_cols:
         if col_name in column_mapping:
-            cell_value = worksheet.cell(row=row, column=column_mapping[col_name]).value
+            cell_value = _cell_value(values, column_mapping[col_name])
             if cell_value and str(cell_value).strip():
                 return False
 
     return True
 
 
-def extract_player_from_row(worksheet, row, column_mapping, default_position):
+def extract_player_from_row(values, row, column_mapping, default_position):
     """
-    Extrae los datos de un jugador desde una fila específica
+    Extrae los datos de un jugador desde los valores de una fila
+
+    Args:
+        values: Valores de la fila (secuencia, columna 1 en la posición 0)
+        row: Número de fila (para mensajes de error)
     """
     player_data = {}
 
     # Apellido (obligatorio)
     if "apellido" in column_mapping:
-        apellido = worksheet.cell(row=row, column=column_mapping["apellido"]).value
+        apellido = _cell_value(values, column_mapping["apellido"])
         if not apellido:
             return None
         player_data["last_name"] = str(apellido).strip()
@@ -146,7 +340,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Nombre (obligatorio)
     if "nombre" in column_mapping:
-        nombre = worksheet.cell(row=row, column=column_mapping["nombre"]).value
+        nombre = _cell_value(values, column_mapping["nombre"])
         if not nombre:
             return None
         player_data["first_name"] = str(nombre).strip()
@@ -155,7 +349,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # DNI
     if "dni" in column_mapping:
-        dni = worksheet.cell(row=row, column=column_mapping["dni"]).value
+        dni = _cell_value(values, column_mapping["dni"])
         if dni:
             # Limpiar DNI (quitar puntos, espacios, etc.)
             dni_str = str(dni).replace(".", "").replace(" ", "").replace(",", "")
@@ -170,9 +364,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Fecha de nacimiento
     if "fecha_nacimiento" in column_mapping:
-        fecha_nac = worksheet.cell(
-            row=row, column=column_mapping["fecha_nacimiento"]
-        ).value
+        fecha_nac = _cell_value(values, column_mapping["fecha_nacimiento"])
         if fecha_nac:
             player_data["birth_date"] = parse_date_from_excel(fecha_nac)
         else:
@@ -182,7 +374,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Número de camiseta
     if "numero" in column_mapping:
-        numero = worksheet.cell(row=row, column=column_mapping["numero"]).value
+        numero = _cell_value(values, column_mapping["numero"])
         if numero:
             try:
                 player_data["jersey_number"] = str(int(numero))
@@ -201,7 +393,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Celular/Teléfono
     if "celular" in column_mapping:
-        celular = worksheet.cell(row=row, column=column_mapping["celular"]).value
+        celular = _cell_value(values, column_mapping["celular"])
         if celular:
             player_data["phone"] = str(celular).strip()
         else:
@@ -211,7 +403,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Promoción
     if "promocion" in column_mapping:
-        promocion = worksheet.cell(row=row, column=column_mapping["promocion"]).value
+        promocion = _cell_value(values, column_mapping["promocion"])
         if promocion:
             try:
                 player_data["promo"] = int(promocion)
@@ -224,7 +416,7 @@ def extract_player_from_row(worksheet, row, column_mapping, default_position):
 
     # Oficio/Profesión
     if "oficio" in column_mapping:
-        oficio = worksheet.cell(row=row, column=column_mapping["oficio"]).value
+        oficio = _cell_value(values, column_mapping["oficio"])
         if oficio:
             player_data["profession"] = str(oficio).strip()
         else:
@@ -289,3 +481,132 @@ def auto_assign_dni(players_data, team):
             player_data["dni"] = str(base_dni)
             existing_dnis.add(str(base_dni))
             base_dni += 1
+
+
+def compute_file_hash(uploaded_file):
+    """
+    Calcula el SHA-256 del archivo subido (clave para cachear su lectura)
+    """
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def build_player(player_data, team):
+    """Player (sin guardar) a partir de una fila normalizada de la planilla"""
+    return Player(
+        team=team,
+        first_name=player_data["first_name"],
+        last_name=player_data["last_name"],
+        jersey_number=player_data["jersey_number"],
+        position=player_data["position"],
+        birth_date=player_data["birth_date"],
+        dni=player_data["dni"],
+        phone_number=player_data["phone"],
+        promo=player_data["promo"],
+        profession=player_data["profession"],
+    )
+
+
+def player_errors(player):
+    """
+    Errores de validación del jugador (largo de campos, DNI, posición...)
+
+    La unicidad de DNI y camiseta la resuelve preview_players_import() y el
+    equipo ya existe, así que no se consulta la base.
+
+    Returns:
+        Texto con los errores o None si el jugador es válido
+    """
+    try:
+        player.full_clean(
+            exclude=["team"], validate_unique=False, validate_constraints=False
+        )
+    except ValidationError as e:
+        return "; ".join(
+            f"{field}: {' '.join(field_errors)}"
+            for field, field_errors in e.message_dict.items()
+        )
+    return None
+
+
+def preview_players_import(players_data, team):
+    """
+    Simula la importación sin escribir en la base de datos
+
+    Asigna camisetas y DNI faltantes sobre una copia de los datos y clasifica
+    cada jugador contra los existentes del equipo (y contra los anteriores del
+    mismo archivo). Los jugadores nuevos se validan como en el admin: una
+    fila inválida se informa y no impide importar las demás.
+
+    Returns:
+        dict con listas 'new', 'duplicates' (DNI ya existente),
+        'jersey_conflicts' (número de camiseta en uso) e 'invalid' (con el
+        texto de los errores en 'errors')
+    """
+    players_data = [dict(player_data) for player_data in players_data]
+    auto_assign_jersey_numbers(players_data, team)
+    auto_assign_dni(players_data, team)
+
+    existing = list(team.players.values_list("dni", "jersey_number"))
+    existing_dnis = {dni for dni, _ in existing}
+    existing_numbers = {number for _, number in existing}
+
+    preview = {"new": [], "duplicates": [], "jersey_conflicts": [], "invalid": []}
+    for player_data in players_data:
+        if player_data["dni"] in existing_dnis:
+            preview["duplicates"].append(player_data)
+            continue
+
+        if player_data["jersey_number"] in existing_numbers:
+            preview["jersey_conflicts"].append(player_data)
+            continue
+
+        errors = player_errors(build_player(player_data, team))
+        if errors:
+            preview["invalid"].append({**player_data, "errors": errors})
+            continue
+
+        preview["new"].append(player_data)
+        existing_dnis.add(player_data["dni"])
+        existing_numbers.add(player_data["jersey_number"])
+
+    return preview
+
+
+def import_players(players_data, team):
+    """
+    Crea los jugadores nuevos en un único bulk_create
+
+    Si la base rechaza el lote (por ejemplo, alguien cargó a mano un jugador
+    con el mismo DNI después de la previsualización) se guardan de a uno y
+    los rechazados pasan a 'invalid' del preview.
+
+    Returns:
+        tupla (jugadores creados, preview usado para clasificarlos)
+    """
+    preview = preview_players_import(players_data, team)
+
+    try:
+        with transaction.atomic():
+            created_players = Player.objects.bulk_create(
+                [build_player(player_data, team) for player_data in preview["new"]]
+            )
+    except DatabaseError:
+        created_players = []
+        new_players = preview["new"]
+        preview["new"] = []
+        for player_data in new_players:
+            player = build_player(player_data, team)
+            try:
+                with transaction.atomic():
+                    player.save()
+            except DatabaseError as e:
+                preview["invalid"].append({**player_data, "errors": str(e)})
+                continue
+            created_players.append(player)
+            preview["new"].append(player_data)
+
+    return created_players, preview
@@ -1,19 +1,61 @@
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.shortcuts import redirect, render
 
 from .forms import ExcelPlayerUploadForm
-from .models import Player
+from .models import Team
 from .utils import (
-    auto_assign_dni,
-    auto_assign_jersey_numbers,
-    extract_players_from_excel,
+    compute_file_hash,
+    extract_players_from_file,
+    import_players,
+    preview_players_import,
 )
 
+# Tiempo que se conserva la lectura de un archivo para confirmar la importación
+PLAYER_IMPORT_CACHE_TIMEOUT = 60 * 30
+
+# Máximo de filas por sección que se muestran en la previsualización
+PLAYER_IMPORT_PREVIEW_LIMIT = 100
+
+
+def _player_import_cache_key(
+    team_id, file_hash, header_row, start_data_row, default_position
+):
+    # El equipo es parte de la clave: la previsualización (DNI y camisetas
+    # repetidos) solo vale para ese equipo
+    return (
+        f"{_player_import_key_prefix(team_id)}{file_hash}:{header_row}:"
+        f"{start_data_row}:{default_position}"
+    )
+
+
+def _player_import_key_prefix(team_id):
+    return f"teams:player_import:{team_id}:"
+
+
+def _player_label(player_data):
+    return f"{player_data['first_name']} {player_data['last_name']}"
+
 
 @staff_member_required
 def upload_players_from_excel(request):
+    """
+    Carga de jugadores desde una planilla en dos pasos opcionales
+
+    1. "Previsualizar": lee el archivo una sola vez, cachea las filas
+       normalizadas por hash del archivo y muestra qué jugadores son nuevos,
+       cuáles tienen DNI repetido, cuáles conflicto de camiseta y cuáles
+       datos inválidos (no se importan, el resto sí).
+    2. "Confirmar": importa desde la lectura cacheada sin volver a leer el
+       archivo.
+
+    "Importar directamente" hace ambos pasos en el mismo request.
+    """
+    if request.method == "POST" and "import_key" in request.POST:
+        return _commit_cached_import(request)
+
     if request.method == "POST":
         form = ExcelPlayerUploadForm(request.POST, request.FILES)
         if form.is_valid():
@@ -24,87 +66,53 @@ def upload_players_from_excel(request):
                 start_data_row = form.cleaned_data["start_data_row"]
                 default_position = form.cleaned_data["default_position"]
 
-                # Extraer jugadores del Excel
-                players_data = extract_players_from_excel(
-                    excel_file, header_row, start_data_row, default_position
+                # Reutilizar la lectura si el mismo archivo ya se procesó
+                import_key = _player_import_cache_key(
+                    team.pk,
+                    compute_file_hash(excel_file),
+                    header_row,
+                    start_data_row,
+                    default_position,
                 )
+                players_data = cache.get(import_key)
+
+                if players_data is None:
+                    # Extraer jugadores de la planilla (Excel, CSV u ODS)
+                    players_data = extract_players_from_file(
+                        excel_file, header_row, start_data_row, default_position
+                    )
+                    cache.set(import_key, players_data, PLAYER_IMPORT_CACHE_TIMEOUT)
 
                 if not players_data:
                     messages.warning(
-                        request, "No se encontraron jugadores en el archivo Excel."
+                        request, "No se encontraron jugadores en el archivo."
                     )
                     return render(
                         request, "admin/teams/upload_players.html", {"form": form}
                     )
 
-                # Asignar números y DNI automáticamente si es necesario
-                auto_assign_jersey_numbers(players_data, team)
-                auto_assign_dni(players_data, team)
-
-                # Crear jugadores
-                created_players = []
-                errors = []
-                skipped_players = []
-
-                for player_data in players_data:
-                    try:
-                        # Verificar si ya existe un jugador con el mismo DNI en el equipo
-                        if Player.objects.filter(
-                            team=team, dni=player_data["dni"]
-                        ).exists():
-                            skipped_players.append(
-                                f"{player_data['first_name']} {player_data['last_name']} (DNI ya existe)"
-                            )
-                            continue
-
-                        # Verificar si ya existe un jugador con el mismo número de camiseta
-                        if Player.objects.filter(
-                            team=team, jersey_number=player_data["jersey_number"]
-                        ).exists():
-                            errors.append(
-                                f"Número de camiseta {player_data['jersey_number']} ya está en uso para {player_data['first_name']} {player_data['last_name']}"
-                            )
-                            continue
-
-                        player = Player.objects.create(
-                            team=team,
-                            first_name=player_data["first_name"],
-                            last_name=player_data["last_name"],
-                            jersey_number=player_data["jersey_number"],
-                            position=player_data["position"],
-                            birth_date=player_data["birth_date"],
-                            dni=player_data["dni"],
-                            phone_number=player_data["phone"],
-                            promo=player_data["promo"],
-                            profession=player_data["profession"],
-                        )
-                        created_players.append(player)
-
-                    except Exception as e:
-                        errors.append(
-                            f"Error creando jugador {player_data['first_name']} {player_data['last_name']} (fila {player_data.get('row_number', '?')}): {str(e)}"
-                        )
-
-                # Mostrar resultados
-                if created_players:
-                    messages.success(
-                        request,
-                        f"✅ Se crearon {len(created_players)} jugadores exitosamente.",
-                    )
-
-                if skipped_players:
-                    messages.info(
+                if "preview" in request.POST:
+                    preview = preview_players_import(players_data, team)
+                    return render(
                         request,
-                        f"⚠️ Se omitieron {len(skipped_players)} jugadores que ya existían.",
+                        "admin/teams/upload_players.html",
+                        {
+                            "form": form,
+                            "team": team,
+                            "import_key": import_key,
+                            "preview": {
+                                section: rows[:PLAYER_IMPORT_PREVIEW_LIMIT]
+                                for section, rows in preview.items()
+                            },
+                            "preview_counts": {
+                                section: len(rows) for section, rows in preview.items()
+                            },
+                            "preview_limit": PLAYER_IMPORT_PREVIEW_LIMIT,
+                        },
                     )
-                    for skip in skipped_players[:5]:  # Mostrar solo los primeros 5
-                        messages.info(request, f"Omitido: {skip}")
-
-                if errors:
-                    messages.error(request, f"❌ Se encontraron {len(errors)} errores:")
-                    for error in errors[:5]:  # Mostrar solo los primeros 5 errores
-                        messages.error(request, error)
 
+                _import_and_report(request, players_data, team)
+                cache.delete(import_key)
                 return redirect("admin:teams_team_changelist")
 
             except ValidationError as e:
@@ -116,3 +124,73 @@ def upload_players_from_excel(request):
         form = ExcelPlayerUploadForm()
 
     return render(request, "admin/teams/upload_players.html", {"form": form})
+
+
+def _commit_cached_import(request):
+    """Confirma una importación previsualizada usando la lectura cacheada"""
+    import_key = request.POST["import_key"]
+    try:
+        team = Team.objects.get(pk=request.POST.get("team"))
+    except (Team.DoesNotExist, ValueError):
+        messages.error(request, "Equipo no encontrado.")
+        return redirect("admin:upload_players_from_excel")
+
+    # Solo se confirma en el equipo que se previsualizó
+    players_data = None
+    if import_key.startswith(_player_import_key_prefix(team.pk)):
+        players_data = cache.get(import_key)
+
+    if players_data is None:
+        messages.error(
+            request,
+            "La previsualización expiró o no es válida. Vuelve a subir el archivo.",
+        )
+        return redirect("admin:upload_players_from_excel")
+
+    try:
+        _import_and_report(request, players_data, team)
+    except Exception as e:
+        messages.error(request, f"Error importando jugadores: {str(e)}")
+        return redirect("admin:upload_players_from_excel")
+
+    cache.delete(import_key)
+    return redirect("admin:teams_team_changelist")
+
+
+def _import_and_report(request, players_data, team):
+    """Crea los jugadores nuevos y muestra el resumen de la importación"""
+    created_players, preview = import_players(players_data, team)
+
+    skipped_players = [
+        f"{_player_label(player_data)} (DNI ya existe)"
+        for player_data in preview["duplicates"]
+    ]
+    errors = [
+        f"Número de camiseta {player_data['jersey_number']} ya está en uso para "
+        f"{_player_label(player_data)}"
+        for player_data in preview["jersey_conflicts"]
+    ] + [
+        f"Fila {player_data['row_number']} ({_player_label(player_data)}): "
+        f"{player_data['errors']}"
+        for player_data in preview["invalid"]
+    ]
+
+    # Mostrar resultados
+    if created_players:
+        messages.success(
+            request,
+            f"✅ Se crearon {len(created_players)} jugadores exitosamente.",
+        )
+
+    if skipped_players:
+        messages.info(
+            request,
+            f"⚠️ Se omitieron {len(skipped_players)} jugadores que ya existían.",
+        )
+        for skip in skipped_players[:5]:  # Mostrar solo los primeros 5
+            messages.info(request, f"Omitido: {skip}")
+
+    if errors:
+        messages.error(request, f"❌ Se encontraron {len(errors)} errores:")
+        for error in errors[:5]:  # Mostrar solo los primeros 5 errores
+            messages.error(request, error)
@@ -22,9 +22,11 @@ Notas:
 - Las rondas permiten organizar los partidos por fechas
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 
+from .generation import generate_tournament_fixtures
 from .models import Phase, Round, Tournament, TournamentCategory
+from .results import RULE_FIELDS, recompute_results, recompute_tournament_results
 
 
 @admin.register(Tournament)
@@ -43,15 +45,45 @@ class TournamentAdmin(admin.ModelAdmin):
     - Filtrado por año y fecha
     - Búsqueda por nombre y año
     - Jerarquía de fechas para navegación fácil
+    - Acción para generar los partidos de todas las categorías
     """
 
     list_display = ["name", "year"]
     list_filter = ["year"]
     search_fields = ["name", "year"]
     ordering = ["-year", "name"]
+    actions = ["generate_fixtures", "recompute_results"]
 
     fieldsets = (("Información del Torneo", {"fields": ("name", "year")}),)
 
+    @admin.action(description="Generar partidos de todas las categorías")
+    def generate_fixtures(self, request, queryset):
+        """Genera la fase pendiente de cada categoría desde el inicio del torneo"""
+        for tournament in queryset:
+            results = generate_tournament_fixtures(tournament)
+            created = sum(result[2] for result in results)
+            errors = [
+                f"{category.category_name}: {error}"
+                for category, _, _, error in results
+                if error
+            ]
+            self.message_user(
+                request, f"{tournament}: {created} partidos creados", messages.SUCCESS
+            )
+            if errors:
+                self.message_user(request, "; ".join(errors), messages.ERROR)
+
+    @admin.action(description="Recalcular resultados y puntos")
+    def recompute_results(self, request, queryset):
+        """Recalcula result y points de todos los partidos con las reglas de cada fase"""
+        for tournament in queryset:
+            updated = recompute_tournament_results(tournament)
+            self.message_user(
+                request,
+                f"{tournament}: {updated} resultados actualizados",
+                messages.SUCCESS,
+            )
+
 
 class PhaseInline(admin.TabularInline):
     """
@@ -100,6 +132,10 @@ class TournamentCategoryAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        """TournamentCategory.__str__ muestra el torneo (autocompletado)"""
+        return super().get_queryset(request).select_related("tournament")
+
 
 class RoundInline(admin.TabularInline):
     """
@@ -126,6 +162,9 @@ class PhaseAdmin(admin.ModelAdmin):
     - tournament_category: Categoría a la que pertenece
     - phase_name: Nombre de la fase
     - phase_type: Tipo de fase (league/knockout)
+    - win_points/draw_points/loss_points, draw_resolution y puntos por
+      penales: reglas de puntuación (al cambiarlas se recalculan los
+      resultados de la fase)
 
     Funcionalidades:
     - Inline para gestionar rondas directamente
@@ -143,6 +182,12 @@ class PhaseAdmin(admin.ModelAdmin):
     ordering = ["tournament_category", "id"]
     inlines = [RoundInline]
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Si cambian las reglas de puntuación se recalculan sus partidos
+        if change and set(form.changed_data) & set(RULE_FIELDS):
+            recompute_results([obj])
+
 
 @admin.register(Round)
 class RoundAdmin(admin.ModelAdmin):
@@ -169,3 +214,11 @@ class RoundAdmin(admin.ModelAdmin):
     list_filter = ["phase__phase_type", "phase__tournament_category__tournament"]
     search_fields = ["round_name", "phase__phase_name"]
     ordering = ["phase", "id"]
+
+    def get_queryset(self, request):
+        """Round.__str__ recorre fase, categoría y torneo"""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("phase__tournament_category__tournament")
+        )
@@ -0,0 +1,417 @@
+"""
+Cuadro Eliminatorio
+===================
+
+Motor de llaves para fases con phase_type="knockout".
+
+- create_knockout_bracket: siembra los equipos (por tabla de la liga),
+  asigna byes a los mejores sembrados, crea las rondas que falten y todos
+  los partidos del cuadro; los cruces de rondas posteriores quedan como
+  partidos sin equipos hasta que se conozcan los ganadores.
+- advance_winner: cuando un partido del cuadro finaliza, pasa al ganador
+  (goles y, si hay empate, penales) al cruce siguiente.
+- get_bracket: JSON del cuadro para clientes, precalculado en caché e
+  invalidado cada vez que cambia un partido de la fase.
+
+El cruce en la posición p de una ronda alimenta al cruce p // 2 de la
+ronda siguiente: las posiciones pares ocupan el lado local y las impares
+el visitante.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+
+from matches.models import Match, MatchTeam
+from project.replicas import reading_from_replicas
+
+from .fixtures import DEFAULT_MATCH_TIME
+from .models import Round
+from .standings import league_standings
+
+# Código y nombre de cada ronda según la cantidad de cruces
+BRACKET_ROUNDS = {
+    1: ("F", "Final"),
+    2: ("SF", "Semifinal"),
+    4: ("QF", "Cuartos de Final"),
+    8: ("R16", "Octavos de Final"),
+    16: ("R32", "Dieciseisavos de Final"),
+}
+
+
+def bracket_cache_key(phase_id):
+    return f"tournaments:bracket:{phase_id}"
+
+
+def invalidate_bracket(phase_id):
+    cache.delete(bracket_cache_key(phase_id))
+
+
+def bracket_round_code(match_count):
+    """Código de la ronda con `match_count` cruces (F, SF, QF, R16...)"""
+    if match_count in BRACKET_ROUNDS:
+        return BRACKET_ROUNDS[match_count][0]
+    return f"R{match_count * 2}"
+
+
+def _bracket_round_name(match_count):
+    if match_count in BRACKET_ROUNDS:
+        return BRACKET_ROUNDS[match_count][1]
+    return f"Ronda de {match_count * 2}"
+
+
+def round_match_count(round_number):
+    """Inversa de bracket_round_code (None si no es una ronda del cuadro)"""
+    for match_count, (code, _) in BRACKET_ROUNDS.items():
+        if round_number == code:
+            return match_count
+    if round_number and round_number[0] == "R" and round_number[1:].isdigit():
+        return int(round_number[1:]) // 2
+    return None
+
+
+def seeding_order(bracket_size):
+    """
+    Orden de siembra estándar: con 8 lugares devuelve [1, 8, 4, 5, 2, 7, 3, 6],
+    de modo que los mejores sembrados solo se cruzan en las últimas rondas
+    """
+    seeds = [1]
+    while len(seeds) < bracket_size:
+        size = len(seeds) * 2
+        seeds = [seed for top in seeds for seed in (top, size + 1 - top)]
+    return seeds
+
+
+def seed_teams(phase, qualifiers=None):
+    """
+    Equipos sembrados para la fase eliminatoria
+
+    Usa la tabla de la primera fase de liga de la categoría; si no existe,
+    el orden alfabético de los equipos.
+    """
+    league_phase = (
+        phase.tournament_category.phases.filter(phase_type="league")
+        .order_by("id")
+        .first()
+    )
+    if league_phase is not None:
+        teams = [row["team"] for row in league_standings(league_phase)]
+    else:
+        teams = list(phase.tournament_category.teams.order_by("name"))
+
+    return teams[:qualifiers] if qualifiers else teams
+
+
+def ensure_bracket_rounds(phase, round_count):
+    """
+    Rondas del cuadro desde la primera hasta la final, reutilizando las que
+    ya existen por código (QF, SF, F...) y creando las que falten
+    """
+    existing = {round_obj.round_number: round_obj for round_obj in phase.rounds.all()}
+
+    codes = [
+        (
+            2 ** (round_count - depth - 1),
+            bracket_round_code(2 ** (round_count - depth - 1)),
+        )
+        for depth in range(round_count)
+    ]
+    missing = [
+        Round(
+            phase=phase,
+            round_name=_bracket_round_name(match_count),
+            round_number=code,
+        )
+        for match_count, code in codes
+        if code not in existing
+    ]
+    for round_obj in Round.objects.bulk_create(missing):
+        existing[round_obj.round_number] = round_obj
+
+    return [existing[code] for _, code in codes]
+
+
+def create_knockout_bracket(phase, teams, start_date, days_between=7):
+    """
+    Crea el cuadro completo de una fase eliminatoria
+
+    Args:
+        phase: Fase eliminatoria
+        teams: Equipos en orden de siembra (el primero es el mejor sembrado)
+        start_date: Fecha de la primera ronda
+        days_between: Días entre rondas
+
+    Returns:
+        Lista de Match creados (todas las rondas)
+    """
+    teams = list(teams)
+    if len(teams) < 2:
+        return []
+
+    round_count = (len(teams) - 1).bit_length()
+    bracket_size = 2**round_count
+
+    # Los lugares sin equipo (sembrados > cantidad de equipos) son byes
+    slots = [
+        teams[seed - 1] if seed <= len(teams) else None
+        for seed in seeding_order(bracket_size)
+    ]
+
+    with transaction.atomic():
+        rounds = ensure_bracket_rounds(phase, round_count)
+
+        matches = []
+        for depth, round_obj in enumerate(rounds):
+            match_date = start_date + timedelta(days=depth * days_between)
+            for position in range(bracket_size // 2 ** (depth + 1)):
+                # En la primera ronda no se crea partido si un lado es bye
+                if depth == 0 and None in slots[position * 2 : position * 2 + 2]:
+                    continue
+                matches.append(
+                    Match(
+                        round=round_obj,
+                        date=match_date,
+                        time=DEFAULT_MATCH_TIME,
+                        status="scheduled",
+                        bracket_position=position,
+                    )
+                )
+        matches = Match.objects.bulk_create(matches)
+
+        by_slot = {(match.round_id, match.bracket_position): match for match in matches}
+        match_teams = []
+        for position in range(bracket_size // 2):
+            home, away = slots[position * 2], slots[position * 2 + 1]
+            if home is not None and away is not None:
+                match = by_slot[(rounds[0].id, position)]
+                match_teams += [
+                    _new_match_team(match, home),
+                    _new_match_team(match, away),
+                ]
+            elif round_count > 1:
+                # El equipo con bye pasa directo al cruce siguiente
+                match = by_slot[(rounds[1].id, position // 2)]
+                match_teams.append(_new_match_team(match, home or away))
+        MatchTeam.objects.bulk_create(match_teams)
+
+    invalidate_bracket(phase.id)
+    return matches
+
+
+def _new_match_team(match, team):
+    return MatchTeam(match=match, team=team, goals=0, penalty_goals=0, points=0)
+
+
+def match_winner(match_teams):
+    """
+    MatchTeam ganador de un cruce: más goles y, si empatan, más penales
+
+    Returns:
+        (ganador, perdedor) o None si no hay ganador definido
+    """
+    if len(match_teams) != 2:
+        return None
+
+    first, second = match_teams
+    first_score = (first.goals or 0, first.penalty_goals or 0)
+    second_score = (second.goals or 0, second.penalty_goals or 0)
+    if first_score == second_score:
+        return None
+    return (first, second) if first_score > second_score else (second, first)
+
+
+def advance_winner(match):
+    """
+    Pasa al ganador de un cruce finalizado al cruce siguiente del cuadro
+
+    Es idempotente: si el resultado se corrige y cambia el ganador, el
+    equipo que había avanzado se reemplaza (mientras el cruce siguiente no
+    haya finalizado).
+
+    Returns:
+        MatchTeam creado/existente en el cruce siguiente o None
+    """
+    if match.bracket_position is None or match.status != "finished":
+        return None
+
+    round_obj = match.round
+    match_count = round_match_count(round_obj.round_number)
+    if match_count is None or match_count == 1:
+        # La final no alimenta a ningún cruce
+        invalidate_bracket(round_obj.phase_id)
+        return None
+
+    result = match_winner(list(match.match_teams.all()))
+    if result is None:
+        return None
+    winner, loser = result
+
+    next_match = (
+        Match.objects.filter(
+            round__phase_id=round_obj.phase_id,
+            round__round_number=bracket_round_code(match_count // 2),
+            bracket_position=match.bracket_position // 2,
+        )
+        .exclude(status="finished")
+        .first()
+    )
+    if next_match is None:
+        return None
+
+    with transaction.atomic():
+        next_match.match_teams.filter(team_id=loser.team_id).delete()
+        advanced, _ = MatchTeam.objects.get_or_create(
+            match=next_match,
+            team_id=winner.team_id,
+            defaults={"goals": 0, "penalty_goals": 0, "points": 0},
+        )
+
+    invalidate_bracket(round_obj.phase_id)
+    return advanced
+
+
+def get_bracket(phase):
+    """JSON del cuadro eliminatorio (precalculado en caché)"""
+    key = bracket_cache_key(phase.id)
+    bracket = cache.get(key)
+    if bracket is None:
+        # Desde la principal: una réplica atrasada dejaría en la caché (sin
+        # vencimiento) un cuadro anterior a la última invalidación
+        with reading_from_replicas(False):
+            bracket = build_bracket(phase)
+        cache.set(key, bracket, None)
+    return bracket
+
+
+def build_bracket(phase):
+    """
+    Arma el JSON del cuadro: rondas en orden, cruces por posición con
+    local/visitante, resultado, ganador y byes de la primera ronda
+    """
+    rounds = [
+        round_obj
+        for round_obj in phase.rounds.all()
+        if round_match_count(round_obj.round_number) is not None
+    ]
+    rounds.sort(key=lambda round_obj: -round_match_count(round_obj.round_number))
+
+    matches = (
+        Match.objects.filter(round__phase=phase, bracket_position__isnull=False)
+        .prefetch_related("match_teams__team")
+        .order_by("bracket_position")
+    )
+    by_round = {}
+    for match in matches:
+        by_round.setdefault(match.round_id, {})[match.bracket_position] = match
+
+    # Solo las rondas con partidos forman parte del cuadro
+    rounds = [round_obj for round_obj in rounds if round_obj.id in by_round]
+
+    data = {"phase": phase.id, "phase_name": phase.phase_name, "rounds": []}
+    previous = {}
+    for depth, round_obj in enumerate(rounds):
+        round_matches = by_round[round_obj.id]
+        match_count = round_match_count(round_obj.round_number)
+        entries = []
+        for position in range(match_count):
+            match = round_matches.get(position)
+            if match is None:
+                continue
+            entries.append(_bracket_match(match, previous, depth == 0))
+        if depth == 1:
+            # Byes: cruces de la primera ronda que no se jugaron
+            first = data["rounds"][0]["matches"]
+            first += _bracket_byes(round_matches, previous)
+            first.sort(key=lambda entry: entry["position"])
+        data["rounds"].append(
+            {
+                "round_id": round_obj.id,
+                "round_name": round_obj.round_name,
+                "round_number": round_obj.round_number,
+                "matches": entries,
+            }
+        )
+        previous = round_matches
+
+    return data
+
+
+def _team_entry(match_team):
+    if match_team is None:
+        return None
+    return {
+        "team_id": match_team.team_id,
+        "team_name": match_team.team.name,
+        "goals": match_team.goals,
+        "penalty_goals": match_team.penalty_goals,
+    }
+
+
+def _match_sides(match, previous):
+    """
+    (local, visitante) de un cruce: en la primera ronda por orden de
+    creación; después, según de qué cruce anterior viene cada equipo
+    """
+    match_teams = sorted(match.match_teams.all(), key=lambda match_team: match_team.id)
+    if not previous:
+        match_teams += [None] * (2 - len(match_teams))
+        return match_teams[0], match_teams[1]
+
+    home_feeder = previous.get(match.bracket_position * 2)
+    away_feeder = previous.get(match.bracket_position * 2 + 1)
+    home = away = None
+    for match_team in match_teams:
+        if away_feeder is not None and _played_in(away_feeder, match_team.team_id):
+            away = match_team
+        elif home_feeder is not None and _played_in(home_feeder, match_team.team_id):
+            home = match_team
+        elif home_feeder is None:
+            home = match_team
+        else:
+            away = match_team
+    return home, away
+
+
+def _played_in(match, team_id):
+    return any(match_team.team_id == team_id for match_team in match.match_teams.all())
+
+
+def _bracket_match(match, previous, first_round):
+    home, away = _match_sides(match, {} if first_round else previous)
+    result = None
+    if match.status == "finished":
+        result = match_winner([side for side in (home, away) if side is not None])
+    return {
+        "match_id": match.id,
+        "position": match.bracket_position,
+        "date": match.date.isoformat() if match.date else None,
+        "time": match.time.strftime("%H:%M") if match.time else None,
+        "status": match.status,
+        "home": _team_entry(home),
+        "away": _team_entry(away),
+        "winner_team_id": result[0].team_id if result else None,
+    }
+
+
+def _bracket_byes(round_matches, previous):
+    byes = []
+    for position, match in round_matches.items():
+        for feeder_position in (position * 2, position * 2 + 1):
+            if feeder_position in previous:
+                continue
+            home, away = _match_sides(match, previous)
+            side = home if feeder_position % 2 == 0 else away
+            byes.append(
+                {
+                    "match_id": None,
+                    "position": feeder_position,
+                    "date": None,
+                    "time": None,
+                    "status": "bye",
+                    "home": _team_entry(side),
+                    "away": None,
+                    "winner_team_id": side.team_id if side else None,
+                }
+            )
+    return byes
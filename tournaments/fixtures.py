@@ -0,0 +1,158 @@
+"""
+Generación de Fixtures
+======================
+
+Funciones para generar los partidos de una fase a partir de sus equipos.
+
+- round_robin_pairings: calcula las jornadas de un todos contra todos con el
+  método del círculo (tablas de Berger), sin tocar la base de datos.
+- create_league_fixture: reparte esas jornadas en las rondas de la fase y
+  persiste todos los Match/MatchTeam con bulk_create.
+
+Convención de local/visitante: MatchTeam no tiene un campo "local", así que
+el equipo local es el primer MatchTeam creado (menor id) de cada partido.
+"""
+
+from datetime import time, timedelta
+
+from django.db import transaction
+
+from matches.models import Match, MatchTeam
+
+from .models import Round
+
+# Hora por defecto de los partidos generados
+DEFAULT_MATCH_TIME = time(15, 0)
+
+
+def round_robin_pairings(teams, double_round_robin=False):
+    """
+    Calcula las jornadas de un todos contra todos (método del círculo)
+
+    Cada equipo juega una vez por jornada; con un número impar de equipos se
+    agrega un "libre" y el equipo emparejado con él descansa esa jornada.
+    Las localías quedan balanceadas (diferencia máxima de 1 entre partidos
+    de local y de visitante) con el mínimo de localías consecutivas.
+
+    Args:
+        teams: Lista de equipos (en el orden del sorteo)
+        double_round_robin: Si es True agrega la vuelta con localías invertidas
+
+    Returns:
+        Lista de jornadas; cada jornada es una lista de tuplas (local, visitante)
+    """
+    teams = list(teams)
+    if len(teams) < 2:
+        return []
+
+    # Con número impar, el "libre" queda fijo y todos los equipos rotan
+    fixed = None if len(teams) % 2 else teams[0]
+    rotating = teams if fixed is None else teams[1:]
+    size = len(rotating) + 1
+
+    matchdays = []
+    for matchday_index in range(size - 1):
+        slots = [fixed] + rotating
+        matchday = []
+        for i in range(size // 2):
+            home, away = slots[i], slots[size - 1 - i]
+            if (i == 0 and matchday_index % 2 == 1) or (i > 0 and i % 2 == 1):
+                home, away = away, home
+            if home is not None and away is not None:
+                matchday.append((home, away))
+        matchdays.append(matchday)
+
+        # Rotar una posición (el primero queda fijo)
+        rotating = rotating[-1:] + rotating[:-1]
+
+    if double_round_robin:
+        matchdays += [[(away, home) for home, away in day] for day in matchdays]
+
+    return matchdays
+
+
+def ensure_rounds(phase, count, first_round=None):
+    """
+    Devuelve `count` rondas de la fase (desde `first_round`), creando las que
+    falten como "Jornada N" en un único bulk_create
+    """
+    rounds = list(phase.rounds.order_by("id"))
+    if first_round is not None:
+        rounds = [round_obj for round_obj in rounds if round_obj.id >= first_round.id]
+
+    missing = count - len(rounds)
+    if missing > 0:
+        total = phase.rounds.count()
+        new_rounds = [
+            Round(
+                phase=phase,
+                round_name=f"Jornada {number}",
+                round_number=str(number),
+            )
+            for number in range(total + 1, total + missing + 1)
+        ]
+        rounds += Round.objects.bulk_create(new_rounds)
+
+    return rounds[:count]
+
+
+def bulk_create_matches(fixtures, status="scheduled"):
+    """
+    Persiste partidos y sus dos MatchTeam con dos bulk_create
+
+    Args:
+        fixtures: Iterable de tuplas (round, date, time, local, visitante)
+
+    Returns:
+        Lista de Match creados
+    """
+    fixtures = list(fixtures)
+    matches = Match.objects.bulk_create(
+        [
+            Match(round=round_obj, date=match_date, time=match_time, status=status)
+            for round_obj, match_date, match_time, _, _ in fixtures
+        ]
+    )
+
+    match_teams = []
+    for match, (_, _, _, home, away) in zip(matches, fixtures):
+        # El local se crea primero para que tenga el menor id
+        for team in (home, away):
+            match_teams.append(
+                MatchTeam(match=match, team=team, goals=0, penalty_goals=0, points=0)
+            )
+    MatchTeam.objects.bulk_create(match_teams)
+
+    return matches
+
+
+def create_league_fixture(
+    phase,
+    teams,
+    start_date,
+    days_between=7,
+    double_round_robin=False,
+    first_round=None,
+    match_time=DEFAULT_MATCH_TIME,
+):
+    """
+    Genera el todos contra todos de una fase de liga
+
+    Cada jornada se asigna a una ronda de la fase (creando las que falten) y
+    se juega `days_between` días después de la anterior.
+
+    Returns:
+        Lista de Match creados
+    """
+    matchdays = round_robin_pairings(teams, double_round_robin)
+
+    with transaction.atomic():
+        rounds = ensure_rounds(phase, len(matchdays), first_round)
+
+        fixtures = []
+        for index, (round_obj, matchday) in enumerate(zip(rounds, matchdays)):
+            match_date = start_date + timedelta(days=index * days_between)
+            for home, away in matchday:
+                fixtures.append((round_obj, match_date, match_time, home, away))
+
+        return bulk_create_matches(fixtures)
@@ -0,0 +1,151 @@
+"""
+Generación de Partidos por Torneo
+=================================
+
+Genera los partidos de todas las categorías de un torneo en una sola
+operación. Las categorías son independientes entre sí, así que cada una se
+procesa en su propio hilo (con su propia conexión a la base de datos) y se
+persiste en su propia transacción con bulk_create: si una categoría falla,
+las demás quedan generadas.
+
+Por cada categoría se genera la primera fase que todavía no tiene partidos:
+- league: todos contra todos (fixtures.create_league_fixture)
+- knockout: cuadro completo (brackets.create_knockout_bracket), solo si la
+  categoría no tiene una fase de liga previa; si la tiene, el cuadro se
+  genera al terminar la liga para sembrar por la tabla.
+
+Con SQLite las escrituras se serializan, por lo que se usa un solo hilo.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, connections, transaction
+
+from matches.models import Match
+
+from .brackets import create_knockout_bracket
+from .fixtures import DEFAULT_MATCH_TIME, create_league_fixture
+from .models import TournamentCategory
+
+# Hilos por defecto para generar categorías en paralelo
+DEFAULT_MAX_WORKERS = 4
+
+
+def pending_phase(category):
+    """
+    Primera fase de la categoría sin partidos, o None si no hay nada que
+    generar (o si es una eliminatoria que depende de una liga)
+    """
+    phases = list(category.phases.order_by("id"))
+    generated = set(
+        Match.objects.filter(round__phase__in=phases)
+        .values_list("round__phase_id", flat=True)
+        .distinct()
+    )
+    for index, phase in enumerate(phases):
+        if phase.id in generated:
+            continue
+        if phase.phase_type == "knockout" and any(
+            previous.phase_type == "league" for previous in phases[:index]
+        ):
+            return None
+        return phase
+    return None
+
+
+def generate_category_fixture(
+    category,
+    start_date,
+    days_between=7,
+    double_round_robin=False,
+    seed=None,
+    match_time=DEFAULT_MATCH_TIME,
+):
+    """
+    Genera los partidos de la fase pendiente de una categoría
+
+    Returns:
+        Tupla (fase, cantidad de partidos creados); fase es None si no había
+        nada que generar
+    """
+    phase = pending_phase(category)
+    if phase is None:
+        return None, 0
+
+    teams = list(category.teams.order_by("id"))
+    if len(teams) < 2:
+        return phase, 0
+
+    # Semilla propia por categoría para que el sorteo sea reproducible
+    rng = random.Random(None if seed is None else f"{seed}:{category.id}")
+    rng.shuffle(teams)
+
+    with transaction.atomic():
+        if phase.phase_type == "league":
+            matches = create_league_fixture(
+                phase,
+                teams,
+                start_date,
+                days_between,
+                double_round_robin=double_round_robin,
+                match_time=match_time,
+            )
+        else:
+            matches = create_knockout_bracket(phase, teams, start_date, days_between)
+
+    return phase, len(matches)
+
+
+def _generate_in_thread(category, **options):
+    try:
+        return generate_category_fixture(category, **options)
+    finally:
+        # Cada hilo abre su propia conexión; cerrarla evita dejarla colgada
+        connections.close_all()
+
+
+def generate_tournament_fixtures(
+    tournament, start_date=None, max_workers=DEFAULT_MAX_WORKERS, **options
+):
+    """
+    Genera los partidos de todas las categorías de un torneo
+
+    Args:
+        tournament: Torneo
+        start_date: Fecha de la primera jornada (por defecto, inicio del torneo)
+        max_workers: Categorías procesadas en paralelo
+        **options: days_between, double_round_robin, seed, match_time
+
+    Returns:
+        Lista de tuplas (categoría, fase, partidos creados, error) en el
+        orden de las categorías
+    """
+    options["start_date"] = start_date or tournament.start_date
+    categories = list(TournamentCategory.objects.filter(tournament=tournament))
+
+    if connection.vendor == "sqlite" or connection.in_atomic_block:
+        # SQLite admite un solo escritor, y dentro de una transacción los
+        # hilos no verían los datos todavía sin confirmar
+        max_workers = 1
+
+    results = []
+    if max_workers <= 1 or len(categories) <= 1:
+        for category in categories:
+            results.append(_run(generate_category_fixture, category, options))
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(categories))) as pool:
+        futures = [
+            pool.submit(_run, _generate_in_thread, category, options)
+            for category in categories
+        ]
+        return [future.result() for future in futures]
+
+
+def _run(generate, category, options):
+    try:
+        phase, created = generate(category, **options)
+    except Exception as e:
+        return category, None, 0, str(e)
+    return category, phase, created, None
@@ -1,11 +1,12 @@
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 
-from matches.models import Match, MatchTeam
+from matches.models import Match
 from teams.models import Team
+from tournaments.brackets import create_knockout_bracket, seed_teams
+from tournaments.fixtures import create_league_fixture
 from tournaments.models import Phase, Round, Tournament, TournamentCategory
 
 
@@ -21,7 +22,12 @@ class Command(BaseCommand):
         )
         parser.add_argument("--phase-id", type=int, help="ID de la fase", required=True)
         parser.add_argument(
-            "--round-id", type=int, help="ID de la ronda", required=True
+            "--round-id",
+            type=int,
+            help=(
+                "ID de la ronda. En liga es la primera jornada a usar "
+                "(por defecto la primera de la fase); en eliminatorias se ignora"
+            ),
         )
         parser.add_argument(
             "--start-date", type=str, help="Fecha de inicio (YYYY-MM-DD)", required=True
@@ -32,6 +38,21 @@ class Command(BaseCommand):
             default=7,
             help="Días entre partidos (default: 7)",
         )
+        parser.add_argument(
+            "--double-round-robin",
+            action="store_true",
+            help="En liga, genera ida y vuelta (localías invertidas en la vuelta)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Semilla para el sorteo del orden de equipos (reproducible)",
+        )
+        parser.add_argument(
+            "--qualifiers",
+            type=int,
+            help="En eliminatorias, cantidad de equipos clasificados de la liga",
+        )
 
     def handle(self, *args, **options):
         try:
@@ -40,18 +61,21 @@ class Command(BaseCommand):
                 id=options["tournament_category_id"]
             )
             phase = Phase.objects.get(id=options["phase_id"])
-            round_obj = Round.objects.get(id=options["round_id"])
+            round_obj = None
+            if options["round_id"]:
+                round_obj = Round.objects.get(id=options["round_id"])
 
-            # Verificar que la ronda pertenece a la fase
-            if round_obj.phase != phase:
-                raise CommandError("La ronda no pertenece a la fase especificada")
+                # Verificar que la ronda pertenece a la fase
+                if round_obj.phase_id != phase.id:
+                    raise CommandError("La ronda no pertenece a la fase especificada")
 
             # Verificar que la fase pertenece a la categoría
-            if phase.tournament_category != tournament_category:
+            if phase.tournament_category_id != tournament_category.id:
                 raise CommandError("La fase no pertenece a la categoría especificada")
 
             # Obtener equipos de la categoría
-            teams = Team.objects.filter(tournament_category=tournament_category)
+            teams = list(Team.objects.filter(tournament_category=tournament_category))
+            random.Random(options["seed"]).shuffle(teams)
 
             if len(teams) < 2:
                 raise CommandError(
@@ -61,24 +85,27 @@ class Command(BaseCommand):
             # Generar partidos según el tipo de fase
             if phase.phase_type == "league":
                 self.generate_league_matches(
+                    phase,
                     round_obj,
                     teams,
                     options["start_date"],
                     options["days_between_matches"],
+                    options["double_round_robin"],
                 )
             elif phase.phase_type == "knockout":
                 self.generate_knockout_matches(
-                    round_obj,
+                    phase,
                     teams,
                     options["start_date"],
                     options["days_between_matches"],
+                    options["qualifiers"],
                 )
             else:
                 raise CommandError("Tipo de fase no soportado")
 
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"Partidos generados exitosamente para {tournament_category.category_name} - {phase.phase_name} - {round_obj.round_name}"
+                    f"Partidos generados exitosamente para {tournament_category.category_name} - {phase.phase_name}"
                 )
             )
 
@@ -89,100 +116,62 @@ class Command(BaseCommand):
         except Round.DoesNotExist:
             raise CommandError("Ronda no encontrada")
 
-    def generate_league_matches(self, round_obj, teams, start_date, days_between):
-        """Genera partidos para fase de liga (todos contra todos)"""
-        with transaction.atomic():
-            # Crear lista de equipos y mezclar
-            teams_list = list(teams)
-            random.shuffle(teams_list)
-
-            # Generar partidos (todos contra todos)
-            matches_created = 0
-            current_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-
-            for i in range(len(teams_list)):
-                for j in range(i + 1, len(teams_list)):
-                    # Crear partido
-                    match = Match.objects.create(
-                        round=round_obj,
-                        date=current_date,
-                        time=datetime.strptime("15:00", "%H:%M").time(),
-                        status="scheduled",
-                    )
-
-                    # Crear MatchTeam para cada equipo
-                    MatchTeam.objects.create(
-                        match=match,
-                        team=teams_list[i],
-                        goals=0,
-                        penalty_goals=0,
-                        points=0,
-                    )
-
-                    MatchTeam.objects.create(
-                        match=match,
-                        team=teams_list[j],
-                        goals=0,
-                        penalty_goals=0,
-                        points=0,
-                    )
-
-                    matches_created += 1
-
-                    # Avanzar fecha cada 2 partidos
-                    if matches_created % 2 == 0:
-                        current_date += timedelta(days=days_between)
-
-            self.stdout.write(f"Creados {matches_created} partidos de liga")
-
-    def generate_knockout_matches(self, round_obj, teams, start_date, days_between):
-        """Genera partidos para fase eliminatoria"""
-        with transaction.atomic():
-            teams_list = list(teams)
-            random.shuffle(teams_list)
-
-            # Verificar que el número de equipos sea potencia de 2
-            num_teams = len(teams_list)
-            if num_teams & (num_teams - 1) != 0:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"El número de equipos ({num_teams}) no es potencia de 2. "
-                        "Algunos equipos tendrán bye en la primera ronda."
-                    )
+    def generate_league_matches(
+        self, phase, first_round, teams, start_date, days_between, double_round_robin
+    ):
+        """
+        Genera partidos para fase de liga (todos contra todos)
+
+        Usa el método del círculo: una jornada por ronda de la fase, cada
+        equipo juega una vez por jornada y las localías quedan balanceadas.
+        """
+        matches = create_league_fixture(
+            phase,
+            teams,
+            datetime.strptime(start_date, "%Y-%m-%d").date(),
+            days_between,
+            double_round_robin=double_round_robin,
+            first_round=first_round,
+        )
+
+        self.stdout.write(f"Creados {len(matches)} partidos de liga")
+
+    def generate_knockout_matches(
+        self, phase, teams, start_date, days_between, qualifiers
+    ):
+        """
+        Genera el cuadro completo de una fase eliminatoria
+
+        Los equipos se siembran por la tabla de la fase de liga de la
+        categoría (si existe); los mejores sembrados reciben bye cuando la
+        cantidad de equipos no es potencia de 2. Las rondas posteriores
+        quedan creadas sin equipos y se completan al finalizar cada cruce.
+        """
+        if Match.objects.filter(round__phase=phase).exists():
+            raise CommandError("La fase ya tiene partidos generados")
+
+        if phase.tournament_category.phases.filter(phase_type="league").exists():
+            teams = seed_teams(phase, qualifiers)
+        elif qualifiers:
+            teams = teams[:qualifiers]
+
+        if len(teams) < 2:
+            raise CommandError("Se necesitan al menos 2 equipos para generar partidos")
+
+        num_teams = len(teams)
+        if num_teams & (num_teams - 1) != 0:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"El número de equipos ({num_teams}) no es potencia de 2. "
+                    "Los mejores sembrados tendrán bye en la primera ronda."
                 )
+            )
+
+        matches = create_knockout_bracket(
+            phase,
+            teams,
+            datetime.strptime(start_date, "%Y-%m-%d").date(),
+            days_between,
+        )
 
-            current_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            matches_created = 0
-
-            # Crear partidos por parejas
-            for i in range(0, len(teams_list), 2):
-                if i + 1 < len(teams_list):
-                    # Crear partido
-                    match = Match.objects.create(
-                        round=round_obj,
-                        date=current_date,
-                        time=datetime.strptime("15:00", "%H:%M").time(),
-                        status="scheduled",
-                    )
-
-                    # Crear MatchTeam para cada equipo
-                    MatchTeam.objects.create(
-                        match=match,
-                        team=teams_list[i],
-                        goals=0,
-                        penalty_goals=0,
-                        points=0,
-                    )
-
-                    MatchTeam.objects.create(
-                        match=match,
-                        team=teams_list[i + 1],
-                        goals=0,
-                        penalty_goals=0,
-                        points=0,
-                    )
-
-                    matches_created += 1
-                    current_date += timedelta(days=days_between)
-
-            self.stdout.write(f"Creados {matches_created} partidos eliminatorios")
+        self.stdout.write(f"Creados {len(matches)} partidos eliminatorios")
@@ -0,0 +1,323 @@
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from events.models import MatchEvent
+from matches.models import Match, MatchTeam
+from teams.models import Player, Team
+from tournaments.brackets import create_knockout_bracket, seed_teams
+from tournaments.fixtures import create_league_fixture
+from tournaments.results import recompute_tournament_results
+from tournaments.scaffolding import create_tournament_from_template
+
+# fmt: off
+FIRST_NAMES = [
+    "Juan", "Carlos", "José", "Luis", "Jorge", "Miguel", "Pedro", "Diego",
+    "Martín", "Pablo", "Sergio", "Andrés", "Fernando", "Ricardo", "Alejandro",
+    "Javier", "Daniel", "Raúl", "Gustavo", "Eduardo", "Manuel", "César",
+    "Víctor", "Hugo", "Renzo", "Bruno", "Mateo", "Sebastián", "Franco", "Iván",
+]
+
+LAST_NAMES = [
+    "García", "Rodríguez", "Quispe", "Flores", "Sánchez", "Ramírez", "Torres",
+    "Mamani", "Díaz", "Vargas", "Castillo", "Rojas", "Mendoza", "Chávez",
+    "Huamán", "Gutiérrez", "Espinoza", "Ramos", "Cruz", "Romero", "Salazar",
+    "Paredes", "Medina", "Herrera", "Vega", "Aguilar", "Cáceres", "Morales",
+    "Castro", "Silva",
+]
+
+PROFESSIONS = [
+    "Ingeniero", "Docente", "Contador", "Abogado", "Técnico electricista",
+    "Mecánico", "Administrador", "Médico", "Comerciante", "Lic. Trabajo Social",
+]
+# fmt: on
+
+# Distribución de goles por equipo en un partido (0 a 6)
+GOAL_WEIGHTS = [30, 33, 20, 10, 4, 2, 1]
+
+# Lote de filas por INSERT/UPDATE
+BATCH_SIZE = 2000
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera un torneo sintético a escala (categorías, equipos, jugadores, "
+        "partidos, resultados y eventos) con inserciones masivas y semilla fija"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--categories", type=int, default=5, help="Categorías (default: 5)"
+        )
+        parser.add_argument(
+            "--teams-per-category",
+            type=int,
+            default=6,
+            help="Equipos por categoría (default: 6)",
+        )
+        parser.add_argument(
+            "--players-per-team",
+            type=int,
+            default=18,
+            help="Jugadores por equipo (default: 18)",
+        )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Multiplica la cantidad de categorías (ej: 10 para 10x)",
+        )
+        parser.add_argument(
+            "--played-ratio",
+            type=float,
+            default=1.0,
+            help="Fracción de partidos de liga con resultado (default: 1.0)",
+        )
+        parser.add_argument(
+            "--double-round-robin",
+            action="store_true",
+            help="Liga ida y vuelta",
+        )
+        parser.add_argument(
+            "--qualifiers",
+            type=int,
+            default=4,
+            help="Clasificados por categoría a la eliminatoria (default: 4)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Semilla (default: 42)"
+        )
+        parser.add_argument(
+            "--name",
+            type=str,
+            default="Torneo Sintético",
+            help="Nombre del torneo",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=str,
+            default="2025-03-01",
+            help="Fecha de inicio (YYYY-MM-DD, default: 2025-03-01)",
+        )
+
+    def handle(self, *args, **options):
+        if options["teams_per_category"] < 2:
+            raise CommandError("Se necesitan al menos 2 equipos por categoría")
+        if not 0 <= options["played_ratio"] <= 1:
+            raise CommandError("--played-ratio debe estar entre 0 y 1")
+
+        try:
+            start_date = datetime.strptime(options["start_date"], "%Y-%m-%d").date()
+        except ValueError as e:
+            raise CommandError(f"Fecha inválida: {str(e)}")
+
+        self.rng = random.Random(options["seed"])
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            tournament, categories, phases = self.create_structure(options, start_date)
+            teams = self.create_teams(categories, options["teams_per_category"])
+            players = self.create_players(teams, options["players_per_team"])
+            matches = self.create_fixtures(phases, teams, start_date, options)
+            played, match_teams = self.play_matches(matches, options["played_ratio"])
+            recompute_tournament_results(tournament)
+            events = self.create_events(match_teams, players)
+            brackets = self.create_brackets(phases, options, start_date)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Torneo sintético creado (id={tournament.id}) en "
+                f"{time.perf_counter() - started:.1f}s: {len(categories)} categorías, "
+                f"{len(teams)} equipos, {len(players)} jugadores, "
+                f"{len(matches) + brackets} partidos ({len(played)} jugados), "
+                f"{events} eventos"
+            )
+        )
+
+    def create_structure(self, options, start_date):
+        """Torneo, categorías y fases (las rondas las crean los fixtures)"""
+        category_count = options["categories"] * options["scale"]
+        template = {
+            "phases": [
+                {"name": "Fase de Grupos", "type": "league"},
+                {"name": "Eliminatorias", "type": "knockout"},
+            ],
+            "categories": [
+                {
+                    "name": f"Grupo {number}",
+                    "description": f"Categoría sintética {number}",
+                }
+                for number in range(1, category_count + 1)
+            ],
+        }
+        tournament, categories, phases, _ = create_tournament_from_template(
+            template,
+            name=options["name"],
+            year=str(start_date.year),
+            start_date=start_date,
+            end_date=start_date + timedelta(days=365),
+        )
+
+        phases_by_category = {}
+        for phase in phases:
+            phases_by_category.setdefault(phase.tournament_category_id, {})[
+                phase.phase_type
+            ] = phase
+        return tournament, categories, phases_by_category
+
+    def create_teams(self, categories, teams_per_category):
+        teams = []
+        self.promos = []
+        for index, category in enumerate(categories):
+            # Cada categoría agrupa promociones consecutivas
+            first_promo = 1975 + (index * teams_per_category) % 50
+            for promo in range(first_promo, first_promo + teams_per_category):
+                teams.append(
+                    Team(
+                        tournament_category=category,
+                        name=f"Promoción {promo}",
+                        abbreviation=f"P{promo}",
+                    )
+                )
+                self.promos.append(promo)
+        return Team.objects.bulk_create(teams, batch_size=BATCH_SIZE)
+
+    def create_players(self, teams, players_per_team):
+        """Jugadores con camisetas 1..N por equipo y DNI únicos de 8 dígitos"""
+        # Se excluyen los DNI ya cargados para que sean únicos en toda la base
+        existing = set(Player.objects.values_list("dni", flat=True))
+        count = len(teams) * players_per_team
+        dnis = [
+            dni
+            for dni in self.rng.sample(
+                range(10_000_000, 100_000_000), count + len(existing)
+            )
+            if str(dni) not in existing
+        ][:count]
+        positions = ["GK"] + ["DEF"] * 6 + ["MID"] * 6 + ["FWD"] * 5
+
+        players = []
+        for team, promo in zip(teams, self.promos):
+            for number in range(1, players_per_team + 1):
+                players.append(
+                    Player(
+                        team=team,
+                        first_name=self.rng.choice(FIRST_NAMES),
+                        last_name=" ".join(self.rng.choices(LAST_NAMES, k=2)),
+                        birth_date=date(promo - 17, 1, 1)
+                        + timedelta(days=self.rng.randrange(365)),
+                        position=positions[(number - 1) % len(positions)],
+                        jersey_number=str(number),
+                        dni=str(dnis.pop()),
+                        promo=promo,
+                        profession=self.rng.choice(PROFESSIONS),
+                    )
+                )
+        return Player.objects.bulk_create(players, batch_size=BATCH_SIZE)
+
+    def create_fixtures(self, phases, teams, start_date, options):
+        teams_by_category = {}
+        for team in teams:
+            teams_by_category.setdefault(team.tournament_category_id, []).append(team)
+
+        matches = []
+        for category_id, category_teams in teams_by_category.items():
+            self.rng.shuffle(category_teams)
+            matches += create_league_fixture(
+                phases[category_id]["league"],
+                category_teams,
+                start_date,
+                double_round_robin=options["double_round_robin"],
+            )
+        return matches
+
+    def play_matches(self, matches, played_ratio):
+        """
+        Resultados aleatorios para una fracción de los partidos de liga
+
+        Solo carga goles y estado; result y points los calcula después
+        recompute_tournament_results con las reglas de cada fase.
+
+        Returns:
+            Tupla (partidos jugados, sus MatchTeam actualizados)
+        """
+        played = [match for match in matches if self.rng.random() < played_ratio]
+        match_teams = {}
+        for match_team in MatchTeam.objects.filter(match__in=played).order_by("id"):
+            match_teams.setdefault(match_team.match_id, []).append(match_team)
+
+        updated = []
+        for match in played:
+            home, away = match_teams[match.id]
+            home.goals, away.goals = (
+                self.rng.choices(range(len(GOAL_WEIGHTS)), GOAL_WEIGHTS)[0]
+                for _ in range(2)
+            )
+            updated += [home, away]
+            match.status = "finished"
+
+        Match.objects.bulk_update(played, ["status"], batch_size=BATCH_SIZE)
+        MatchTeam.objects.bulk_update(updated, ["goals"], batch_size=BATCH_SIZE)
+        return played, updated
+
+    def create_events(self, match_teams, players):
+        """Un evento de gol por cada gol y tarjetas al azar"""
+        squads = {}
+        for player in players:
+            squads.setdefault(player.team_id, []).append(player)
+
+        events = []
+        for match_team in match_teams:
+            squad = squads.get(match_team.team_id)
+            if not squad:
+                continue
+            # El arquero (primer jugador) no figura entre los goleadores
+            scorers = squad[1:] or squad
+            for _ in range(match_team.goals):
+                events.append(
+                    MatchEvent(
+                        match_team=match_team,
+                        player=self.rng.choice(scorers),
+                        event_type="goal",
+                    )
+                )
+            for _ in range(self.rng.choices(range(4), [40, 35, 20, 5])[0]):
+                events.append(
+                    MatchEvent(
+                        match_team=match_team,
+                        player=self.rng.choice(squad),
+                        event_type="yellow_card",
+                    )
+                )
+            if self.rng.random() < 0.05:
+                events.append(
+                    MatchEvent(
+                        match_team=match_team,
+                        player=self.rng.choice(squad),
+                        event_type="red_card",
+                    )
+                )
+        MatchEvent.objects.bulk_create(events, batch_size=BATCH_SIZE)
+        return len(events)
+
+    def create_brackets(self, phases, options, start_date):
+        """Cuadro eliminatorio sembrado por la tabla de cada categoría"""
+        if options["qualifiers"] < 2:
+            return 0
+
+        # Jornadas de la liga: n - 1 con n par, n con n impar (hay libre)
+        team_count = options["teams_per_category"]
+        rounds = team_count - 1 + team_count % 2
+        if options["double_round_robin"]:
+            rounds *= 2
+        knockout_date = start_date + timedelta(days=7 * (rounds + 1))
+
+        created = 0
+        for category_phases in phases.values():
+            knockout = category_phases["knockout"]
+            teams = seed_teams(knockout, options["qualifiers"])
+            created += len(create_knockout_bracket(knockout, teams, knockout_date))
+        return created
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tournaments.generation import DEFAULT_MAX_WORKERS, generate_tournament_fixtures
+from tournaments.models import Tournament
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera los partidos de todas las categorías de un torneo en una sola "
+        "ejecución (una transacción por categoría, categorías en paralelo)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tournament-id", type=int, help="ID del torneo", required=True
+        )
+        parser.add_argument(
+            "--start-date",
+            type=str,
+            help="Fecha de inicio (YYYY-MM-DD, default: inicio del torneo)",
+        )
+        parser.add_argument(
+            "--days-between-matches",
+            type=int,
+            default=7,
+            help="Días entre jornadas (default: 7)",
+        )
+        parser.add_argument(
+            "--double-round-robin",
+            action="store_true",
+            help="En liga, genera ida y vuelta (localías invertidas en la vuelta)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Semilla para el sorteo del orden de equipos (reproducible)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help=f"Categorías en paralelo (default: {DEFAULT_MAX_WORKERS})",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            tournament = Tournament.objects.get(id=options["tournament_id"])
+        except Tournament.DoesNotExist:
+            raise CommandError("Torneo no encontrado")
+
+        start_date = None
+        if options["start_date"]:
+            try:
+                start_date = datetime.strptime(options["start_date"], "%Y-%m-%d").date()
+            except ValueError as e:
+                raise CommandError(f"Fecha inválida: {str(e)}")
+
+        results = generate_tournament_fixtures(
+            tournament,
+            start_date=start_date,
+            max_workers=options["workers"],
+            days_between=options["days_between_matches"],
+            double_round_robin=options["double_round_robin"],
+            seed=options["seed"],
+        )
+
+        total = 0
+        for category, phase, created, error in results:
+            if error:
+                self.stdout.write(
+                    self.style.ERROR(f"{category.category_name}: {error}")
+                )
+            elif phase is None:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{category.category_name}: sin fases pendientes de generar"
+                    )
+                )
+            else:
+                total += created
+                self.stdout.write(
+                    f"{category.category_name} - {phase.phase_name}: "
+                    f"{created} partidos"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Creados {total} partidos para {tournament}")
+        )
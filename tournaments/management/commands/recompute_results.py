@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tournaments.models import Phase, Tournament
+from tournaments.results import recompute_results
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula result y points de los equipos de cada partido a partir de "
+        "los goles y las reglas de puntuación de su fase"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tournament-id", type=int, help="ID del torneo")
+        parser.add_argument("--phase-id", type=int, help="ID de la fase")
+
+    def handle(self, *args, **options):
+        phases = Phase.objects.all()
+        if options["tournament_id"]:
+            if not Tournament.objects.filter(id=options["tournament_id"]).exists():
+                raise CommandError("Torneo no encontrado")
+            phases = phases.filter(
+                tournament_category__tournament_id=options["tournament_id"]
+            )
+        if options["phase_id"]:
+            phases = phases.filter(id=options["phase_id"])
+            if not phases.exists():
+                raise CommandError("Fase no encontrada")
+
+        updated = recompute_results(phases)
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated} resultados de equipos actualizados")
+        )
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from matches.models import Match
+from tournaments.models import Tournament, TournamentCategory
+from tournaments.scheduling import (
+    date_range,
+    parse_dates,
+    parse_time_slots,
+    save_schedule,
+    schedulable_matches,
+    schedule_matches,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Asigna fecha, hora y cancha a los partidos programados de un torneo "
+        "o categoría respetando canchas, horarios y descanso entre partidos"
+    )
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--tournament-id", type=int, help="ID del torneo")
+        target.add_argument(
+            "--tournament-category-id",
+            type=int,
+            help="ID de la categoría del torneo",
+        )
+        parser.add_argument(
+            "--dates",
+            type=str,
+            help="Fechas disponibles separadas por coma (YYYY-MM-DD,YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--start-date", type=str, help="Fecha de inicio (YYYY-MM-DD)"
+        )
+        parser.add_argument("--end-date", type=str, help="Fecha de fin (YYYY-MM-DD)")
+        parser.add_argument(
+            "--weekdays",
+            type=str,
+            default="5,6",
+            help="Días de juego con --start-date/--end-date (0=lunes, default: 5,6)",
+        )
+        parser.add_argument(
+            "--time-slots",
+            type=str,
+            default="15:00",
+            help="Horarios disponibles por fecha (HH:MM,HH:MM; default: 15:00)",
+        )
+        parser.add_argument(
+            "--fields", type=int, default=1, help="Cantidad de canchas (default: 1)"
+        )
+        parser.add_argument(
+            "--min-rest-days",
+            type=int,
+            default=1,
+            help="Días mínimos entre partidos de un mismo equipo (default: 1)",
+        )
+        parser.add_argument(
+            "--share-fields",
+            action="store_true",
+            help="Permite partidos de distintas categorías en la misma cancha y fecha",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options["dates"]:
+                dates = parse_dates(options["dates"])
+            elif options["start_date"] and options["end_date"]:
+                weekdays = {int(day) for day in options["weekdays"].split(",")}
+                dates = date_range(
+                    datetime.strptime(options["start_date"], "%Y-%m-%d").date(),
+                    datetime.strptime(options["end_date"], "%Y-%m-%d").date(),
+                    weekdays,
+                )
+            else:
+                raise CommandError("Indique --dates o --start-date y --end-date")
+
+            time_slots = parse_time_slots(options["time_slots"])
+        except ValueError as e:
+            raise CommandError(f"Fecha u horario inválido: {str(e)}")
+
+        if not dates:
+            raise CommandError("No hay fechas disponibles en el rango indicado")
+
+        matches = Match.objects.filter(status="scheduled")
+        if options["tournament_id"]:
+            if not Tournament.objects.filter(id=options["tournament_id"]).exists():
+                raise CommandError("Torneo no encontrado")
+            matches = matches.filter(
+                round__phase__tournament_category__tournament_id=options[
+                    "tournament_id"
+                ]
+            )
+        else:
+            if not TournamentCategory.objects.filter(
+                id=options["tournament_category_id"]
+            ).exists():
+                raise CommandError("Categoría de torneo no encontrada")
+            matches = matches.filter(
+                round__phase__tournament_category_id=options["tournament_category_id"]
+            )
+
+        scheduled, unscheduled = schedule_matches(
+            schedulable_matches(matches),
+            dates,
+            time_slots,
+            fields=options["fields"],
+            min_rest_days=options["min_rest_days"],
+            separate_categories=not options["share_fields"],
+        )
+        save_schedule(scheduled)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Programados {len(scheduled)} partidos entre {dates[0]} y "
+                f"{max((match.date for match in scheduled), default=dates[0])}"
+            )
+        )
+
+        if unscheduled:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(unscheduled)} partidos sin hueco disponible "
+                    "(agregue fechas, horarios o canchas)"
+                )
+            )
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.6 on 2026-10-18 23:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tournaments", "0003_remove_tournamentcategory_end_date_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="phase",
+            name="draw_points",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="phase",
+            name="draw_resolution",
+            field=models.CharField(
+                choices=[("draw", "Empate"), ("penalties", "Definición por penales")],
+                default="draw",
+                help_text="En liga, si un empate se define por penales (en eliminatorias siempre)",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="phase",
+            name="loss_points",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="phase",
+            name="penalty_loss_points",
+            field=models.PositiveSmallIntegerField(
+                default=1, help_text="Puntos por perder por penales (liga con penales)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="phase",
+            name="penalty_win_points",
+            field=models.PositiveSmallIntegerField(
+                default=2, help_text="Puntos por ganar por penales (liga con penales)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="phase",
+            name="win_points",
+            field=models.PositiveSmallIntegerField(default=3),
+        ),
+    ]
@@ -50,6 +50,28 @@ class Phase(models.Model):
     )
     phase_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
 
+    # Reglas de puntuación (ver tournaments/results.py)
+    DRAW_RESOLUTION_CHOICES = [
+        ("draw", "Empate"),
+        ("penalties", "Definición por penales"),
+    ]
+
+    win_points = models.PositiveSmallIntegerField(default=3)
+    draw_points = models.PositiveSmallIntegerField(default=1)
+    loss_points = models.PositiveSmallIntegerField(default=0)
+    draw_resolution = models.CharField(
+        max_length=20,
+        choices=DRAW_RESOLUTION_CHOICES,
+        default="draw",
+        help_text="En liga, si un empate se define por penales (en eliminatorias siempre)",
+    )
+    penalty_win_points = models.PositiveSmallIntegerField(
+        default=2, help_text="Puntos por ganar por penales (liga con penales)"
+    )
+    penalty_loss_points = models.PositiveSmallIntegerField(
+        default=1, help_text="Puntos por perder por penales (liga con penales)"
+    )
+
     class Meta:
         verbose_name = "Fase"
         verbose_name_plural = "Fases"
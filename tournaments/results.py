@@ -0,0 +1,144 @@
+"""
+Resultados y Puntos
+===================
+
+Deriva MatchTeam.result y MatchTeam.points de los goles (y penales) de
+ambos equipos, con las reglas de puntuación de cada Phase:
+
+- más goles: win / win_points; menos goles: loss / loss_points
+- igualdad de goles: en eliminatorias, o en ligas con draw_resolution
+  "penalties", deciden los penales. En liga el ganador suma
+  penalty_win_points y el perdedor penalty_loss_points; en eliminatorias
+  win_points/loss_points. Sin penales definidos queda draw / draw_points.
+- partido no finalizado o sin goles cargados: result vacío y 0 puntos
+
+El cálculo es por conjuntos: un UPDATE con CASE sobre una subconsulta del
+rival, agrupando las fases que comparten reglas. Recalcular un torneo
+entero son unas pocas consultas sin importar la cantidad de partidos.
+
+Las señales de matches/signals.py recalculan cada partido al guardarse;
+el comando recompute_results y la acción del admin de torneos recalculan
+torneos completos.
+"""
+
+from django.db.models import Case, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.lookups import Exact, GreaterThan, IsNull, LessThan
+
+from matches.models import MatchTeam
+
+from .models import Phase
+
+RULE_FIELDS = (
+    "phase_type",
+    "win_points",
+    "draw_points",
+    "loss_points",
+    "draw_resolution",
+    "penalty_win_points",
+    "penalty_loss_points",
+)
+
+
+def scoring_rules(phase):
+    """Reglas de puntuación de una fase (las fases iguales se agrupan)"""
+    return tuple(getattr(phase, field) for field in RULE_FIELDS)
+
+
+def result_expressions(phase):
+    """
+    Expresiones (result, points) para un UPDATE de MatchTeam
+
+    Comparan los goles y penales de cada fila con los del otro MatchTeam del
+    mismo partido.
+    """
+    rival = MatchTeam.objects.filter(match_id=OuterRef("match_id")).exclude(
+        pk=OuterRef("pk")
+    )
+    rival_goals = Subquery(rival.values("goals")[:1])
+    rival_penalties = Subquery(rival.values("penalty_goals")[:1])
+
+    incomplete = IsNull(F("goals"), True) | IsNull(rival_goals, True)
+    outcomes = [
+        (incomplete, None, 0),
+        (GreaterThan(F("goals"), rival_goals), "win", phase.win_points),
+        (LessThan(F("goals"), rival_goals), "loss", phase.loss_points),
+    ]
+
+    if phase.phase_type == "knockout" or phase.draw_resolution == "penalties":
+        if phase.phase_type == "knockout":
+            penalty_points = (phase.win_points, phase.loss_points)
+        else:
+            penalty_points = (phase.penalty_win_points, phase.penalty_loss_points)
+        outcomes += [
+            (
+                GreaterThan(F("penalty_goals"), rival_penalties),
+                "win",
+                penalty_points[0],
+            ),
+            (
+                LessThan(F("penalty_goals"), rival_penalties),
+                "loss",
+                penalty_points[1],
+            ),
+        ]
+
+    result = Case(
+        *[When(condition, then=Value(value)) for condition, value, _ in outcomes],
+        default=Value("draw"),
+        output_field=MatchTeam._meta.get_field("result"),
+    )
+    points = Case(
+        *[When(condition, then=Value(value)) for condition, _, value in outcomes],
+        default=Value(phase.draw_points),
+        output_field=MatchTeam._meta.get_field("points"),
+    )
+    return result, points
+
+
+def recompute_results(phases, match_ids=None):
+    """
+    Recalcula result y points de los MatchTeam de las fases indicadas
+
+    Args:
+        phases: Fases (queryset o iterable) a recalcular
+        match_ids: Limita el recálculo a estos partidos (None = todos)
+
+    Returns:
+        Cantidad de MatchTeam actualizados
+    """
+    groups = {}
+    for phase in phases:
+        groups.setdefault(scoring_rules(phase), []).append(phase)
+
+    updated = 0
+    for group in groups.values():
+        match_teams = MatchTeam.objects.filter(
+            match__round__phase__in=[phase.id for phase in group]
+        )
+        if match_ids is not None:
+            match_teams = match_teams.filter(match_id__in=match_ids)
+
+        result, points = result_expressions(group[0])
+        updated += match_teams.filter(match__status="finished").update(
+            result=result, points=points
+        )
+        # Partidos reabiertos o aún sin jugar
+        updated += (
+            match_teams.exclude(match__status="finished")
+            .filter(~Exact(F("points"), 0) | Q(result__isnull=False))
+            .update(result=None, points=0)
+        )
+    return updated
+
+
+def recompute_match_results(match_ids):
+    """Recalcula los partidos indicados con las reglas de sus fases"""
+    phases = Phase.objects.filter(rounds__matches__id__in=match_ids).distinct()
+    return recompute_results(phases, match_ids=match_ids)
+
+
+def recompute_tournament_results(tournament):
+    """Recalcula todos los partidos de un torneo"""
+    return recompute_results(
+        Phase.objects.filter(tournament_category__tournament=tournament)
+    )
@@ -0,0 +1,193 @@
+"""
+Plantillas de Torneo
+====================
+
+Crea un torneo completo (categorías, fases y rondas) a partir de una
+plantilla declarativa en YAML o JSON, reutilizable de un año a otro.
+
+La plantilla se valida completa antes de escribir y se persiste nivel por
+nivel con un bulk_create por modelo: un torneo con cualquier cantidad de
+categorías se crea en cuatro INSERT.
+
+Formato (ver tournaments/data/default_tournament.yaml):
+
+    tournament: {name, year, start_date, end_date}   # opcional
+    phases: [...]                                    # fases por defecto
+    categories:
+      - name: Grupo 1
+        description: ...                             # opcional
+        phases:                                      # opcional
+          - name: Fase de Grupos
+            type: league
+            rounds: 4                                # o [{name, number}, ...]
+"""
+
+import json
+import os
+
+from django.db import transaction
+
+from .models import Phase, Round, Tournament, TournamentCategory
+
+DEFAULT_TEMPLATE = os.path.join(
+    os.path.dirname(__file__), "data", "default_tournament.yaml"
+)
+
+PHASE_TYPES = {phase_type for phase_type, _ in Phase.TYPE_CHOICES}
+
+
+def load_template(path):
+    """Lee una plantilla .yaml/.yml o .json"""
+    with open(path, encoding="utf-8") as template_file:
+        if path.lower().endswith((".yaml", ".yml")):
+            import yaml
+
+            data = yaml.safe_load(template_file)
+        else:
+            data = json.load(template_file)
+
+    if not isinstance(data, dict):
+        raise ValueError("La plantilla debe ser un objeto con 'categories'")
+    return data
+
+
+def _normalize_rounds(rounds, phase_name):
+    if isinstance(rounds, int):
+        return [(f"Jornada {number}", str(number)) for number in range(1, rounds + 1)]
+
+    normalized = []
+    for round_data in rounds or []:
+        if not isinstance(round_data, dict) or "name" not in round_data:
+            raise ValueError(f"Ronda inválida en la fase '{phase_name}': {round_data}")
+        number = round_data.get("number", len(normalized) + 1)
+        normalized.append((round_data["name"], str(number)))
+    return normalized
+
+
+def _normalize_phases(phases, category_name):
+    if not phases:
+        raise ValueError(f"La categoría '{category_name}' no tiene fases")
+
+    normalized = []
+    for phase_data in phases:
+        name = phase_data.get("name")
+        phase_type = phase_data.get("type")
+        if not name:
+            raise ValueError(f"Fase sin nombre en la categoría '{category_name}'")
+        if phase_type not in PHASE_TYPES:
+            raise ValueError(
+                f"Tipo de fase inválido en '{name}': {phase_type} "
+                f"(opciones: {', '.join(sorted(PHASE_TYPES))})"
+            )
+        normalized.append(
+            {
+                "name": name,
+                "type": phase_type,
+                "rounds": _normalize_rounds(phase_data.get("rounds"), name),
+            }
+        )
+    return normalized
+
+
+def normalize_template(data):
+    """
+    Valida la plantilla y la lleva a una forma uniforme
+
+    Returns:
+        Lista de dicts {name, description, phases}; cada fase es
+        {name, type, rounds} y cada ronda una tupla (round_name, round_number)
+    """
+    categories = data.get("categories") or []
+    if not categories:
+        raise ValueError("La plantilla no define categorías")
+
+    default_phases = data.get("phases")
+    names = set()
+    normalized = []
+    for category_data in categories:
+        if isinstance(category_data, str):
+            category_data = {"name": category_data}
+        name = category_data.get("name")
+        if not name:
+            raise ValueError("Hay una categoría sin nombre")
+        if name in names:
+            raise ValueError(f"Categoría repetida: {name}")
+        names.add(name)
+        normalized.append(
+            {
+                "name": name,
+                "description": category_data.get("description", ""),
+                "phases": _normalize_phases(
+                    category_data.get("phases", default_phases), name
+                ),
+            }
+        )
+    return normalized
+
+
+def create_tournament_from_template(data, **tournament_fields):
+    """
+    Crea el torneo de la plantilla con un bulk_create por nivel
+
+    Args:
+        data: Plantilla ya cargada (ver load_template)
+        **tournament_fields: name, year, start_date, end_date; tienen
+            prioridad sobre la sección "tournament" de la plantilla
+
+    Returns:
+        Tupla (torneo, categorías, fases, rondas)
+    """
+    fields = dict(data.get("tournament") or {})
+    fields.update(
+        {key: value for key, value in tournament_fields.items() if value is not None}
+    )
+    missing = [
+        key for key in ("name", "year", "start_date", "end_date") if not fields.get(key)
+    ]
+    if missing:
+        raise ValueError(f"Faltan datos del torneo: {', '.join(missing)}")
+
+    categories_data = normalize_template(data)
+
+    with transaction.atomic():
+        tournament = Tournament.objects.create(
+            name=fields["name"],
+            year=str(fields["year"]),
+            start_date=fields["start_date"],
+            end_date=fields["end_date"],
+        )
+
+        categories = TournamentCategory.objects.bulk_create(
+            [
+                TournamentCategory(
+                    tournament=tournament,
+                    category_name=category_data["name"],
+                    description=category_data["description"],
+                )
+                for category_data in categories_data
+            ]
+        )
+
+        phase_rounds = []
+        phases = []
+        for category, category_data in zip(categories, categories_data):
+            for phase_data in category_data["phases"]:
+                phases.append(
+                    Phase(
+                        tournament_category=category,
+                        phase_name=phase_data["name"],
+                        phase_type=phase_data["type"],
+                    )
+                )
+                phase_rounds.append(phase_data["rounds"])
+        phases = Phase.objects.bulk_create(phases)
+
+        rounds = Round.objects.bulk_create(
+            [
+                Round(phase=phase, round_name=round_name, round_number=round_number)
+                for phase, rounds_data in zip(phases, phase_rounds)
+                for round_name, round_number in rounds_data
+            ]
+        )
+
+    return tournament, categories, phases, rounds
@@ -0,0 +1,276 @@
+"""
+Programación de Partidos
+========================
+
+Asigna fecha, hora y cancha a los partidos ya generados respetando:
+
+- Fechas disponibles, horarios por fecha y cantidad de canchas
+- Descanso mínimo (en días) entre dos partidos de un mismo equipo
+- Un equipo no juega dos partidos en el mismo horario
+- Opcionalmente, cada cancha se dedica a una sola categoría por fecha
+
+Se usa una heurística voraz: los partidos se ordenan por jornada
+(intercalando categorías) y cada uno toma el primer hueco libre que cumple
+las restricciones. Es lineal en la cantidad de partidos por hueco revisado,
+por lo que programa todas las categorías de un torneo en segundos.
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from django.db import transaction
+
+from matches.models import Match
+
+from .brackets import round_match_count
+
+
+def parse_dates(value):
+    """Convierte 'YYYY-MM-DD,YYYY-MM-DD' en una lista ordenada de fechas"""
+    return sorted(
+        {
+            datetime.strptime(item.strip(), "%Y-%m-%d").date()
+            for item in value.split(",")
+        }
+    )
+
+
+def parse_time_slots(value):
+    """Convierte 'HH:MM,HH:MM' en una lista ordenada de horarios"""
+    return sorted(
+        {datetime.strptime(item.strip(), "%H:%M").time() for item in value.split(",")}
+    )
+
+
+def date_range(start_date, end_date, weekdays=None):
+    """
+    Fechas entre start_date y end_date (inclusive)
+
+    Args:
+        weekdays: Días de la semana permitidos (0=lunes ... 6=domingo)
+    """
+    dates = []
+    current = start_date
+    while current <= end_date:
+        if weekdays is None or current.weekday() in weekdays:
+            dates.append(current)
+        current += timedelta(days=1)
+    return dates
+
+
+def schedulable_matches(queryset):
+    """
+    Prepara un queryset de partidos con los datos que necesita el programador
+    (ronda, fase y equipos) en tres consultas
+    """
+    return queryset.select_related("round__phase").prefetch_related("match_teams")
+
+
+def _matchday_order(matches):
+    """
+    Ordena los partidos por jornada intercalando categorías
+
+    La jornada es la posición de la ronda dentro de su fase; las fases se
+    programan en orden (la liga antes que las eliminatorias).
+
+    Returns:
+        Lista de tuplas ((fase, jornada), partido) ordenada
+    """
+    rounds_by_phase = {}
+    for match in matches:
+        phase_rounds = rounds_by_phase.setdefault(match.round.phase_id, {})
+        phase_rounds[match.round_id] = match.round
+
+    phase_rank = {}
+    for category_phases in _group_phases_by_category(matches).values():
+        for rank, phase_id in enumerate(sorted(category_phases)):
+            phase_rank[phase_id] = rank
+
+    round_rank = {
+        round_obj.id: rank
+        for rounds in rounds_by_phase.values()
+        for rank, round_obj in enumerate(sorted(rounds.values(), key=_round_order))
+    }
+
+    ordered = [
+        ((phase_rank[match.round.phase_id], round_rank[match.round_id]), match)
+        for match in matches
+    ]
+    ordered.sort(
+        key=lambda item: (
+            item[0],
+            item[1].round.phase.tournament_category_id,
+            item[1].id,
+        )
+    )
+    return ordered
+
+
+def _round_order(round_obj):
+    """
+    Las rondas del cuadro van por profundidad (R16, QF, SF, F): sus ids no
+    siguen ese orden si la primera ronda se creó después que las demás (ver
+    ensure_bracket_rounds). El resto de las rondas van por id.
+    """
+    match_count = round_match_count(round_obj.round_number)
+    if match_count is None:
+        return (1, 0, round_obj.id)
+    return (0, -match_count, round_obj.id)
+
+
+def _group_phases_by_category(matches):
+    phases = {}
+    for match in matches:
+        phase = match.round.phase
+        phases.setdefault(phase.tournament_category_id, set()).add(phase.id)
+    return phases
+
+
+def schedule_matches(
+    matches,
+    dates,
+    time_slots,
+    fields=1,
+    min_rest_days=1,
+    separate_categories=True,
+):
+    """
+    Asigna date, time y field a cada partido (sin guardar)
+
+    Args:
+        matches: Partidos obtenidos con schedulable_matches()
+        dates: Fechas disponibles
+        time_slots: Horarios disponibles en cada fecha
+        fields: Cantidad de canchas simultáneas
+        min_rest_days: Días mínimos entre dos partidos de un mismo equipo
+            (0 permite jugar dos veces el mismo día en horarios distintos)
+        separate_categories: Si es True, una cancha solo recibe partidos de
+            una categoría en cada fecha
+
+    Returns:
+        tupla (partidos programados, partidos sin hueco disponible)
+    """
+    matches = list(matches)
+    dates = sorted(dates)
+    time_slots = sorted(time_slots)
+    if not dates or not time_slots or fields < 1:
+        return [], matches
+
+    slots_per_date = len(time_slots) * fields
+    used_slots = set()  # (date, time, field)
+    free_slots = {match_date: slots_per_date for match_date in dates}
+    field_category = {}  # (date, field) -> tournament_category_id
+    team_last_date = {}  # team_id -> fecha del último partido asignado
+    team_slots = set()  # (team_id, date, time)
+    # tournament_category_id -> [jornada actual, fecha mínima, última fecha]
+    category_progress = {}
+
+    scheduled, unscheduled = [], []
+
+    for matchday, match in _matchday_order(matches):
+        team_ids = [match_team.team_id for match_team in match.match_teams.all()]
+        category_id = match.round.phase.tournament_category_id
+
+        # Una jornada empieza cuando terminó la anterior de su categoría
+        # (cubre también los cruces eliminatorios aún sin equipos)
+        progress = category_progress.setdefault(category_id, [matchday, dates[0], None])
+        if progress[0] != matchday:
+            if progress[2] is not None:
+                progress[1] = progress[2] + timedelta(days=min_rest_days)
+            progress[0], progress[2] = matchday, None
+
+        # Primera fecha posible según el descanso de cada equipo
+        earliest = progress[1]
+        for team_id in team_ids:
+            if team_id in team_last_date:
+                earliest = max(
+                    earliest, team_last_date[team_id] + timedelta(days=min_rest_days)
+                )
+
+        slot = None
+        for match_date in dates[bisect_left(dates, earliest) :]:
+            if not free_slots[match_date]:
+                continue
+            slot = _find_slot(
+                match_date,
+                time_slots,
+                fields,
+                team_ids,
+                category_id if separate_categories else None,
+                used_slots,
+                field_category,
+                team_slots,
+            )
+            if slot:
+                break
+
+        if slot is None:
+            unscheduled.append(match)
+            continue
+
+        match_date, match_time, field = slot
+        match.date, match.time, match.field = match_date, match_time, field
+
+        used_slots.add(slot)
+        free_slots[match_date] -= 1
+        progress[2] = max(progress[2] or match_date, match_date)
+        if separate_categories:
+            field_category[(match_date, field)] = category_id
+        for team_id in team_ids:
+            team_last_date[team_id] = match_date
+            team_slots.add((team_id, match_date, match_time))
+        scheduled.append(match)
+
+    return scheduled, unscheduled
+
+
+def _find_slot(
+    match_date,
+    time_slots,
+    fields,
+    team_ids,
+    category_id,
+    used_slots,
+    field_category,
+    team_slots,
+):
+    """
+    Primer (hora, cancha) libre de la fecha que cumple las restricciones
+
+    Con canchas separadas por categoría se prefieren las canchas que la
+    categoría ya ocupa ese día; solo se toma una cancha nueva cuando esas
+    están completas, para no bloquear canchas casi vacías.
+    """
+    free_times = [
+        match_time
+        for match_time in time_slots
+        if not any(
+            (team_id, match_date, match_time) in team_slots for team_id in team_ids
+        )
+    ]
+
+    if category_id is None:
+        candidate_groups = [range(1, fields + 1)]
+    else:
+        owned, unowned = [], []
+        for field in range(1, fields + 1):
+            owner = field_category.get((match_date, field))
+            if owner == category_id:
+                owned.append(field)
+            elif owner is None:
+                unowned.append(field)
+        candidate_groups = [owned, unowned]
+
+    for candidate_fields in candidate_groups:
+        for match_time in free_times:
+            for field in candidate_fields:
+                if (match_date, match_time, field) not in used_slots:
+                    return match_date, match_time, field
+
+    return None
+
+
+def save_schedule(matches):
+    """Guarda fecha, hora y cancha de los partidos en un único bulk_update"""
+    with transaction.atomic():
+        Match.objects.bulk_update(matches, ["date", "time", "field"], batch_size=500)
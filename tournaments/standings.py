@@ -0,0 +1,79 @@
+"""
+Tabla de Posiciones
+===================
+
+Calcula la tabla de posiciones de una fase de liga a partir de los
+MatchTeam de sus partidos finalizados, en una sola consulta.
+
+Criterios de orden: puntos, diferencia de gol, goles a favor y nombre.
+"""
+
+from matches.models import MatchTeam
+from teams.models import Team
+
+
+def league_standings(phase):
+    """
+    Devuelve la tabla de posiciones de una fase
+
+    Returns:
+        Lista ordenada de dicts con team, played, won, drawn, lost,
+        goals_for, goals_against, goal_difference y points
+    """
+    rows = {
+        team.id: {
+            "team": team,
+            "played": 0,
+            "won": 0,
+            "drawn": 0,
+            "lost": 0,
+            "goals_for": 0,
+            "goals_against": 0,
+            "points": 0,
+        }
+        for team in Team.objects.filter(
+            tournament_category_id=phase.tournament_category_id
+        )
+    }
+
+    match_teams = MatchTeam.objects.filter(
+        match__round__phase=phase, match__status="finished"
+    ).values_list("match_id", "team_id", "goals", "result", "points")
+
+    by_match = {}
+    for match_id, team_id, goals, result, points in match_teams:
+        by_match.setdefault(match_id, []).append((team_id, goals or 0, result, points))
+
+    for sides in by_match.values():
+        if len(sides) != 2:
+            continue
+        for (team_id, goals, result, points), (_, rival_goals, _, _) in (
+            (sides[0], sides[1]),
+            (sides[1], sides[0]),
+        ):
+            row = rows.get(team_id)
+            if row is None:
+                continue
+            row["played"] += 1
+            row["goals_for"] += goals
+            row["goals_against"] += rival_goals
+            row["points"] += points or 0
+            if result == "win":
+                row["won"] += 1
+            elif result == "draw":
+                row["drawn"] += 1
+            elif result == "loss":
+                row["lost"] += 1
+
+    for row in rows.values():
+        row["goal_difference"] = row["goals_for"] - row["goals_against"]
+
+    return sorted(
+        rows.values(),
+        key=lambda row: (
+            -row["points"],
+            -row["goal_difference"],
+            -row["goals_for"],
+            row["team"].name,
+        ),
+    )
@@ -0,0 +1,65 @@
+"""
+Datos de prueba compartidos por los tests de torneos, partidos y eventos
+"""
+
+from datetime import date, time
+
+from matches.models import Match, MatchTeam
+from teams.models import Player, Team
+from tournaments.models import Phase, Round, Tournament, TournamentCategory
+
+
+def create_category(name="Promo 2010"):
+    tournament = Tournament.objects.create(
+        name="Torneo de Prueba",
+        year="2025",
+        start_date=date(2025, 3, 1),
+        end_date=date(2025, 11, 30),
+    )
+    return TournamentCategory.objects.create(tournament=tournament, category_name=name)
+
+
+def create_teams(category, count):
+    return [
+        Team.objects.create(
+            tournament_category=category,
+            name=f"Equipo {number:02d}",
+            abbreviation=f"E{number}",
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def create_phase(category, phase_type="league", **rules):
+    return Phase.objects.create(
+        tournament_category=category,
+        phase_name="Liga" if phase_type == "league" else "Eliminatorias",
+        phase_type=phase_type,
+        **rules,
+    )
+
+
+def create_match(phase, home, away, status="scheduled", goals=(0, 0), penalties=(0, 0)):
+    """Partido en una ronda nueva de la fase; el local es el primer MatchTeam"""
+    round_obj = Round.objects.create(
+        phase=phase, round_name="Jornada", round_number=str(phase.rounds.count() + 1)
+    )
+    match = Match.objects.create(
+        round=round_obj, date=date(2025, 3, 1), time=time(15, 0), status=status
+    )
+    for team, team_goals, team_penalties in zip((home, away), goals, penalties):
+        MatchTeam.objects.create(
+            match=match, team=team, goals=team_goals, penalty_goals=team_penalties
+        )
+    return match
+
+
+def create_player(team, dni="30111222", jersey_number="9"):
+    return Player.objects.create(
+        team=team,
+        first_name="Juan",
+        last_name="Pérez",
+        birth_date=date(1990, 1, 1),
+        dni=dni,
+        jersey_number=jersey_number,
+    )
@@ -0,0 +1,162 @@
+from datetime import date, time, timedelta
+
+from django.test import TestCase, override_settings
+
+from matches.models import Match
+from tournaments.brackets import (
+    build_bracket,
+    create_knockout_bracket,
+    get_bracket,
+    seeding_order,
+)
+from tournaments.models import Round
+from tournaments.scheduling import schedulable_matches, schedule_matches
+
+from .factories import create_category, create_phase, create_teams
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class KnockoutBracketTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = create_category()
+        cls.teams = create_teams(cls.category, 6)
+
+    def setUp(self):
+        self.phase = create_phase(self.category, "knockout")
+
+    def create_bracket(self, teams=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_knockout_bracket(
+                self.phase, teams or self.teams, date(2025, 9, 6)
+            )
+
+    def bracket_match(self, round_number, position):
+        return Match.objects.get(
+            round__phase=self.phase,
+            round__round_number=round_number,
+            bracket_position=position,
+        )
+
+    def teams_in(self, match):
+        return [match_team.team for match_team in match.match_teams.order_by("id")]
+
+    def finish(self, match, goals, penalties=(0, 0)):
+        with self.captureOnCommitCallbacks(execute=True):
+            for match_team, team_goals, team_penalties in zip(
+                match.match_teams.order_by("id"), goals, penalties
+            ):
+                match_team.goals = team_goals
+                match_team.penalty_goals = team_penalties
+                match_team.save()
+            match.status = "finished"
+            match.save()
+
+    def test_seeding_order(self):
+        self.assertEqual(seeding_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_top_seeds_get_byes(self):
+        self.create_bracket()
+        seed = dict(enumerate(self.teams, start=1))
+
+        quarterfinals = Match.objects.filter(
+            round__phase=self.phase, round__round_number="QF"
+        )
+        self.assertEqual(
+            sorted(match.bracket_position for match in quarterfinals), [1, 3]
+        )
+        self.assertEqual(self.teams_in(self.bracket_match("QF", 1)), [seed[4], seed[5]])
+        self.assertEqual(self.teams_in(self.bracket_match("QF", 3)), [seed[3], seed[6]])
+
+        # Los dos mejores sembrados pasan directo a semifinales
+        self.assertEqual(self.teams_in(self.bracket_match("SF", 0)), [seed[1]])
+        self.assertEqual(self.teams_in(self.bracket_match("SF", 1)), [seed[2]])
+        self.assertEqual(self.teams_in(self.bracket_match("F", 0)), [])
+
+    def test_winner_advances_to_next_match(self):
+        self.create_bracket()
+        self.finish(self.bracket_match("QF", 1), (2, 1))
+
+        semifinal = self.bracket_match("SF", 0)
+        self.assertEqual(self.teams_in(semifinal), [self.teams[0], self.teams[3]])
+
+    def test_penalties_decide_a_draw(self):
+        self.create_bracket()
+        self.finish(self.bracket_match("QF", 3), (1, 1), penalties=(3, 4))
+
+        self.assertIn(self.teams[5], self.teams_in(self.bracket_match("SF", 1)))
+
+    def test_draw_without_penalties_does_not_advance(self):
+        self.create_bracket()
+        self.finish(self.bracket_match("QF", 3), (1, 1))
+
+        self.assertEqual(self.teams_in(self.bracket_match("SF", 1)), [self.teams[1]])
+
+    def test_corrected_result_replaces_advanced_team(self):
+        self.create_bracket()
+        quarterfinal = self.bracket_match("QF", 1)
+        self.finish(quarterfinal, (2, 1))
+        self.finish(quarterfinal, (0, 3))
+
+        self.assertEqual(
+            self.teams_in(self.bracket_match("SF", 0)),
+            [self.teams[0], self.teams[4]],
+        )
+
+    def test_finished_next_match_is_not_changed(self):
+        self.create_bracket()
+        quarterfinal = self.bracket_match("QF", 1)
+        self.finish(quarterfinal, (2, 1))
+        self.finish(self.bracket_match("SF", 0), (1, 0))
+        self.finish(quarterfinal, (0, 3))
+
+        self.assertEqual(
+            self.teams_in(self.bracket_match("SF", 0)),
+            [self.teams[0], self.teams[3]],
+        )
+
+    def test_build_bracket_includes_byes(self):
+        self.create_bracket()
+        bracket = build_bracket(self.phase)
+
+        self.assertEqual(
+            [round_data["round_number"] for round_data in bracket["rounds"]],
+            ["QF", "SF", "F"],
+        )
+        first_round = bracket["rounds"][0]["matches"]
+        self.assertEqual([entry["position"] for entry in first_round], [0, 1, 2, 3])
+        byes = [entry for entry in first_round if entry["status"] == "bye"]
+        self.assertEqual(
+            [entry["winner_team_id"] for entry in byes],
+            [self.teams[0].id, self.teams[1].id],
+        )
+
+    def test_get_bracket_is_invalidated_when_a_match_changes(self):
+        self.create_bracket()
+        self.assertEqual(get_bracket(self.phase), build_bracket(self.phase))
+
+        self.finish(self.bracket_match("QF", 1), (2, 1))
+        semifinal = get_bracket(self.phase)["rounds"][1]["matches"][0]
+        self.assertEqual(semifinal["away"]["team_id"], self.teams[3].id)
+
+    def test_existing_later_rounds_are_scheduled_after_new_first_round(self):
+        # Cuartos, semis y final ya existen: octavos se crea con un id mayor
+        for code, name in (("QF", "Cuartos"), ("SF", "Semifinal"), ("F", "Final")):
+            Round.objects.create(phase=self.phase, round_name=name, round_number=code)
+        self.create_bracket(create_teams(create_category("Promo 2015"), 16))
+
+        dates = [date(2025, 9, 6) + timedelta(days=day) for day in range(10)]
+        scheduled, _ = schedule_matches(
+            schedulable_matches(Match.objects.filter(round__phase=self.phase)),
+            dates,
+            [time(10, 0), time(12, 0)],
+            fields=4,
+        )
+        round_dates = {}
+        for match in scheduled:
+            round_dates.setdefault(match.round.round_number, set()).add(match.date)
+        order = ["R16", "QF", "SF", "F"]
+        for previous, current in zip(order, order[1:]):
+            self.assertLess(max(round_dates[previous]), min(round_dates[current]))
@@ -0,0 +1,110 @@
+from collections import Counter
+from datetime import date, timedelta
+from itertools import combinations
+
+from django.test import SimpleTestCase, TestCase
+
+from tournaments.fixtures import create_league_fixture, round_robin_pairings
+
+from .factories import create_category, create_phase, create_teams
+
+
+class RoundRobinPairingsTests(SimpleTestCase):
+    def assert_round_robin(self, team_count):
+        teams = list(range(team_count))
+        matchdays = round_robin_pairings(teams)
+
+        # n - 1 jornadas con número par de equipos, n con impar (uno libre)
+        self.assertEqual(len(matchdays), team_count - 1 + team_count % 2)
+        for matchday in matchdays:
+            playing = [team for pairing in matchday for team in pairing]
+            self.assertEqual(len(playing), len(set(playing)))
+            self.assertEqual(len(matchday), team_count // 2)
+
+        pairs = Counter(frozenset(pairing) for day in matchdays for pairing in day)
+        self.assertEqual(
+            set(pairs), {frozenset(pair) for pair in combinations(teams, 2)}
+        )
+        self.assertEqual(set(pairs.values()), {1})
+
+        home_games = Counter(home for day in matchdays for home, _ in day)
+        away_games = Counter(away for day in matchdays for _, away in day)
+        for team in teams:
+            self.assertLessEqual(abs(home_games[team] - away_games[team]), 1)
+
+    def test_even_team_count(self):
+        for team_count in (2, 4, 6, 10):
+            with self.subTest(team_count=team_count):
+                self.assert_round_robin(team_count)
+
+    def test_odd_team_count_rests_each_team_once(self):
+        for team_count in (3, 5, 7):
+            with self.subTest(team_count=team_count):
+                self.assert_round_robin(team_count)
+                matchdays = round_robin_pairings(list(range(team_count)))
+                resting = Counter(
+                    team
+                    for day in matchdays
+                    for team in set(range(team_count))
+                    - {team for pairing in day for team in pairing}
+                )
+                self.assertEqual(resting, Counter(range(team_count)))
+
+    def test_double_round_robin_inverts_home_and_away(self):
+        teams = list(range(6))
+        first_leg = round_robin_pairings(teams)
+        matchdays = round_robin_pairings(teams, double_round_robin=True)
+
+        self.assertEqual(matchdays[: len(first_leg)], first_leg)
+        self.assertEqual(
+            matchdays[len(first_leg) :],
+            [[(away, home) for home, away in day] for day in first_leg],
+        )
+
+    def test_less_than_two_teams(self):
+        self.assertEqual(round_robin_pairings([]), [])
+        self.assertEqual(round_robin_pairings(["A"]), [])
+
+
+class CreateLeagueFixtureTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = create_category()
+        cls.phase = create_phase(cls.category)
+        cls.teams = create_teams(cls.category, 4)
+
+    def test_creates_one_round_per_matchday(self):
+        start = date(2025, 3, 1)
+        matches = create_league_fixture(self.phase, self.teams, start, days_between=7)
+
+        self.assertEqual(len(matches), 6)
+        rounds = list(self.phase.rounds.order_by("id"))
+        self.assertEqual(
+            [round_obj.round_number for round_obj in rounds], ["1", "2", "3"]
+        )
+        for index, round_obj in enumerate(rounds):
+            dates = {match.date for match in round_obj.matches.all()}
+            self.assertEqual(dates, {start + timedelta(days=7 * index)})
+
+    def test_home_team_is_first_match_team(self):
+        matchdays = round_robin_pairings(self.teams)
+        create_league_fixture(self.phase, self.teams, date(2025, 3, 1))
+
+        created = []
+        for round_obj in self.phase.rounds.order_by("id"):
+            for match in round_obj.matches.order_by("id"):
+                home, away = match.match_teams.order_by("id")
+                created.append((home.team, away.team))
+        self.assertEqual(created, [pairing for day in matchdays for pairing in day])
+
+    def test_reuses_existing_rounds(self):
+        create_league_fixture(self.phase, self.teams, date(2025, 3, 1))
+        create_league_fixture(
+            self.phase,
+            self.teams,
+            date(2025, 6, 1),
+            first_round=self.phase.rounds.order_by("id").first(),
+        )
+        self.assertEqual(self.phase.rounds.count(), 3)
+        for round_obj in self.phase.rounds.all():
+            self.assertEqual(round_obj.matches.count(), 4)
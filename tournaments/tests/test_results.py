@@ -0,0 +1,112 @@
+from django.test import TestCase
+
+from matches.models import MatchTeam
+from tournaments.results import recompute_results, recompute_tournament_results
+
+from .factories import create_category, create_match, create_phase, create_teams
+
+
+class ResultsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = create_category()
+        cls.home, cls.away = create_teams(cls.category, 2)
+
+    def play(self, phase, goals, penalties=(0, 0), status="finished"):
+        """Crea el partido (las señales calculan el resultado al confirmar)"""
+        with self.captureOnCommitCallbacks(execute=True):
+            match = create_match(
+                phase, self.home, self.away, status, goals=goals, penalties=penalties
+            )
+        return self.outcome(match)
+
+    def outcome(self, match):
+        return [
+            (match_team.result, match_team.points)
+            for match_team in MatchTeam.objects.filter(match=match).order_by("id")
+        ]
+
+    def test_league_default_points(self):
+        phase = create_phase(self.category)
+        self.assertEqual(self.play(phase, (2, 1)), [("win", 3), ("loss", 0)])
+        self.assertEqual(self.play(phase, (0, 1)), [("loss", 0), ("win", 3)])
+        # En liga con empate los penales no cuentan
+        self.assertEqual(
+            self.play(phase, (1, 1), penalties=(5, 4)), [("draw", 1), ("draw", 1)]
+        )
+
+    def test_league_custom_points(self):
+        phase = create_phase(self.category, win_points=2, draw_points=0, loss_points=1)
+        self.assertEqual(self.play(phase, (3, 0)), [("win", 2), ("loss", 1)])
+        self.assertEqual(self.play(phase, (0, 0)), [("draw", 0), ("draw", 0)])
+
+    def test_league_draws_decided_by_penalties(self):
+        phase = create_phase(self.category, draw_resolution="penalties")
+        self.assertEqual(
+            self.play(phase, (1, 1), penalties=(4, 5)), [("loss", 1), ("win", 2)]
+        )
+        self.assertEqual(self.play(phase, (2, 0)), [("win", 3), ("loss", 0)])
+        # Penales sin definir: empate
+        self.assertEqual(self.play(phase, (1, 1)), [("draw", 1), ("draw", 1)])
+
+    def test_knockout_penalties_use_win_and_loss_points(self):
+        phase = create_phase(self.category, "knockout")
+        self.assertEqual(
+            self.play(phase, (2, 2), penalties=(3, 2)), [("win", 3), ("loss", 0)]
+        )
+        self.assertEqual(self.play(phase, (0, 1)), [("loss", 0), ("win", 3)])
+
+    def test_unfinished_or_incomplete_matches_have_no_result(self):
+        phase = create_phase(self.category)
+        self.assertEqual(
+            self.play(phase, (2, 1), status="live"), [(None, 0), (None, 0)]
+        )
+        self.assertEqual(self.play(phase, (None, 1)), [(None, 0), (None, 0)])
+
+    def test_reopened_match_is_cleared(self):
+        phase = create_phase(self.category)
+        self.play(phase, (2, 1))
+        match = phase.rounds.get().matches.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            match.status = "live"
+            match.save()
+        self.assertEqual(self.outcome(match), [(None, 0), (None, 0)])
+
+    def test_goal_correction_recomputes_result(self):
+        phase = create_phase(self.category)
+        self.play(phase, (2, 1))
+        match = phase.rounds.get().matches.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            away = match.match_teams.order_by("id").last()
+            away.goals = 4
+            away.save()
+        self.assertEqual(self.outcome(match), [("loss", 0), ("win", 3)])
+
+    def test_changed_rules_apply_on_recompute(self):
+        phase = create_phase(self.category)
+        self.play(phase, (2, 1))
+        match = phase.rounds.get().matches.get()
+
+        phase.win_points = 2
+        phase.save()
+        recompute_tournament_results(self.category.tournament)
+        self.assertEqual(self.outcome(match), [("win", 2), ("loss", 0)])
+
+    def test_phases_with_different_rules_in_one_recompute(self):
+        league = create_phase(self.category)
+        knockout = create_phase(self.category, "knockout")
+        self.play(league, (1, 1), penalties=(4, 3))
+        self.play(knockout, (1, 1), penalties=(4, 3))
+        MatchTeam.objects.update(result=None, points=0)
+
+        self.assertEqual(recompute_results([league, knockout]), 4)
+        self.assertEqual(
+            self.outcome(league.rounds.get().matches.get()),
+            [("draw", 1), ("draw", 1)],
+        )
+        self.assertEqual(
+            self.outcome(knockout.rounds.get().matches.get()),
+            [("win", 3), ("loss", 0)],
+        )
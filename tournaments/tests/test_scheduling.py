@@ -0,0 +1,115 @@
+from collections import Counter
+from datetime import date, time, timedelta
+
+from django.test import TestCase
+
+from matches.models import Match
+from tournaments.fixtures import create_league_fixture
+from tournaments.scheduling import schedulable_matches, schedule_matches
+
+from .factories import create_category, create_phase, create_teams
+
+DATES = [date(2025, 3, 1) + timedelta(days=day) for day in range(30)]
+TIME_SLOTS = [time(10, 0), time(12, 0), time(14, 0)]
+
+
+class ScheduleMatchesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.categories = [create_category("Promo 2010"), create_category("Promo 2015")]
+        for category in cls.categories:
+            phase = create_phase(category)
+            create_league_fixture(phase, create_teams(category, 6), DATES[0])
+
+    def matches(self, category=None):
+        queryset = Match.objects.all()
+        if category is not None:
+            queryset = queryset.filter(round__phase__tournament_category=category)
+        return list(schedulable_matches(queryset))
+
+    def team_dates(self, matches):
+        dates = {}
+        for match in matches:
+            for match_team in match.match_teams.all():
+                dates.setdefault(match_team.team_id, []).append(match.date)
+        return dates
+
+    def test_schedules_every_match(self):
+        scheduled, unscheduled = schedule_matches(
+            self.matches(), DATES, TIME_SLOTS, fields=2
+        )
+        self.assertEqual(len(scheduled), 30)
+        self.assertEqual(unscheduled, [])
+
+    def test_minimum_rest_between_matches_of_a_team(self):
+        for min_rest_days in (1, 3):
+            with self.subTest(min_rest_days=min_rest_days):
+                scheduled, _ = schedule_matches(
+                    self.matches(),
+                    DATES,
+                    TIME_SLOTS,
+                    fields=2,
+                    min_rest_days=min_rest_days,
+                )
+                for dates in self.team_dates(scheduled).values():
+                    dates.sort()
+                    for previous, current in zip(dates, dates[1:]):
+                        self.assertGreaterEqual(
+                            (current - previous).days, min_rest_days
+                        )
+
+    def test_fields_and_time_slots_are_not_shared(self):
+        scheduled, _ = schedule_matches(
+            self.matches(), DATES, TIME_SLOTS, fields=2, min_rest_days=0
+        )
+        slots = Counter((match.date, match.time, match.field) for match in scheduled)
+        self.assertEqual(set(slots.values()), {1})
+        self.assertTrue({match.field for match in scheduled} <= {1, 2})
+
+        # Sin descanso un equipo puede jugar dos veces el mismo día, pero
+        # nunca en el mismo horario
+        team_slots = Counter(
+            (match_team.team_id, match.date, match.time)
+            for match in scheduled
+            for match_team in match.match_teams.all()
+        )
+        self.assertEqual(set(team_slots.values()), {1})
+
+    def test_separate_categories_per_field(self):
+        scheduled, _ = schedule_matches(
+            self.matches(), DATES, TIME_SLOTS, fields=2, separate_categories=True
+        )
+        field_categories = {}
+        for match in scheduled:
+            field_categories.setdefault((match.date, match.field), set()).add(
+                match.round.phase.tournament_category_id
+            )
+        for categories in field_categories.values():
+            self.assertEqual(len(categories), 1)
+
+    def test_matchdays_are_played_in_order(self):
+        category = self.categories[0]
+        scheduled, _ = schedule_matches(
+            self.matches(category), DATES, TIME_SLOTS, fields=3
+        )
+        by_round = {}
+        for match in scheduled:
+            by_round.setdefault(match.round_id, []).append(match.date)
+        rounds = sorted(by_round)
+        for previous, current in zip(rounds, rounds[1:]):
+            self.assertLess(max(by_round[previous]), min(by_round[current]))
+
+    def test_reports_matches_without_a_free_slot(self):
+        category = self.categories[0]
+        scheduled, unscheduled = schedule_matches(
+            self.matches(category), DATES[:2], TIME_SLOTS, fields=1
+        )
+        self.assertEqual(len(scheduled) + len(unscheduled), 15)
+        self.assertEqual(len(scheduled), 6)
+
+    def test_no_dates_or_fields(self):
+        matches = self.matches()
+        self.assertEqual(schedule_matches(matches, [], TIME_SLOTS), ([], matches))
+        self.assertEqual(
+            schedule_matches(matches, DATES, TIME_SLOTS, fields=0), ([], matches)
+        )